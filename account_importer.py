@@ -0,0 +1,190 @@
+"""
+Bulk account importer
+Reads accounts from CSV or JSON, removes duplicates and validates Riot IDs
+concurrently through ACCOUNT-V1
+"""
+import csv
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote
+import requests
+from rate_limiter import RateLimiter
+
+# Accepted column / key names for each field
+FIELD_ALIASES = {
+    'username': ['username', 'user', 'login', 'session', 'session_id'],
+    'display_name': ['display_name', 'displayname', 'display name', 'name'],
+    'riot_id': ['riot_id', 'riotid', 'riot id'],
+    'region': ['region', 'server'],
+    'password': ['password', 'pass'],
+}
+
+ROUTING_MAP = {
+    'br1': 'americas', 'eun1': 'europe', 'euw1': 'europe',
+    'jp1': 'asia', 'kr': 'asia', 'la1': 'americas', 'la2': 'americas',
+    'na1': 'americas', 'oc1': 'sea', 'ph2': 'sea', 'ru': 'europe',
+    'sg2': 'sea', 'th2': 'sea', 'tr1': 'europe', 'tw2': 'sea', 'vn2': 'sea'
+}
+
+
+class AccountImporter:
+    def __init__(self, api_key=None, rate_limiter=None, max_workers=8):
+        self.api_key = api_key
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_workers = max_workers
+
+    def parse_file(self, file_path):
+        """
+        Parse accounts from a CSV or JSON file
+
+        Returns:
+            tuple: (rows, error)
+        """
+        try:
+            if os.path.splitext(file_path)[1].lower() == '.json':
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    data = data.get('accounts', [])
+                raw_rows = [row for row in data if isinstance(row, dict)]
+            else:
+                with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+                    raw_rows = list(csv.DictReader(f))
+
+            rows = [self.normalize_row(row) for row in raw_rows]
+            return [row for row in rows if row['username']], None
+
+        except Exception as e:
+            return [], f"Could not read {os.path.basename(file_path)}: {str(e)}"
+
+    def normalize_row(self, raw_row):
+        """Map a raw CSV/JSON row onto account fields"""
+        lowered = {str(key).strip().lower(): value for key, value in raw_row.items() if key is not None}
+        row = {}
+        for field, aliases in FIELD_ALIASES.items():
+            value = next((lowered[alias] for alias in aliases if lowered.get(alias)), '')
+            row[field] = str(value).strip()
+        row['region'] = row['region'].lower()
+        return row
+
+    def dedup(self, rows, existing_accounts):
+        """
+        Drop rows whose username or Riot ID already exists (or repeats within the file)
+
+        Returns:
+            tuple: (unique_rows, skipped) where skipped is a list of (row, reason)
+        """
+        usernames = {acc.get('username', '').lower() for acc in existing_accounts}
+        riot_ids = {acc.get('riot_id', '').lower() for acc in existing_accounts if acc.get('riot_id')}
+
+        unique_rows = []
+        skipped = []
+        for row in rows:
+            username = row['username'].lower()
+            riot_id = row['riot_id'].lower()
+            if username in usernames:
+                skipped.append((row, "Duplicate username"))
+            elif riot_id and riot_id in riot_ids:
+                skipped.append((row, "Duplicate Riot ID"))
+            else:
+                usernames.add(username)
+                if riot_id:
+                    riot_ids.add(riot_id)
+                unique_rows.append(row)
+
+        return unique_rows, skipped
+
+    def validate_riot_ids(self, rows, default_region='euw1', progress_callback=None, cancel_event=None):
+        """
+        Resolve every row's Riot ID concurrently within the rate limit
+
+        Rows without a Riot ID are valid as-is. Valid Riot IDs are rewritten
+        with Riot's canonical capitalization.
+
+        Args:
+            progress_callback: Optional callback(done, total, row)
+            cancel_event: Optional threading.Event; once set, lookups not yet
+                started are dropped and the rows validated so far are returned
+
+        Returns:
+            tuple: (valid_rows, invalid) where invalid is a list of (row, reason)
+        """
+        valid_rows = []
+        invalid = []
+        total = len(rows)
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.resolve_riot_id, row, default_region, cancel_event): row
+                       for row in rows}
+            for future in as_completed(futures):
+                if cancel_event is not None and cancel_event.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                row = futures[future]
+                error = future.result()
+                if error:
+                    invalid.append((row, error))
+                else:
+                    valid_rows.append(row)
+
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total, row)
+
+        # Keep the file's order
+        order = {id(row): idx for idx, row in enumerate(rows)}
+        valid_rows.sort(key=lambda row: order[id(row)])
+        return valid_rows, invalid
+
+    def resolve_riot_id(self, row, default_region='euw1', cancel_event=None):
+        """Look up a row's Riot ID; returns an error message or None"""
+        riot_id = row['riot_id']
+        if not riot_id:
+            return None
+        if '#' not in riot_id:
+            return "Invalid Riot ID format"
+        if not self.api_key:
+            return "No API key configured"
+
+        region = row['region'] or default_region
+        if region not in ROUTING_MAP:
+            return f"Unknown region '{region}'"
+        row['region'] = region
+
+        game_name, tag_line = riot_id.split('#', 1)
+        url = (f"https://{ROUTING_MAP[region]}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/"
+               f"{quote(game_name)}/{quote(tag_line)}")
+
+        for attempt in range(3):
+            if cancel_event is not None and cancel_event.is_set():
+                return "Cancelled"
+            try:
+                self.rate_limiter.acquire()
+                response = requests.get(url, headers={'X-Riot-Token': self.api_key}, timeout=10)
+            except Exception as e:
+                return f"Request failed: {str(e)}"
+
+            # Production keys have higher limits than the development defaults
+            if response.headers.get('X-App-Rate-Limit'):
+                self.rate_limiter.update_limits(response.headers['X-App-Rate-Limit'])
+
+            if response.status_code == 200:
+                data = response.json()
+                if data.get('gameName') and data.get('tagLine'):
+                    row['riot_id'] = f"{data['gameName']}#{data['tagLine']}"
+                return None
+            if response.status_code == 404:
+                return "Riot ID not found"
+            if response.status_code == 429:
+                self.rate_limiter.penalize(float(response.headers.get('Retry-After', 1)))
+                continue
+            if response.status_code >= 500:
+                time.sleep(1 + attempt)
+                continue
+            return f"Lookup failed: {response.status_code}"
+
+        return "Rate limited, try again later"
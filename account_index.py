@@ -0,0 +1,218 @@
+"""
+Account search index
+Keeps the accounts' searchable text, facets (tier, region, level) and sort
+keys indexed so the accounts tab can filter and sort on every keystroke
+without re-parsing accounts. The index is updated incrementally as accounts
+are added, edited and deleted.
+"""
+import bisect
+import re
+from itertools import islice
+
+# Summoner level buckets for the level facet: (label, lowest level)
+LEVEL_BUCKETS = [("500+", 500), ("200-499", 200), ("100-199", 100), ("30-99", 30), ("1-29", 1)]
+UNKNOWN_LEVEL = "Unknown"
+LEVEL_LABELS = [label for label, _ in LEVEL_BUCKETS] + [UNKNOWN_LEVEL]
+UNRANKED = "UNRANKED"
+TIER_ORDER = ["CHALLENGER", "GRANDMASTER", "MASTER", "DIAMOND", "EMERALD", "PLATINUM",
+              "GOLD", "SILVER", "BRONZE", "IRON", UNRANKED]
+
+# Rank score parts: tier and division values, LP capped to its slot
+TIER_VALUES = {tier: len(TIER_ORDER) - 2 - i for i, tier in enumerate(TIER_ORDER)}  # CHALLENGER 9 .. IRON 0, UNRANKED -1
+DIVISION_VALUES = {'I': 4, 'II': 3, 'III': 2, 'IV': 1}
+LP_SLOT = 10000
+
+SORT_MODES = ("original", "level", "rank")
+
+SEARCH_FIELDS = ("display_name", "username", "riot_id")
+TOKEN_SPLIT = re.compile(r"[\s#_\-.]+")
+
+
+def get_tier(account):
+    """Tier part of an account's rank ("GOLD II" -> "GOLD"), UNRANKED if none"""
+    rank = account.get("rank") or ""
+    tier = rank.split()[0].upper() if rank.split() else ""
+    return tier if tier and tier != UNRANKED else UNRANKED
+
+
+def get_level_bucket(level):
+    """Level facet label for a summoner level"""
+    if level is None:
+        return UNKNOWN_LEVEL
+    for label, lowest in LEVEL_BUCKETS:
+        if level >= lowest:
+            return label
+    return UNKNOWN_LEVEL
+
+
+def get_rank_score(account):
+    """
+    Rank packed into one comparable integer: tier, then division, then LP
+    (e.g. GOLD II 50 LP beats GOLD III 90 LP); unranked accounts score lowest
+    """
+    parts = (account.get("rank") or "").upper().split()  # Same normalization as get_tier
+    if not parts or parts[0] == UNRANKED:
+        return 0
+
+    tier_value = TIER_VALUES.get(parts[0], -1)
+    division_value = DIVISION_VALUES.get(parts[1] if len(parts) > 1 else 'I', 0)
+
+    lp = 0
+    ranked_stats = account.get("ranked_stats")
+    if ranked_stats and isinstance(ranked_stats, dict):
+        lp = ranked_stats.get("lp") or 0
+    return ((tier_value + 1) * 5 + division_value) * LP_SLOT + min(max(lp, 0), LP_SLOT - 1)
+
+
+def get_sort_keys(account):
+    """Key per sort mode (see SORT_MODES); each ends with the account ID so ties keep the original order"""
+    account_id = account["id"]
+    level = account.get("summoner_level")
+    return {
+        "original": (account_id,),
+        "level": (level is None, -(level or 0), account_id),  # High to low, unknown last
+        "rank": (-get_rank_score(account), account_id),  # High to low
+    }
+
+
+def is_subsequence(term, text):
+    """True if term's characters appear in text in order (fuzzy match)"""
+    position = 0
+    for char in term:
+        position = text.find(char, position) + 1
+        if not position:
+            return False
+    return True
+
+
+class AccountIndex:
+    def __init__(self, accounts=()):
+        self.tokens = []  # Sorted (token, account ID) pairs for prefix lookups
+        self.entries = {}  # account ID -> (tokens, search text, facet values, sort keys)
+        self.facets = {"tier": {}, "region": {}, "level": {}}  # facet -> value -> set of account IDs
+        self.orders = {mode: [] for mode in SORT_MODES}  # Sort keys kept sorted, one list per mode
+        self.rebuild(accounts)
+
+    def rebuild(self, accounts):
+        """Index a whole account list from scratch"""
+        self.tokens = []
+        self.entries = {}
+        for values in self.facets.values():
+            values.clear()
+        for order in self.orders.values():
+            order.clear()
+        for account in accounts:
+            self.add(account)
+
+    def add(self, account):
+        """Index an account (replaces its previous entry)"""
+        account_id = account["id"]
+        if account_id in self.entries:
+            self.remove(account_id)
+
+        fields = [str(account.get(field) or "").lower() for field in SEARCH_FIELDS]
+        tokens = set()
+        for field in fields:
+            if field:
+                tokens.add(field)
+                tokens.update(token for token in TOKEN_SPLIT.split(field) if token)
+        for token in tokens:
+            bisect.insort(self.tokens, (token, account_id))
+
+        facet_values = {
+            "tier": get_tier(account),
+            "region": (account.get("region") or "").lower(),
+            "level": get_level_bucket(account.get("summoner_level")),
+        }
+        for facet, value in facet_values.items():
+            self.facets[facet].setdefault(value, set()).add(account_id)
+
+        sort_keys = get_sort_keys(account)
+        for mode, key in sort_keys.items():
+            bisect.insort(self.orders[mode], key)
+
+        self.entries[account_id] = (tokens, "\n".join(fields), facet_values, sort_keys)
+
+    def update(self, account):
+        """Re-index an edited account"""
+        self.add(account)
+
+    def remove(self, account_id):
+        """Drop an account from the index"""
+        entry = self.entries.pop(account_id, None)
+        if entry is None:
+            return
+        tokens, _, facet_values, sort_keys = entry
+        for token in tokens:
+            position = bisect.bisect_left(self.tokens, (token, account_id))
+            if position < len(self.tokens) and self.tokens[position] == (token, account_id):
+                del self.tokens[position]
+        for facet, value in facet_values.items():
+            ids = self.facets[facet].get(value)
+            if ids is not None:
+                ids.discard(account_id)
+                if not ids:
+                    del self.facets[facet][value]
+        for mode, key in sort_keys.items():
+            order = self.orders[mode]
+            position = bisect.bisect_left(order, key)
+            if position < len(order) and order[position] == key:
+                del order[position]
+
+    def match_prefix(self, term):
+        """IDs of accounts with a word (or whole field) starting with term"""
+        start = bisect.bisect_left(self.tokens, (term,))
+        ids = set()
+        for token, account_id in islice(self.tokens, start, None):
+            if not token.startswith(term):
+                break
+            ids.add(account_id)
+        return ids
+
+    def match_term(self, term, candidates):
+        """IDs among candidates matching term by prefix, or else by fuzzy subsequence"""
+        ids = self.match_prefix(term) & candidates
+        if len(term) > 1:
+            ids.update(account_id for account_id in candidates - ids
+                       if is_subsequence(term, self.entries[account_id][1]))
+        return ids
+
+    def search(self, query="", tier=None, region=None, level=None, default_region=None):
+        """
+        Get the IDs of accounts matching a query and facet filters
+
+        Args:
+            query: Space-separated terms; each must match display name, username
+                or Riot ID by prefix or fuzzily (e.g. "fkr" finds "Faker")
+            tier: Tier facet value (e.g. "GOLD", "UNRANKED") or None for any
+            region: Region facet value or None for any
+            level: Level bucket label (see LEVEL_BUCKETS) or None for any
+            default_region: Region of accounts without one of their own
+
+        Returns:
+            set: Matching account IDs
+        """
+        ids = set(self.entries)
+        if tier:
+            ids &= self.facets["tier"].get(tier, set())
+        if region:
+            region_ids = set(self.facets["region"].get(region, set()))
+            if region == default_region:
+                region_ids |= self.facets["region"].get("", set())
+            ids &= region_ids
+        if level:
+            ids &= self.facets["level"].get(level, set())
+
+        for term in query.lower().split():
+            if not ids:
+                break
+            ids = self.match_term(term, ids)
+        return ids
+
+    def sorted_ids(self, mode):
+        """Account IDs in a sort mode's order (see SORT_MODES)"""
+        return [key[-1] for key in self.orders[mode]]
+
+    def facet_values(self, facet):
+        """Values of a facet that at least one account has"""
+        return sorted(self.facets[facet])
@@ -2,11 +2,13 @@ import json
 import os
 from pathlib import Path
 from datetime import datetime
+from account_index import AccountIndex
 
 class AccountManager:
     def __init__(self, data_file="accounts.json"):
         self.data_file = data_file
         self.accounts = []
+        self.index = AccountIndex()  # Search index, kept in step with every change below
         self.load_accounts()
     
     def load_accounts(self):
@@ -20,6 +22,7 @@ class AccountManager:
                 self.accounts = []
         else:
             self.accounts = []
+        self.index.rebuild(self.accounts)
     
     def save_accounts(self):
         """Save accounts to JSON file"""
@@ -31,10 +34,14 @@ class AccountManager:
             print(f"Error saving accounts: {e}")
             return False
     
-    def add_account(self, username, display_name="", riot_id="", password=""):
-        """Add a new account"""
+    def _next_id(self):
+        """Get an unused account ID (IDs stay unique after deletes)"""
+        return max((acc["id"] for acc in self.accounts), default=-1) + 1
+    
+    def _new_account(self, username, display_name="", riot_id="", password="", region=None):
+        """Build a new account dict"""
         account = {
-            "id": len(self.accounts),
+            "id": self._next_id(),
             "username": username,
             "display_name": display_name or username,
             "rank": "Unranked",
@@ -45,15 +52,55 @@ class AccountManager:
             "ranked_stats": None,
             "created_at": datetime.now().isoformat()
         }
+        if region:
+            account["region"] = region
+        return account
+    
+    def add_account(self, username, display_name="", riot_id="", password="", region=None):
+        """Add a new account"""
+        account = self._new_account(username, display_name, riot_id, password, region)
         self.accounts.append(account)
+        self.index.add(account)
         self.save_accounts()
         return account
     
+    def add_accounts(self, rows):
+        """
+        Add many accounts with a single save
+        
+        Args:
+            rows: List of dicts with username and optional display_name, riot_id, password, region
+        
+        Returns:
+            list: The added accounts, or [] if saving failed (nothing is added then)
+        """
+        added = []
+        for row in rows:
+            account = self._new_account(
+                row["username"],
+                row.get("display_name", ""),
+                row.get("riot_id", ""),
+                row.get("password", ""),
+                row.get("region")
+            )
+            self.accounts.append(account)
+            added.append(account)
+        
+        if not self.save_accounts():
+            # Roll back so memory matches what's on disk
+            added_ids = {acc["id"] for acc in added}
+            self.accounts = [acc for acc in self.accounts if acc["id"] not in added_ids]
+            return []
+        for account in added:
+            self.index.add(account)
+        return added
+    
     def update_account(self, account_id, **kwargs):
         """Update an existing account"""
         for account in self.accounts:
             if account["id"] == account_id:
                 account.update(kwargs)
+                self.index.update(account)
                 self.save_accounts()
                 return True
         return False
@@ -61,6 +108,7 @@ class AccountManager:
     def delete_account(self, account_id):
         """Delete an account"""
         self.accounts = [acc for acc in self.accounts if acc["id"] != account_id]
+        self.index.remove(account_id)
         self.save_accounts()
     
     def get_account(self, account_id):
@@ -73,3 +121,7 @@ class AccountManager:
     def get_all_accounts(self):
         """Get all accounts"""
         return self.accounts
+    
+    def search_accounts(self, query="", **facets):
+        """Get the IDs of accounts matching a search query and facet filters (see AccountIndex.search)"""
+        return self.index.search(query, **facets)
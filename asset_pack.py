@@ -0,0 +1,348 @@
+"""
+Asset packs
+Single-file, append-only archives of small assets that are memory-mapped and
+read in place. The build bundles a read-only pack; icons downloaded at runtime
+are appended to a writable sidecar pack next to the other runtime data.
+
+Pack layout: MAGIC, then records of
+    <u16 name length><u32 data length><name (utf-8)><data>
+A data length of TOMBSTONE marks a removed entry. Later records win, so
+entries can be replaced by appending.
+"""
+import hashlib
+import io
+import mmap
+import os
+import struct
+import sys
+import threading
+from PIL import Image
+
+MAGIC = b"RAMPACK1"
+RECORD = struct.Struct("<HI")
+TOMBSTONE = 0xFFFFFFFF
+
+# Runtime data under assets/ that never goes into the bundled pack
+BUILD_EXCLUDE = ['ddragon', 'thumbnails']
+BUILD_EXTENSIONS = ('.png',)
+
+
+class AssetPack:
+    def __init__(self, path, writable=False):
+        self.path = path
+        self.writable = writable
+        self.index = {}  # name -> (offset, length)
+        self.digests = {}  # name -> content hash, computed on first use
+        self.dead_bytes = 0  # Bytes taken up by replaced or removed records
+        self.end = len(MAGIC)
+        self.file = None
+        self.map = None
+        self.lock = threading.RLock()
+        self._open()
+
+    def _open(self):
+        """Open (or create, if writable) the pack and index its records"""
+        if not os.path.exists(self.path):
+            if not self.writable:
+                return
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'wb') as f:
+                f.write(MAGIC)
+
+        self.file = open(self.path, 'r+b' if self.writable else 'rb')
+        self._remap()
+        if self.map is None or self.map[:len(MAGIC)] != MAGIC:
+            print(f"Ignoring invalid asset pack {self.path}")
+            self.close()
+            return
+
+        self._scan()
+        if self.writable and self.end < len(self.map):
+            # Drop a record left half-written by a crash
+            self.map.close()
+            self.map = None
+            self.file.truncate(self.end)
+            self._remap()
+
+    def _remap(self):
+        """Map the whole file read-only"""
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if os.fstat(self.file.fileno()).st_size:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _scan(self):
+        """Build the name index from the record headers"""
+        size = len(self.map)
+        pos = len(MAGIC)
+        while pos + RECORD.size <= size:
+            name_length, data_length = RECORD.unpack_from(self.map, pos)
+            data_start = pos + RECORD.size + name_length
+            length = 0 if data_length == TOMBSTONE else data_length
+            if data_start + length > size:
+                break
+
+            name = self.map[pos + RECORD.size:data_start].decode('utf-8')
+            previous = self.index.pop(name, None)
+            if previous:
+                self.dead_bytes += previous[1]
+            if data_length != TOMBSTONE:
+                self.index[name] = (data_start, data_length)
+
+            pos = data_start + length
+        self.end = pos
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def names(self):
+        return list(self.index)
+
+    def get_digest(self, name):
+        """
+        Content hash of an entry, or None
+
+        Unlike the entry's offset, which compaction can hand to a different
+        entry, it only changes when the content does.
+        """
+        with self.lock:
+            if name not in self.digests:
+                data = self.read(name)
+                if data is None:
+                    return None
+                self.digests[name] = content_digest(data)
+            return self.digests[name]
+
+    def read(self, name):
+        """Read an entry's bytes, or None"""
+        with self.lock:
+            entry = self.index.get(name)
+            if entry is None or self.map is None:
+                return None
+            offset, length = entry
+            return self.map[offset:offset + length]
+
+    def _append(self, name, data_length, data=b""):
+        encoded = name.encode('utf-8')
+        self.file.seek(self.end)
+        self.file.write(RECORD.pack(len(encoded), data_length) + encoded + data)
+        self.file.flush()
+        data_start = self.end + RECORD.size + len(encoded)
+        self.end = data_start + len(data)
+        self._remap()
+        return data_start
+
+    def add(self, name, data):
+        """Append an entry, replacing any earlier one with the same name"""
+        if not self.writable:
+            raise IOError(f"Asset pack {self.path} is read-only")
+        with self.lock:
+            previous = self.index.get(name)
+            if previous:
+                self.dead_bytes += previous[1]
+            self.index[name] = (self._append(name, len(data), bytes(data)), len(data))
+            self.digests.pop(name, None)
+
+    def remove(self, name):
+        """Append a tombstone for an entry"""
+        if not self.writable:
+            raise IOError(f"Asset pack {self.path} is read-only")
+        with self.lock:
+            previous = self.index.pop(name, None)
+            self.digests.pop(name, None)
+            if previous:
+                self.dead_bytes += previous[1]
+                self._append(name, TOMBSTONE)
+
+    def compact(self):
+        """Rewrite the pack without replaced or removed records"""
+        if not self.writable or self.file is None:
+            return
+        with self.lock:
+            temp_path = self.path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(MAGIC)
+                for name, (offset, length) in self.index.items():
+                    encoded = name.encode('utf-8')
+                    f.write(RECORD.pack(len(encoded), length) + encoded + self.map[offset:offset + length])
+
+            self.close()
+            os.replace(temp_path, self.path)
+            self.index = {}
+            self.dead_bytes = 0
+            self.end = len(MAGIC)
+            self._open()
+
+    def close(self):
+        with self.lock:
+            if self.map is not None:
+                self.map.close()
+                self.map = None
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+def content_digest(data):
+    """Short hash of an asset's bytes, used as its version token"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def build_pack(source_dir, pack_path, exclude=None, extensions=BUILD_EXTENSIONS):
+    """
+    Pack every matching file under source_dir (names relative to it)
+
+    Returns:
+        int: Number of files packed
+    """
+    exclude = set(BUILD_EXCLUDE if exclude is None else exclude)
+    if os.path.exists(pack_path):
+        os.remove(pack_path)
+    pack = AssetPack(pack_path, writable=True)
+
+    count = 0
+    for dirpath, dirnames, filenames in os.walk(source_dir):
+        dirnames[:] = sorted(d for d in dirnames
+                             if os.path.relpath(os.path.join(dirpath, d), source_dir).replace(os.sep, '/') not in exclude)
+        for filename in sorted(filenames):
+            if not filename.lower().endswith(extensions):
+                continue
+            path = os.path.join(dirpath, filename)
+            with open(path, 'rb') as f:
+                pack.add(os.path.relpath(path, source_dir).replace(os.sep, '/'), f.read())
+            count += 1
+
+    pack.close()
+    return count
+
+
+def get_bundled_pack_path():
+    """Location of the pack shipped with the app (next to the code, or in the PyInstaller bundle)"""
+    base_dir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "assets.pack")
+
+
+class AssetStore:
+    """
+    One interface for reading assets
+
+    Lookup order: the sidecar pack (runtime downloads), the bundled pack,
+    then loose files under assets/. References can be asset names
+    ("champion/62.png") or paths under an assets directory.
+    """
+    def __init__(self, assets_dir="assets", bundled_pack_path=None, sidecar_pack_path=None):
+        self.assets_dir = assets_dir
+        self.roots = [os.path.normcase(os.path.abspath(assets_dir)),
+                      os.path.normcase(os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets"))]
+        self.bundled = AssetPack(bundled_pack_path or get_bundled_pack_path())
+        self.sidecar = AssetPack(sidecar_pack_path or os.path.join(assets_dir, "downloads.pack"), writable=True)
+        self.file_digests = {}  # loose file path -> (mtime_ns, size, content hash)
+
+        # Reclaim space from replaced icons (e.g. after several patches)
+        if self.sidecar.dead_bytes > max(self.sidecar.end // 2, 1_000_000):
+            self.sidecar.compact()
+
+    def name_for(self, ref):
+        """Asset name for a reference"""
+        path = os.path.normcase(os.path.abspath(str(ref)))
+        for root in self.roots:
+            if path.startswith(root + os.sep):
+                return path[len(root) + 1:].replace(os.sep, '/')
+        return str(ref).replace('\\', '/')
+
+    def get_file_path(self, ref):
+        """Loose file path for a reference"""
+        return os.path.join(self.assets_dir, *self.name_for(ref).split('/'))
+
+    def exists(self, ref):
+        name = self.name_for(ref)
+        return name in self.sidecar or name in self.bundled or os.path.exists(self.get_file_path(name))
+
+    def get_version(self, ref):
+        """
+        Token that changes whenever the asset's content changes (a content
+        hash, so it stays valid across pack compaction)
+
+        Returns:
+            str or None if the asset doesn't exist
+        """
+        name = self.name_for(ref)
+        for pack in (self.sidecar, self.bundled):
+            digest = pack.get_digest(name)
+            if digest is not None:
+                return digest
+        # Loose files are only re-hashed when their mtime or size changes
+        path = self.get_file_path(name)
+        try:
+            stat = os.stat(path)
+            cached = self.file_digests.get(path)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return cached[2]
+            with open(path, 'rb') as f:
+                digest = content_digest(f.read())
+        except OSError:
+            return None
+        self.file_digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def read(self, ref):
+        """Read an asset's bytes, or None"""
+        name = self.name_for(ref)
+        for pack in (self.sidecar, self.bundled):
+            data = pack.read(name)
+            if data is not None:
+                return data
+        try:
+            with open(self.get_file_path(name), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def open_image(self, ref):
+        """Decode an asset as a PIL image, or None"""
+        data = self.read(ref)
+        if data is None:
+            return None
+        try:
+            img = Image.open(io.BytesIO(data))
+            img.load()
+            return img
+        except Exception as e:
+            print(f"Error decoding asset {self.name_for(ref)}: {e}")
+            return None
+
+    def add(self, ref, data):
+        """Store a downloaded asset in the sidecar pack"""
+        self.sidecar.add(self.name_for(ref), data)
+
+    def remove(self, ref):
+        """Remove a downloaded asset (bundled assets are read-only)"""
+        name = self.name_for(ref)
+        self.sidecar.remove(name)
+        try:
+            os.remove(self.get_file_path(name))
+        except OSError:
+            pass
+
+
+_asset_store = None
+_asset_store_lock = threading.Lock()
+
+
+def get_asset_store():
+    """Get the shared AssetStore instance"""
+    global _asset_store
+    with _asset_store_lock:
+        if _asset_store is None:
+            _asset_store = AssetStore()
+        return _asset_store
+
+
+if __name__ == "__main__":
+    # Build a pack next to the code for running from source: python asset_pack.py
+    count = build_pack("assets", get_bundled_pack_path())
+    print(f"Packed {count} assets into {get_bundled_pack_path()}")
@@ -0,0 +1,305 @@
+"""
+Data Dragon asset sync
+Builds a per-patch manifest of icon files, diffs it against the local cache
+and downloads only missing or changed files in parallel
+"""
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from ddragon import DDRAGON_URL, get_data_dragon
+from sprite_sheets import get_sprite_sheets, get_icon_cache_path
+from config import get_icon_source
+from asset_pack import get_asset_store
+
+# Icon kind -> (data file, local directory, CDN image directory)
+ASSET_KINDS = {
+    'champion': ('champion.json', 'champion', 'champion'),
+    'item': ('item.json', 'items', 'item'),
+    'spell': ('summoner.json', 'spell', 'spell'),
+    'profile': ('profileicon.json', 'profile', 'profileicon'),
+}
+
+# Profile icons number in the thousands and are fetched on demand instead
+PRESYNC_KINDS = ['champion', 'item', 'spell']
+
+
+def version_key(version):
+    """Sortable key for a patch version like "14.23.1" (non-numeric names sort first)"""
+    try:
+        return tuple(int(part) for part in version.split('.'))
+    except ValueError:
+        return ()
+
+
+class AssetSync:
+    def __init__(self, assets_dir="assets", data_dragon=None, max_workers=8):
+        self.assets_dir = assets_dir
+        self.data_dragon = data_dragon or get_data_dragon()
+        self.max_workers = max_workers
+        self.state_file = os.path.join(assets_dir, "asset_state.json")
+        self.state = self.load_state()  # relative path -> {'version', 'etag'}
+        self.store = get_asset_store()
+        self.lock = threading.Lock()
+        self.syncing = False
+
+    def load_state(self):
+        """Load what the local cache holds and which patch each file came from"""
+        try:
+            with open(self.state_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_state(self):
+        """Save the local cache state"""
+        try:
+            os.makedirs(self.assets_dir, exist_ok=True)
+            temp_file = self.state_file + ".tmp"
+            with self.lock:
+                data = json.dumps(self.state)
+            with open(temp_file, 'w') as f:
+                f.write(data)
+            os.replace(temp_file, self.state_file)
+        except OSError as e:
+            print(f"Error saving asset state: {e}")
+
+    def build_manifest(self, version, kinds=None):
+        """
+        Build (or load) the manifest for a patch
+
+        Returns:
+            tuple: (entries, built) where entries maps relative path -> {'url', 'image'}
+                (image is the sprite metadata) and built lists the kinds whose
+                data file was available, so their entries are complete
+        """
+        kinds = kinds or list(ASSET_KINDS)
+        manifest_path = os.path.join(self.data_dragon.get_patch_dir(version), "manifest.json")
+        try:
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+
+        changed = False
+        for kind in kinds:
+            if manifest.get(kind):
+                continue
+
+            data_file, local_dir, cdn_dir = ASSET_KINDS[kind]
+            data = self.data_dragon.get_data_file(data_file, version)
+            if not data:
+                continue
+
+            files = {}
+            for entry_key, entry in data.get('data', {}).items():
+                image = entry.get('image')
+                # Items and profile icons are keyed by id; champions and spells carry a numeric 'key'
+                icon_id = entry_key if kind in ('item', 'profile') else entry.get('key')
+                if not image or not icon_id:
+                    continue
+                files[f"{local_dir}/{icon_id}.png"] = {
+                    'url': f"{DDRAGON_URL}/cdn/{version}/img/{cdn_dir}/{image['full']}",
+                    'image': image
+                }
+
+            manifest[kind] = files
+            changed = True
+
+        if changed:
+            os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+            with open(manifest_path, 'w') as f:
+                json.dump(manifest, f)
+
+        entries = {}
+        built = []
+        for kind in kinds:
+            if manifest.get(kind):
+                entries.update(manifest[kind])
+                built.append(kind)
+        return entries, built
+
+    def get_local_path(self, path, use_sprites):
+        """Where a manifest path is cached for the icon source (profile icons have no sprites)"""
+        local_path = os.path.join(self.assets_dir, path)
+        if path.startswith(ASSET_KINDS['profile'][1] + '/'):
+            return local_path
+        return get_icon_cache_path(local_path, use_sprites)
+
+    def diff(self, manifest, version, use_sprites=False):
+        """Return the manifest paths that are missing locally or from an older patch"""
+        with self.lock:
+            return [path for path in manifest
+                    if self.state.get(path, {}).get('version') != version
+                    or not self.store.exists(self.get_local_path(path, use_sprites))]
+
+    def sync(self, kinds=None, progress_callback=None, prune=True):
+        """
+        Bring the local cache up to date with the current patch
+
+        Args:
+            kinds: Asset kinds to sync (defaults to every kind)
+            progress_callback: Optional callback(done, total)
+            prune: Remove files and patch data that the current patch no longer uses
+
+        Returns:
+            tuple: (updated, failed) counts
+        """
+        version = self.data_dragon.get_version(wait=10)
+        kinds = kinds or list(ASSET_KINDS)
+        manifest, built = self.build_manifest(version, kinds)
+        use_sprites = get_icon_source() == 'sprites'
+        pending = self.diff(manifest, version, use_sprites)
+
+        updated = 0
+        failed = 0
+        done = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.sync_file, path, manifest[path], version, use_sprites)
+                       for path in pending]
+            for future in futures:
+                if future.result():
+                    updated += 1
+                else:
+                    failed += 1
+                done += 1
+                if progress_callback:
+                    progress_callback(done, len(pending))
+
+        # Only prune after a clean run, and only kinds whose manifest is known to be complete
+        if prune and built and failed == 0:
+            self.prune(manifest, version, built, remove_patches=len(built) == len(kinds))
+        self.save_state()
+        return updated, failed
+
+    def sync_file(self, path, entry, version, use_sprites=False):
+        """Update one cached file; returns True on success"""
+        local_path = self.get_local_path(path, use_sprites)
+        with self.lock:
+            etag = self.state.get(path, {}).get('etag')
+
+        local_dir, filename = path.split('/', 1)
+        kind = next(kind for kind, (_, kind_dir, _) in ASSET_KINDS.items() if kind_dir == local_dir)
+
+        # Sprite sheets are already versioned per patch; slicing needs no request per icon
+        if use_sprites and kind != 'profile' and \
+                get_sprite_sheets().extract_icon(kind, os.path.splitext(filename)[0], local_path):
+            etag = None
+        else:
+            etag = self.download(entry['url'], local_path, etag)
+            if etag is False:
+                return False
+
+        with self.lock:
+            self.state[path] = {'version': version, 'etag': etag}
+        return True
+
+    def download(self, url, local_path, etag=None):
+        """
+        Download url into the asset store as local_path, resuming a partial
+        .part file if present
+
+        A conditional request skips files whose ETag hasn't changed.
+
+        Returns:
+            The new ETag (or None), or False on failure
+        """
+        part_path = local_path + ".part"
+        headers = {}
+        resume_from = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if resume_from:
+            headers['Range'] = f"bytes={resume_from}-"
+            if etag:
+                headers['If-Range'] = etag
+        elif etag and self.store.exists(local_path):
+            headers['If-None-Match'] = etag
+
+        try:
+            with requests.get(url, headers=headers, stream=True, timeout=10) as response:
+                if response.status_code == 304:
+                    return etag
+                if response.status_code not in (200, 206):
+                    print(f"Failed to download {url}: {response.status_code}")
+                    return False
+
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                mode = 'ab' if response.status_code == 206 else 'wb'
+                with open(part_path, mode) as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+
+                with open(part_path, 'rb') as f:
+                    self.store.add(local_path, f.read())
+                os.remove(part_path)
+                return response.headers.get('ETag')
+        except Exception as e:
+            print(f"Error downloading {url}: {e}")
+            return False
+
+    def prune(self, manifest, version, kinds, remove_patches=False):
+        """
+        Delete synced files the current manifest dropped, and older patch data
+
+        Args:
+            kinds: Kinds whose manifest was built (only their files are pruned)
+            remove_patches: Also delete patch directories older than version,
+                provided version's own data files are on disk
+        """
+        local_dirs = tuple(ASSET_KINDS[kind][1] + '/' for kind in kinds)
+
+        with self.lock:
+            stale = [path for path in self.state if path.startswith(local_dirs) and path not in manifest]
+            for path in stale:
+                del self.state[path]
+
+        for path in stale:
+            # Either icon source may have cached it
+            for use_sprites in (False, True):
+                self.store.remove(self.get_local_path(path, use_sprites))
+
+        if not remove_patches:
+            return
+
+        # Keep the previous patch until this one's manifest and data files are complete
+        current_dir = self.data_dragon.get_patch_dir(version)
+        required = ["manifest.json"] + [ASSET_KINDS[kind][0] for kind in kinds]
+        if not all(os.path.isfile(os.path.join(current_dir, name)) for name in required):
+            return
+
+        # Data files, sprite sheets and manifests of superseded patches. Only older
+        # patches go, so an offline fallback version never removes newer data.
+        patch_root = self.data_dragon.cache_dir
+        if os.path.isdir(patch_root):
+            for name in os.listdir(patch_root):
+                patch_dir = os.path.join(patch_root, name)
+                if os.path.isdir(patch_dir) and version_key(name) < version_key(version):
+                    shutil.rmtree(patch_dir, ignore_errors=True)
+
+    def sync_async(self, kinds=None, callback=None):
+        """
+        Run sync() in a background thread (at most one at a time)
+
+        Args:
+            callback: Optional callback(updated, failed), called from the worker thread
+        """
+        with self.lock:
+            if self.syncing:
+                return False
+            self.syncing = True
+
+        def sync_in_thread():
+            try:
+                result = self.sync(kinds or PRESYNC_KINDS)
+                if callback:
+                    callback(*result)
+            except Exception as e:
+                print(f"Error syncing assets: {e}")
+            finally:
+                with self.lock:
+                    self.syncing = False
+
+        thread = threading.Thread(target=sync_in_thread, daemon=True)
+        thread.start()
+        return True
@@ -0,0 +1,115 @@
+"""
+Match card benchmark
+Compares the widget-tree match cards (MatchHistoryDisplay.create_match_card)
+against cards drawn on a single canvas (MatchCardCanvas): widgets created
+and time to build and lay out a page of cards
+
+Needs a display. Run from the repository root:
+    python benchmarks/match_card_benchmark.py
+"""
+import os
+import random
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from gui.match_history_display import MatchHistoryDisplay
+from gui.match_card_canvas import MatchCardCanvas
+
+ROUNDS = 5
+CARDS = 50
+
+
+def make_matches(count):
+    """Synthetic match summaries with full teams and item builds"""
+    rng = random.Random(1)
+    matches = []
+    for i in range(count):
+        teams = {}
+        for team_id, key in ((100, 'blue_team'), (200, 'red_team')):
+            teams[key] = [{
+                'champion_id': rng.randint(1, 150),
+                'champion_name': f"Champion{j}",
+                'summoner_name': f"Summoner{team_id}{j}LongName",
+                'riot_id': f"Summoner{team_id}{j}#EUW",
+                'spell1_id': 4,
+                'spell2_id': rng.choice([7, 11, 12, 14]),
+                'is_player': team_id == 100 and j == 0,
+            } for j in range(5)]
+        matches.append({
+            'win': i % 2 == 0,
+            'game_mode': 'Ranked Solo/Duo',
+            'game_creation': int((time.time() - i * 3600) * 1000),
+            'game_duration': 1500 + i * 7,
+            'champion_id': teams['blue_team'][0]['champion_id'],
+            'champion_name': 'Champion0',
+            'champion_level': 16,
+            'summoner1_id': 4,
+            'summoner2_id': 14,
+            'kills': rng.randint(0, 15),
+            'deaths': rng.randint(0, 10),
+            'assists': rng.randint(0, 20),
+            'cs': rng.randint(50, 300),
+            'items': [rng.choice([0, 1028, 1029, 3006, 3031]) for _ in range(6)] + [3340],
+            'player_team_id': 100,
+            **teams,
+        })
+    return matches
+
+
+def build_widget_cards(display, parent, matches):
+    for idx, match in enumerate(matches):
+        display.create_match_card(match, idx, parent)
+
+
+def build_canvas_cards(display, parent, matches):
+    for match in matches:
+        MatchCardCanvas(parent, display, match).pack(pady=8, padx=5)
+
+
+def count_widgets(widget):
+    return sum(1 + count_widgets(child) for child in widget.winfo_children())
+
+
+def count_canvas_items(widget):
+    items = len(widget.find_all()) if isinstance(widget, tk.Canvas) else 0
+    return items + sum(count_canvas_items(child) for child in widget.winfo_children())
+
+
+def measure(root, display, build, matches):
+    """Average build + layout time, and the widget / canvas item counts of one page"""
+    total = 0
+    for _ in range(ROUNDS):
+        page = tk.Frame(root)
+        page.pack()
+        start = time.perf_counter()
+        build(display, page, matches)
+        root.update_idletasks()
+        total += time.perf_counter() - start
+
+        widgets = count_widgets(page)
+        items = count_canvas_items(page)
+        page.destroy()
+        display.image_requests = []  # Icons aren't loaded; only card construction is measured
+    return total / ROUNDS, widgets, items
+
+
+def main():
+    root = tk.Tk()
+    root.withdraw()
+    display = MatchHistoryDisplay(tk.Frame(root), [])
+    matches = make_matches(CARDS)
+
+    widget_time, widget_count, widget_items = measure(root, display, build_widget_cards, matches)
+    canvas_time, canvas_count, canvas_items = measure(root, display, build_canvas_cards, matches)
+
+    print(f"{CARDS} match cards, average of {ROUNDS} rounds (build + layout)")
+    print(f"  widget cards: {widget_time * 1000:8.1f} ms  {widget_count:5d} widgets  {widget_items:5d} canvas items")
+    print(f"  canvas cards: {canvas_time * 1000:8.1f} ms  {canvas_count:5d} widgets  {canvas_items:5d} canvas items")
+    print(f"  speedup:      {widget_time / canvas_time:8.1f}x  ({widget_count / canvas_count:.0f}x fewer widgets)")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
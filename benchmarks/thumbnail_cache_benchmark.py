@@ -0,0 +1,94 @@
+"""
+Thumbnail cache benchmark
+Compares Image.open + LANCZOS resize on every load against loading
+pre-resized variants from ThumbnailCache
+
+Run from the repository root:
+    python benchmarks/thumbnail_cache_benchmark.py
+"""
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from asset_pack import AssetStore
+from thumbnail_cache import ThumbnailCache
+
+ROUNDS = 5
+ICON_SIZES = [(16, 16), (24, 24), (28, 28), (32, 32), (36, 36), (40, 40), (48, 48), (64, 64)]
+RANK_SIZES = [(24, 24), (32, 32), (48, 48)]
+
+
+def make_icons(directory, count=100):
+    """Create Data Dragon sized (120x120) icons with some detail to compress"""
+    paths = []
+    for i in range(count):
+        img = Image.effect_noise((120, 120), 40 + i % 20).convert("RGBA")
+        path = os.path.join(directory, f"{i}.png")
+        img.save(path)
+        paths.append(path)
+    return paths
+
+
+def resize_every_time(paths, sizes):
+    for path in paths:
+        for size in sizes:
+            with Image.open(path) as img:
+                img.resize(size, Image.Resampling.LANCZOS)
+
+
+def load_from_cache(cache, paths, sizes):
+    for path in paths:
+        for size in sizes:
+            cache.open(path, size)
+
+
+def measure(func, *args):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        func(*args)
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def report(name, paths, sizes, cache):
+    loads = len(paths) * len(sizes)
+    cache.clear()
+
+    baseline = measure(resize_every_time, paths, sizes)
+
+    start = time.perf_counter()
+    load_from_cache(cache, paths, sizes)
+    cold = time.perf_counter() - start
+
+    warm = measure(load_from_cache, cache, paths, sizes)
+
+    print(f"{name}: {len(paths)} sources x {len(sizes)} sizes = {loads} loads")
+    print(f"  open + resize every time: {baseline * 1000:8.1f} ms  ({baseline / loads * 1e6:7.1f} us/load)")
+    print(f"  cache cold (create):      {cold * 1000:8.1f} ms  ({cold / loads * 1e6:7.1f} us/load)")
+    print(f"  cache warm (load):        {warm * 1000:8.1f} ms  ({warm / loads * 1e6:7.1f} us/load)")
+    print(f"  warm speedup:             {baseline / warm:8.1f}x")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = AssetStore(assets_dir=temp_dir, sidecar_pack_path=os.path.join(temp_dir, "downloads.pack"))
+        cache = ThumbnailCache(os.path.join(temp_dir, "thumbnails.pack"), store=store)
+
+        icons = make_icons(temp_dir)
+        report("Icons (120px)", icons, ICON_SIZES, cache)
+
+        ranks = []
+        for path in sorted(glob.glob(os.path.join("assets", "ranks", "*.png"))):
+            ranks.append(shutil.copy(path, temp_dir))
+        if ranks:
+            report("Rank emblems", ranks, RANK_SIZES, cache)
+        else:
+            print("Rank emblems: assets/ranks not found, run from the repository root")
+
+
+if __name__ == "__main__":
+    main()
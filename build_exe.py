@@ -5,6 +5,7 @@ Run: python build_exe.py
 import PyInstaller.__main__
 import os
 import shutil
+from asset_pack import build_pack
 
 # Clean previous builds
 if os.path.exists('build'):
@@ -12,6 +13,11 @@ if os.path.exists('build'):
 if os.path.exists('dist'):
     shutil.rmtree('dist')
 
+# Bundle the icons as one memory-mapped pack instead of hundreds of files
+os.makedirs('build', exist_ok=True)
+packed = build_pack('assets', 'build/assets.pack')
+print(f"Packed {packed} assets into build/assets.pack")
+
 # PyInstaller arguments - using --onefile for auto-update compatibility
 PyInstaller.__main__.run([
     'main.py',
@@ -19,7 +25,8 @@ PyInstaller.__main__.run([
     '--onefile',  # Single file - works with auto-updater
     '--windowed',  # No console window
     '--icon=assets/rose.ico',
-    '--add-data=assets;assets',  # Include assets folder
+    '--add-data=build/assets.pack;.',  # Bundled icons
+    '--add-data=assets/rose.ico;assets',  # Window icon
     '--hidden-import=PIL._tkinter_finder',
     '--hidden-import=pyperclip',
     '--collect-all=tkinter',
@@ -2,8 +2,10 @@
 Champion data helper
 Maps champion IDs to names
 """
+from static_data import get_static_data
 
-# Champion ID to Name mapping (Updated from Data Dragon 15.23.1)
+# Offline fallback for champion names until the static data index for the
+# current patch is available (Data Dragon 15.23.1)
 CHAMPION_MAP = {
     1: "Annie", 2: "Olaf", 3: "Galio", 4: "Twisted Fate", 5: "Xin Zhao",
     6: "Urgot", 7: "LeBlanc", 8: "Vladimir", 9: "Fiddlesticks", 10: "Kayle",
@@ -44,6 +46,9 @@ CHAMPION_MAP = {
 
 def get_champion_name(champion_id):
     """Get champion name from ID"""
+    name = get_static_data().champion_name(champion_id)
+    if name:
+        return name
     return CHAMPION_MAP.get(champion_id, f"Champion {champion_id}")
 
 def format_mastery_points(points):
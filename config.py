@@ -59,6 +59,27 @@ def set_theme(theme):
     config['theme'] = theme
     return save_config(config)
 
+def get_icon_source():
+    """Get how icons are downloaded: 'sprites' (sprite sheets) or 'individual'"""
+    config = load_config()
+    return config.get('icon_source', 'sprites')
+
+def set_icon_source(icon_source):
+    """Set how icons are downloaded"""
+    config = load_config()
+    config['icon_source'] = icon_source
+    return save_config(config)
+
+def get_asset_presync():
+    """Get whether icons for the current patch are synced in the background at startup"""
+    config = load_config()
+    return config.get('asset_presync', True)
+
+def get_match_card_style():
+    """Get how match history cards are built: 'canvas' (drawn on one canvas) or 'widgets'"""
+    config = load_config()
+    return config.get('match_card_style', 'canvas')
+
 def get_theme_colors(theme_name=None):
     """Get color scheme for specified theme"""
     if theme_name is None:
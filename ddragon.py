@@ -0,0 +1,188 @@
+"""
+Data Dragon service
+Resolves the current patch in the background and caches it on disk so that
+icon fetchers never block on versions.json
+"""
+import json
+import os
+import threading
+import time
+import requests
+
+DDRAGON_URL = "https://ddragon.leagueoflegends.com"
+FALLBACK_VERSION = "14.23.1"
+LANGUAGE = "en_US"
+VERSION_TTL = 6 * 60 * 60  # Re-check versions.json at most every 6 hours
+RETRY_DELAY = 5 * 60  # Retry sooner when the last check failed
+
+
+class DataDragon:
+    def __init__(self, cache_dir="assets/ddragon", ttl=VERSION_TTL):
+        self.cache_dir = cache_dir
+        self.cache_file = os.path.join(cache_dir, "version.json")
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.resolved = threading.Event()
+        self.refreshing = False
+        self.listeners = []
+        self.data_files = {}  # (version, filename) -> parsed JSON
+        self.data_lock = threading.Lock()
+
+        # Start from the cached version (even if stale) so callers always have one
+        self.version, self.next_check = self._load_cached_version()
+        if self.version and time.time() < self.next_check:
+            self.resolved.set()
+        else:
+            self.version = self.version or FALLBACK_VERSION
+            self.refresh_async()
+
+    def _load_cached_version(self):
+        """Read (version, next_check) from disk"""
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+            return data.get('version'), data.get('fetched_at', 0) + self.ttl
+        except (OSError, ValueError):
+            return None, 0
+
+    def _save_cached_version(self, version):
+        """Write the resolved version to disk"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_file = self.cache_file + ".tmp"
+            with open(temp_file, 'w') as f:
+                json.dump({'version': version, 'fetched_at': time.time()}, f)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            print(f"Error saving Data Dragon version: {e}")
+
+    def refresh_async(self):
+        """Resolve the latest version in a background thread"""
+        with self.lock:
+            if self.refreshing:
+                return
+            self.refreshing = True
+
+        thread = threading.Thread(target=self._refresh, daemon=True)
+        thread.start()
+
+    def _refresh(self):
+        """Fetch versions.json and notify listeners if the patch changed"""
+        changed = False
+        next_check = time.time() + RETRY_DELAY
+        try:
+            response = requests.get(f"{DDRAGON_URL}/api/versions.json", timeout=5)
+            if response.status_code == 200:
+                version = response.json()[0]
+                self._save_cached_version(version)
+                next_check = time.time() + self.ttl
+                with self.lock:
+                    changed = version != self.version
+                    self.version = version
+        except Exception as e:
+            print(f"Error resolving Data Dragon version: {e}")
+        finally:
+            with self.lock:
+                self.refreshing = False
+                self.next_check = next_check
+                listeners = list(self.listeners)
+            self.resolved.set()
+
+        if changed:
+            for callback in listeners:
+                try:
+                    callback(self.version)
+                except Exception as e:
+                    print(f"Error in Data Dragon listener: {e}")
+
+    def get_version(self, wait=0):
+        """
+        Get the current patch version
+
+        Args:
+            wait: Seconds to wait for a pending refresh when about to hit the
+                  CDN anyway. Ignored on the main thread, which never waits.
+        """
+        if time.time() >= self.next_check:
+            self.refresh_async()
+        if wait and threading.current_thread() is not threading.main_thread():
+            self.resolved.wait(wait)
+        return self.version
+
+    def add_listener(self, callback):
+        """Call callback(version) from the worker thread when the patch changes"""
+        with self.lock:
+            self.listeners.append(callback)
+
+    def get_patch_dir(self, version=None):
+        """Directory for files that belong to one patch"""
+        return os.path.join(self.cache_dir, version or self.version)
+
+    def get_data_file(self, filename, version=None, wait=5, download=True):
+        """
+        Get a parsed data file (e.g. "champion.json") for a patch
+
+        Downloaded once per patch and kept under the patch directory.
+        With download=False only the copy on disk is used.
+
+        Returns:
+            dict or None
+        """
+        version = version or self.get_version(wait)
+        key = (version, filename)
+        if key in self.data_files:
+            return self.data_files[key]
+
+        with self.data_lock:
+            if key not in self.data_files:
+                self._load_data_file(key, download)
+            return self.data_files.get(key)
+
+    def _load_data_file(self, key, download=True):
+        """Read a data file from disk or download it"""
+        version, filename = key
+        path = os.path.join(self.get_patch_dir(version), filename)
+        data = None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            if not download:
+                return
+            try:
+                response = requests.get(f"{DDRAGON_URL}/cdn/{version}/data/{LANGUAGE}/{filename}", timeout=10)
+                if response.status_code == 200:
+                    data = response.json()
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    temp_path = path + ".tmp"
+                    with open(temp_path, 'wb') as f:
+                        f.write(response.content)
+                    os.replace(temp_path, path)
+                else:
+                    print(f"Failed to download {filename}: {response.status_code}")
+            except Exception as e:
+                print(f"Error downloading {filename}: {e}")
+
+        if data is not None:
+            self.data_files[key] = data
+
+    def cdn_url(self, path, wait=0):
+        """Versioned CDN URL, e.g. cdn_url("data/en_US/champion.json")"""
+        return f"{DDRAGON_URL}/cdn/{self.get_version(wait)}/{path}"
+
+    def image_url(self, kind, filename, wait=0):
+        """Versioned image URL, e.g. image_url("champion", "Ahri.png")"""
+        return self.cdn_url(f"img/{kind}/{filename}", wait)
+
+
+_data_dragon = None
+_data_dragon_lock = threading.Lock()
+
+
+def get_data_dragon():
+    """Get the shared DataDragon instance"""
+    global _data_dragon
+    with _data_dragon_lock:
+        if _data_dragon is None:
+            _data_dragon = DataDragon()
+        return _data_dragon
@@ -0,0 +1,173 @@
+"""
+Bulk account import dialog
+"""
+import tkinter as tk
+from tkinter import ttk, filedialog, scrolledtext, messagebox
+import threading
+from account_importer import AccountImporter
+from gui.ui_dispatcher import get_ui_dispatcher
+from config import get_api_key, get_region
+
+class BulkImportDialog:
+    def __init__(self, parent, account_manager):
+        self.account_manager = account_manager
+        self.importer = AccountImporter(api_key=get_api_key())
+        self.valid_rows = []
+        self.cancelled = threading.Event()  # Stops a running validation when the dialog closes
+
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Import Accounts")
+        self.dialog.geometry("520x480")
+        self.dialog.resizable(True, True)
+        self.dialog.configure(bg="#2d2d2d")
+
+        # Make dialog modal
+        self.dialog.transient(parent)
+        self.dialog.grab_set()
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Setup the dialog UI"""
+        main_frame = tk.Frame(self.dialog, bg="#2d2d2d")
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+        # Title
+        title = tk.Label(main_frame, text="Import Accounts",
+                        font=("Arial", 14, "bold"), bg="#2d2d2d", fg="white")
+        title.pack(pady=(0, 10))
+
+        info = tk.Label(main_frame,
+                       text="CSV or JSON with columns: username, display_name, riot_id, region (password optional)",
+                       font=("Arial", 8), bg="#2d2d2d", fg="#888888", wraplength=460)
+        info.pack(pady=(0, 10))
+
+        self.choose_btn = tk.Button(main_frame, text="📂 Choose File...",
+                                   command=self.choose_file,
+                                   bg="#0078d4", fg="white", font=("Arial", 10),
+                                   padx=15, pady=6, relief=tk.FLAT, cursor="hand2")
+        self.choose_btn.pack(pady=(0, 10))
+
+        # Progress
+        self.progress_label = tk.Label(main_frame, text="No file selected",
+                                      font=("Arial", 9), bg="#2d2d2d", fg="#aaaaaa")
+        self.progress_label.pack(anchor="w")
+
+        self.progress_bar = ttk.Progressbar(main_frame, mode="determinate")
+        self.progress_bar.pack(fill=tk.X, pady=(5, 10))
+
+        # Results
+        self.results_text = scrolledtext.ScrolledText(main_frame,
+                                                      font=("Arial", 9),
+                                                      bg="#1e1e1e", fg="white",
+                                                      wrap=tk.WORD, height=10)
+        self.results_text.pack(fill=tk.BOTH, expand=True)
+        self.results_text.config(state=tk.DISABLED)
+
+        # Buttons
+        btn_frame = tk.Frame(main_frame, bg="#2d2d2d")
+        btn_frame.pack(pady=(15, 0), fill=tk.X)
+
+        self.import_btn = tk.Button(btn_frame, text="Import",
+                                   command=self.commit_import,
+                                   bg="#28a745", fg="white", font=("Arial", 11, "bold"),
+                                   padx=25, pady=8, relief=tk.FLAT, cursor="hand2",
+                                   state=tk.DISABLED)
+        self.import_btn.pack(side=tk.LEFT, padx=(0, 10))
+
+        cancel_btn = tk.Button(btn_frame, text="Cancel",
+                              command=self.cancel,
+                              bg="#4a4a4a", fg="white", font=("Arial", 11),
+                              padx=25, pady=8, relief=tk.FLAT, cursor="hand2")
+        cancel_btn.pack(side=tk.LEFT)
+
+    def choose_file(self):
+        """Pick a file, then dedup and validate it in the background"""
+        file_path = filedialog.askopenfilename(
+            parent=self.dialog,
+            title="Import Accounts",
+            filetypes=[("Account files", "*.csv *.json"), ("CSV", "*.csv"), ("JSON", "*.json"), ("All files", "*.*")]
+        )
+        if not file_path:
+            return
+
+        rows, error = self.importer.parse_file(file_path)
+        if error:
+            messagebox.showerror("Error", error, parent=self.dialog)
+            return
+
+        rows, skipped = self.importer.dedup(rows, self.account_manager.get_all_accounts())
+
+        self.valid_rows = []
+        self.choose_btn.config(state=tk.DISABLED)
+        self.import_btn.config(state=tk.DISABLED)
+        self.progress_bar.config(maximum=max(len(rows), 1), value=0)
+        self.progress_label.config(text=f"Validating {len(rows)} accounts...")
+
+        default_region = get_region()
+
+        dispatcher = get_ui_dispatcher(self.dialog)
+
+        def progress(done, total, row):
+            if not self.cancelled.is_set():
+                dispatcher.post(self.update_progress, done, total, row, key=(self, "progress"))
+
+        def validate_in_thread():
+            valid_rows, invalid = self.importer.validate_riot_ids(rows, default_region, progress, self.cancelled)
+            if not self.cancelled.is_set():
+                dispatcher.post(self.show_results, valid_rows, invalid, skipped)
+
+        thread = threading.Thread(target=validate_in_thread, daemon=True)
+        thread.start()
+
+    def cancel(self):
+        """Close the dialog and stop any validation still running"""
+        self.cancelled.set()
+        self.dialog.destroy()
+
+    def update_progress(self, done, total, row):
+        """Update the progress bar"""
+        if not self.dialog.winfo_exists():
+            return
+        self.progress_bar.config(value=done)
+        self.progress_label.config(text=f"Validated {done}/{total}: {row['riot_id'] or row['username']}")
+
+    def show_results(self, valid_rows, invalid, skipped):
+        """Show what will be imported and what was rejected"""
+        if not self.dialog.winfo_exists():
+            return
+
+        self.valid_rows = valid_rows
+        self.choose_btn.config(state=tk.NORMAL)
+        self.progress_label.config(
+            text=f"{len(valid_rows)} ready, {len(invalid)} invalid, {len(skipped)} duplicates skipped"
+        )
+
+        lines = []
+        for row, reason in invalid:
+            lines.append(f"✗ {row['username']} ({row['riot_id']}): {reason}")
+        for row, reason in skipped:
+            lines.append(f"– {row['username']}: {reason}")
+        for row in valid_rows:
+            lines.append(f"✓ {row['username']} {row['riot_id']}".rstrip())
+
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete("1.0", tk.END)
+        self.results_text.insert("1.0", "\n".join(lines))
+        self.results_text.config(state=tk.DISABLED)
+
+        if valid_rows:
+            self.import_btn.config(text=f"Import {len(valid_rows)}", state=tk.NORMAL)
+
+    def commit_import(self):
+        """Add every valid row with a single save"""
+        if not self.valid_rows:
+            return
+
+        added = self.account_manager.add_accounts(self.valid_rows)
+        if not added:
+            messagebox.showerror("Error", "Failed to save imported accounts.", parent=self.dialog)
+            return
+
+        self.cancel()
@@ -0,0 +1,130 @@
+"""
+Champion stats display component
+Shows per-champion aggregates read from the local match archive
+"""
+import tkinter as tk
+from config import get_theme_colors
+
+class ChampionStatsDisplay:
+    COLUMNS = ["Champion", "Games", "W / L", "Win Rate", "KDA", "CS/min", "Avg Time", "Streak"]
+
+    def __init__(self, parent, stats, totals=None):
+        self.parent = parent
+        self.stats = stats  # List of dicts from MatchArchive.get_champion_stats
+        self.totals = totals  # Optional rollup from MatchArchive.get_stats
+
+        # Get theme colors
+        self.colors = get_theme_colors()
+
+        # Clear parent
+        for widget in parent.winfo_children():
+            widget.destroy()
+
+        self.setup_scrollable_frame()
+        self.display_stats()
+
+    def refresh_theme(self):
+        """Refresh the display with new theme colors"""
+        self.colors = get_theme_colors()
+        self.canvas.configure(bg=self.colors['bg_primary'])
+        self.scrollable_frame.configure(bg=self.colors['bg_primary'])
+
+        for widget in self.scrollable_frame.winfo_children():
+            widget.destroy()
+
+        self.display_stats()
+
+    def setup_scrollable_frame(self):
+        """Setup scrollable frame for the stats table"""
+        self.canvas = tk.Canvas(self.parent, bg=self.colors['bg_primary'], highlightthickness=0)
+        self.scrollable_frame = tk.Frame(self.canvas, bg=self.colors['bg_primary'])
+
+        self.scrollable_frame.bind(
+            "<Configure>",
+            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        )
+
+        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="n")
+
+        # Keep content centered when canvas is resized
+        def on_canvas_configure(event):
+            self.canvas.coords(self.canvas.find_all()[0], event.width // 2, 0)
+
+        self.canvas.bind("<Configure>", on_canvas_configure)
+        self.canvas.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+        def on_mousewheel(event):
+            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+
+        self.canvas.bind_all("<MouseWheel>", on_mousewheel)
+
+    def display_stats(self):
+        """Display the stats table"""
+        if not self.stats:
+            no_stats = tk.Label(self.scrollable_frame,
+                               text="No archived games for these filters",
+                               font=("Arial", 14), bg=self.colors['bg_primary'], fg=self.colors['text_muted'])
+            no_stats.pack(pady=50)
+            return
+
+        table = tk.Frame(self.scrollable_frame, bg=self.colors['bg_primary'])
+        table.pack(fill=tk.X)
+
+        for col, title in enumerate(self.COLUMNS):
+            header = tk.Label(table, text=title,
+                             font=("Arial", 10, "bold"), bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
+                             padx=12, pady=6, anchor="w" if col == 0 else "center")
+            header.grid(row=0, column=col, sticky="ew")
+
+        row = 1
+        if self.totals:
+            self.create_stats_row(table, row, "All Champions", self.totals, bold=True)
+            row += 1
+
+        for stats in self.stats:
+            self.create_stats_row(table, row, stats.get('champion_name') or f"Champion {stats['champion_id']}", stats)
+            row += 1
+
+    def create_stats_row(self, parent, row, name, stats, bold=False):
+        """Create one row of the stats table"""
+        bg_color = self.colors['bg_tertiary'] if row % 2 == 0 else self.colors['bg_primary']
+        font = ("Arial", 10, "bold") if bold else ("Arial", 10)
+
+        minutes = int(stats['avg_duration'] // 60)
+        seconds = int(stats['avg_duration'] % 60)
+
+        streak = stats['streak']
+        streak_text = f"{abs(streak)}{'W' if streak > 0 else 'L'}" if streak else "-"
+        streak_color = self.colors['accent_green'] if streak > 0 else self.colors['accent_red']
+
+        win_rate = stats['win_rate']
+        win_rate_color = self.colors['accent_green'] if win_rate >= 50 else self.colors['accent_red']
+
+        values = [
+            (name, self.colors['text_primary']),
+            (str(stats['games']), self.colors['text_primary']),
+            (f"{stats['wins']} / {stats['losses']}", self.colors['text_secondary']),
+            (f"{win_rate:.0f}%", win_rate_color),
+            (f"{stats['kda']:.2f}", self.get_kda_color(stats['kda'])),
+            (f"{stats['cs_per_min']:.1f}", self.colors['text_secondary']),
+            (f"{minutes}m {seconds}s", self.colors['text_muted']),
+            (streak_text, streak_color),
+        ]
+
+        for col, (text, color) in enumerate(values):
+            cell = tk.Label(parent, text=text, font=font, bg=bg_color, fg=color,
+                           padx=12, pady=4, anchor="w" if col == 0 else "center")
+            cell.grid(row=row, column=col, sticky="ew")
+
+    def get_kda_color(self, kda_ratio):
+        """Get color based on KDA ratio"""
+        if kda_ratio >= 5.0:
+            return "#ffd700"  # Gold
+        elif kda_ratio >= 3.0:
+            return "#00ff88"  # Green
+        elif kda_ratio >= 2.0:
+            return "#00bfff"  # Blue
+        elif kda_ratio >= 1.0:
+            return "#aaaaaa"  # Gray
+        else:
+            return "#ff4444"  # Red
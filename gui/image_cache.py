@@ -0,0 +1,124 @@
+"""
+Shared image cache
+One process-wide LRU of PhotoImages keyed by (asset, size, variant) and
+bounded by total pixel count, shared by every view
+"""
+from collections import OrderedDict
+from PIL import ImageTk
+from asset_pack import get_asset_store
+from thumbnail_cache import get_thumbnail_cache
+
+# About 16 MB of RGBA pixel data
+DEFAULT_MAX_PIXELS = 4_000_000
+
+
+class ImageCache:
+    def __init__(self, max_pixels=DEFAULT_MAX_PIXELS):
+        self.max_pixels = max_pixels
+        self.entries = OrderedDict()  # key -> PhotoImage, least recently used first
+        self.pixels = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def make_key(self, asset, size, variant=None):
+        """Cache key; asset paths are normalized to asset names so every view shares entries"""
+        return (get_asset_store().name_for(asset), tuple(size), variant)
+
+    def get(self, key, holder=None):
+        """Get a cached PhotoImage (or None) and mark it recently used"""
+        photo = self.entries.get(key)
+        if photo is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        if holder is not None:
+            self.hold(holder, photo)
+        return photo
+
+    def put(self, key, photo, holder=None):
+        """Add a PhotoImage, evicting least recently used entries over budget"""
+        if key in self.entries:
+            self.pixels -= self._pixel_count(self.entries.pop(key))
+
+        self.entries[key] = photo
+        self.pixels += self._pixel_count(photo)
+        if holder is not None:
+            self.hold(holder, photo)
+
+        while self.pixels > self.max_pixels and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.pixels -= self._pixel_count(evicted)
+            self.evictions += 1
+
+    def load(self, path, size, variant=None, holder=None):
+        """
+        Get a PhotoImage for an asset at the given size, loading it on a miss
+
+        Must be called from the main thread.
+
+        Returns:
+            PhotoImage or None
+        """
+        key = self.make_key(path, size, variant)
+        photo = self.get(key, holder)
+        if photo is not None:
+            return photo
+
+        img = get_thumbnail_cache().open(path, size)
+        if img is None:
+            return None
+
+        photo = ImageTk.PhotoImage(img)
+        self.put(key, photo, holder)
+        return photo
+
+    def hold(self, holder, photo):
+        """
+        Keep photo alive as long as holder (usually the widget showing it) exists
+
+        Evicting an entry only drops the cache's reference, so images still on
+        screen are never garbage collected out from under Tk.
+        """
+        references = getattr(holder, '_image_references', None)
+        if references is None:
+            references = []
+            holder._image_references = references
+        if photo not in references:
+            references.append(photo)
+
+    def _pixel_count(self, photo):
+        return photo.width() * photo.height()
+
+    def stats(self):
+        """Hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups * 100 if lookups else 0,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'pixels': self.pixels,
+            'max_pixels': self.max_pixels,
+        }
+
+    def report(self):
+        """One-line summary of the cache counters"""
+        stats = self.stats()
+        return (f"Image cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0f}% hit rate), "
+                f"{stats['evictions']} evictions, {stats['entries']} images, "
+                f"{stats['pixels'] / 1_000_000:.1f}M / {stats['max_pixels'] / 1_000_000:.1f}M pixels")
+
+
+_image_cache = None
+
+
+def get_image_cache():
+    """Get the shared ImageCache (main thread only)"""
+    global _image_cache
+    if _image_cache is None:
+        _image_cache = ImageCache()
+    return _image_cache
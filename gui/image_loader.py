@@ -0,0 +1,131 @@
+"""
+Async image loader
+Downloads and decodes icons on a worker pool and hands the finished
+PhotoImages to widgets on the Tk main thread, a batch at a time
+"""
+import threading
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from PIL import ImageTk
+from thumbnail_cache import get_thumbnail_cache
+from gui.image_cache import get_image_cache
+from gui.ui_dispatcher import get_ui_dispatcher
+
+class ImageLoader:
+    def __init__(self, root, max_workers=6):
+        self.root = root
+        self.dispatcher = get_ui_dispatcher(root)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-loader")
+        self.pending = {}  # key -> callbacks waiting for it
+        self.placeholders = {}  # (size, color) -> PhotoImage
+
+    def placeholder(self, size, color=None):
+        """Blank image of the given size (optionally filled) to show while loading"""
+        key = (size, color)
+        if key not in self.placeholders:
+            photo = tk.PhotoImage(master=self.root, width=size[0], height=size[1])
+            if color:
+                photo.put(color, to=(0, 0, size[0], size[1]))
+            self.placeholders[key] = photo
+        return self.placeholders[key]
+
+    def load(self, asset, fetch, size, callback, holder=None):
+        """
+        Load an image and call callback(photo) on the main thread
+
+        Must be called from the main thread. Cached images call back
+        immediately; concurrent requests for the same image share one load.
+
+        Args:
+            asset: Asset path of the image (the shared cache key)
+            fetch: Callable run on a worker that returns the asset path once it's stored (or None)
+            size: (width, height) to resize to
+            callback: Called with the PhotoImage once it's ready
+            holder: Widget that keeps the PhotoImage alive while it's shown
+        """
+        self.load_batch([(asset, fetch, size, callback, holder)])
+
+    def load_batch(self, requests):
+        """
+        Load many images at once
+
+        Each distinct asset is fetched once and decoded at every requested
+        size on the worker pool (Pillow releases the GIL while decoding and
+        resizing, so they run in parallel). PhotoImages are created and
+        callbacks run in a single main-thread pass once the whole batch is done.
+
+        Args:
+            requests: Iterable of (asset, fetch, size, callback, holder) tuples, as for load()
+        """
+        cache = get_image_cache()
+        assets = {}  # asset -> (fetch, [(key, size)])
+        for asset, fetch, size, callback, holder in requests:
+            key = cache.make_key(asset, size)
+            photo = cache.get(key, holder)
+            if photo is not None:
+                callback(photo)
+                continue
+
+            if key in self.pending:
+                self.pending[key].append((callback, holder))
+                continue
+
+            self.pending[key] = [(callback, holder)]
+            assets.setdefault(key[0], (fetch, []))[1].append((key, size))
+
+        if not assets:
+            return
+
+        batch = {'remaining': len(assets), 'results': [], 'lock': threading.Lock()}
+        for fetch, variants in assets.values():
+            self.executor.submit(self._load_in_worker, batch, fetch, variants)
+
+    def _load_in_worker(self, batch, fetch, variants):
+        """Download and decode one asset off the main thread"""
+        results = []
+        try:
+            path = fetch()
+            for key, size in variants:
+                image = get_thumbnail_cache().open(path, size) if path else None
+                results.append((key, image))
+        except Exception as e:
+            print(f"Error loading image {variants[0][0]}: {e}")
+            loaded = {key for key, _ in results}
+            results.extend((key, None) for key, _ in variants if key not in loaded)
+
+        with batch['lock']:
+            batch['results'].extend(results)
+            batch['remaining'] -= 1
+            if batch['remaining']:
+                return
+
+        self.dispatcher.post(self._finish, batch['results'])
+
+    def _finish(self, results):
+        """Create the batch's PhotoImages on the main thread and notify waiting widgets"""
+        cache = get_image_cache()
+        for key, image in results:
+            callbacks = self.pending.pop(key, [])
+            if image is None:
+                continue
+
+            photo = ImageTk.PhotoImage(image)
+            cache.put(key, photo)
+            for callback, holder in callbacks:
+                try:
+                    if holder is not None:
+                        cache.hold(holder, photo)
+                    callback(photo)
+                except tk.TclError:
+                    pass  # Widget was destroyed while the image was loading
+
+
+_image_loader = None
+
+
+def get_image_loader(widget):
+    """Get the shared ImageLoader for the application"""
+    global _image_loader
+    if _image_loader is None:
+        _image_loader = ImageLoader(widget._root())
+    return _image_loader
@@ -8,7 +8,14 @@ from champion_data import get_champion_name, format_mastery_points
 from champion_icon_fetcher import ChampionIconFetcher
 from summoner_spell_fetcher import SummonerSpellFetcher
 import webbrowser
-from PIL import Image, ImageTk
+from gui.image_cache import get_image_cache
+from gui.image_loader import get_image_loader
+from gui.timer_scheduler import GameClock, TimerScheduler
+from gui.theme import get_theme_registry
+
+# Running spell timers of the last displayed game (game ID, key -> game time they end at),
+# so refreshing the same game keeps them
+_saved_spell_timers = (None, {})
 
 class LiveGameDisplay:
     def __init__(self, parent, game_data, rank_icons=None):
@@ -17,7 +24,9 @@ class LiveGameDisplay:
         self.rank_icons = rank_icons
         self.champion_icon_fetcher = ChampionIconFetcher()
         self.spell_fetcher = SummonerSpellFetcher()
-        self.icon_references = []  # Keep references to prevent garbage collection
+        self.image_loader = get_image_loader(parent)
+        self.image_requests = []  # Icons the display needs, loaded as one batch
+        self.theme = get_theme_registry()  # Widgets register theme roles, so theme switches recolor them in place
         
         self.setup_display()
     
@@ -28,7 +37,7 @@ class LiveGameDisplay:
             widget.destroy()
         
         # Main container - aligned to left
-        main_frame = tk.Frame(self.parent, bg="#1e1e1e")
+        main_frame = self.theme.register(tk.Frame(self.parent), bg='bg_primary')
         main_frame.pack(side=tk.LEFT, anchor="nw", padx=20, pady=20)
         
         # Teams (no header)
@@ -36,6 +45,10 @@ class LiveGameDisplay:
         
         # Spell tracker on the right
         self.create_spell_tracker()
+        
+        # Fetch and decode every icon in parallel, then swap them in together
+        self.image_loader.load_batch(self.image_requests)
+        self.image_requests = []
     
 
     def sort_by_lane(self, players):
@@ -96,7 +109,7 @@ class LiveGameDisplay:
     
     def create_teams_display(self, parent):
         """Create teams display (Blue vs Red) with bans stacked on left"""
-        teams_frame = tk.Frame(parent, bg="#1e1e1e")
+        teams_frame = self.theme.register(tk.Frame(parent), bg='bg_primary')
         teams_frame.pack(fill=tk.BOTH, expand=True)
         
         # Separate participants by team
@@ -114,11 +127,11 @@ class LiveGameDisplay:
         red_team = self.sort_by_lane(red_team)
         
         # Bans column (left) - stacked vertically
-        bans_container = tk.Frame(teams_frame, bg="#1e1e1e")
+        bans_container = self.theme.register(tk.Frame(teams_frame), bg='bg_primary')
         bans_container.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 10))
         
         # Red bans (top)
-        red_bans_frame = tk.Frame(bans_container, bg="#1e1e1e")
+        red_bans_frame = self.theme.register(tk.Frame(bans_container), bg='bg_primary')
         red_bans_frame.pack(fill=tk.X, pady=(0, 10))
         
         red_bans_header = tk.Label(red_bans_frame, text="RED BANS", 
@@ -128,7 +141,7 @@ class LiveGameDisplay:
         self.create_bans_column(red_bans_frame, red_bans, red_team)
         
         # Blue bans (bottom)
-        blue_bans_frame = tk.Frame(bans_container, bg="#1e1e1e")
+        blue_bans_frame = self.theme.register(tk.Frame(bans_container), bg='bg_primary')
         blue_bans_frame.pack(fill=tk.X)
         
         blue_bans_header = tk.Label(blue_bans_frame, text="BLUE BANS", 
@@ -138,7 +151,7 @@ class LiveGameDisplay:
         self.create_bans_column(blue_bans_frame, blue_bans, blue_team)
         
         # Blue team (center-left)
-        blue_frame = tk.Frame(teams_frame, bg="#1e1e1e")
+        blue_frame = self.theme.register(tk.Frame(teams_frame), bg='bg_primary')
         blue_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
         blue_header = tk.Label(blue_frame, text="BLUE TEAM", 
@@ -149,7 +162,7 @@ class LiveGameDisplay:
             self.create_player_card(blue_frame, player, "#1e4d7a")
         
         # Red team (center-right)
-        red_frame = tk.Frame(teams_frame, bg="#1e1e1e")
+        red_frame = self.theme.register(tk.Frame(teams_frame), bg='bg_primary')
         red_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
         
         red_header = tk.Label(red_frame, text="RED TEAM", 
@@ -164,17 +177,17 @@ class LiveGameDisplay:
         is_target = player.get('is_target', False)
         
         # Card frame with highlight for target player
-        card_bg = "#3d3d3d" if is_target else "#2d2d2d"
-        border_color = "#ffd700" if is_target else "#1e1e1e"
+        card_bg = 'bg_tertiary' if is_target else 'bg_secondary'  # Theme roles
+        border_color = 'accent_gold' if is_target else 'bg_primary'
         
-        card_frame = tk.Frame(parent, bg=border_color, relief=tk.RAISED, borderwidth=2)
+        card_frame = self.theme.register(tk.Frame(parent, relief=tk.RAISED, borderwidth=2), bg=border_color)
         card_frame.pack(fill=tk.X, pady=1)
         
-        inner_frame = tk.Frame(card_frame, bg=card_bg)
+        inner_frame = self.theme.register(tk.Frame(card_frame), bg=card_bg)
         inner_frame.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
         
         # Player info row
-        info_row = tk.Frame(inner_frame, bg=card_bg)
+        info_row = self.theme.register(tk.Frame(inner_frame), bg=card_bg)
         info_row.pack(fill=tk.X, padx=8, pady=5)
         
         # Summoner spells (stacked vertically on left)
@@ -182,59 +195,25 @@ class LiveGameDisplay:
         spell2_id = player.get('spell2Id')
         
         if spell1_id or spell2_id:
-            spell_frame = tk.Frame(info_row, bg=card_bg)
+            spell_frame = self.theme.register(tk.Frame(info_row), bg=card_bg)
             spell_frame.pack(side=tk.LEFT, padx=(0, 3))
             
-            # Spell 1 (top)
-            if spell1_id:
-                spell1_path = self.spell_fetcher.get_spell_icon_path(spell1_id)
-                if spell1_path:
-                    try:
-                        img = Image.open(spell1_path)
-                        img = img.resize((16, 16), Image.Resampling.LANCZOS)
-                        photo = ImageTk.PhotoImage(img)
-                        self.icon_references.append(photo)
-                        
-                        spell1_label = tk.Label(spell_frame, image=photo, bg=card_bg)
-                        spell1_label.pack()
-                    except Exception as e:
-                        print(f"Error loading spell icon: {e}")
-            
-            # Spell 2 (bottom)
-            if spell2_id:
-                spell2_path = self.spell_fetcher.get_spell_icon_path(spell2_id)
-                if spell2_path:
-                    try:
-                        img = Image.open(spell2_path)
-                        img = img.resize((16, 16), Image.Resampling.LANCZOS)
-                        photo = ImageTk.PhotoImage(img)
-                        self.icon_references.append(photo)
-                        
-                        spell2_label = tk.Label(spell_frame, image=photo, bg=card_bg)
-                        spell2_label.pack()
-                    except Exception as e:
-                        print(f"Error loading spell icon: {e}")
+            # Spell 1 on top, spell 2 below
+            for spell_id in (spell1_id, spell2_id):
+                if spell_id:
+                    self.create_spell_icon_label(spell_frame, spell_id, (16, 16), bg=card_bg).pack()
         
         # Champion icon
         champion_id = player.get('championId')
         champion_name = get_champion_name(champion_id)
         
-        icon_path = self.champion_icon_fetcher.get_champion_icon_path(champion_id)
-        if icon_path:
-            try:
-                img = Image.open(icon_path)
-                img = img.resize((32, 32), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                self.icon_references.append(photo)
-                
-                icon_label = tk.Label(info_row, image=photo, bg=card_bg)
-                icon_label.pack(side=tk.LEFT, padx=(0, 5))
-            except Exception as e:
-                print(f"Error loading champion icon: {e}")
+        if champion_id:
+            icon_label = self.create_champion_icon_label(info_row, champion_id, (32, 32), bg=card_bg)
+            icon_label.pack(side=tk.LEFT, padx=(0, 5))
         
         # Champion name
-        champ_label = tk.Label(info_row, text=champion_name, 
-                              font=("Arial", 9, "bold"), bg=card_bg, fg="white")
+        champ_label = self.theme.register(tk.Label(info_row, text=champion_name, 
+                              font=("Arial", 9, "bold")), bg=card_bg, fg='text_primary')
         champ_label.pack(side=tk.LEFT)
         
         # Summoner name (clickable) - detect streamer mode
@@ -248,14 +227,14 @@ class LiveGameDisplay:
         
         if is_streamer_mode:
             # Streamer mode - show champion name and indicator
-            name_label = tk.Label(info_row, text="🎭 Streamer Mode", 
-                                 font=("Arial", 8, "italic"), bg=card_bg, fg="#888888")
+            name_label = self.theme.register(tk.Label(info_row, text="🎭 Streamer Mode", 
+                                 font=("Arial", 8, "italic")), bg=card_bg, fg='text_muted')
             name_label.pack(side=tk.LEFT, padx=(8, 0))
         else:
             # Normal mode - show clickable name
-            name_label = tk.Label(info_row, text=summoner_name, 
-                                 font=("Arial", 9, "underline"), bg=card_bg, fg="#00bfff",
-                                 cursor="hand2")
+            name_label = self.theme.register(tk.Label(info_row, text=summoner_name, 
+                                 font=("Arial", 9, "underline"),
+                                 cursor="hand2"), bg=card_bg, fg='accent_blue')
             name_label.pack(side=tk.LEFT, padx=(8, 0))
             
             # Make name clickable to open op.gg
@@ -264,12 +243,12 @@ class LiveGameDisplay:
         # Summoner level (on the right)
         summoner_level = player.get('summoner_level')
         if summoner_level:
-            level_label = tk.Label(info_row, text=f"Lvl {summoner_level}", 
-                                  font=("Arial", 8, "bold"), bg=card_bg, fg="#00ff88")
+            level_label = self.theme.register(tk.Label(info_row, text=f"Lvl {summoner_level}", 
+                                  font=("Arial", 8, "bold")), bg=card_bg, fg='accent_green')
             level_label.pack(side=tk.RIGHT)
         
         # Stats row
-        stats_row = tk.Frame(inner_frame, bg=card_bg)
+        stats_row = self.theme.register(tk.Frame(inner_frame), bg=card_bg)
         stats_row.pack(fill=tk.X, padx=8, pady=(0, 5))
         
         # Rank with icon
@@ -288,28 +267,28 @@ class LiveGameDisplay:
             if self.rank_icons:
                 rank_icon = self.rank_icons.get_rank_icon(rank_text, size=(20, 20))
                 if rank_icon:
-                    self.icon_references.append(rank_icon)
-                    icon_label = tk.Label(stats_row, image=rank_icon, bg=card_bg)
+                    icon_label = self.theme.register(tk.Label(stats_row, image=rank_icon), bg=card_bg)
+                    get_image_cache().hold(icon_label, rank_icon)
                     icon_label.pack(side=tk.LEFT, padx=(0, 3))
             
-            rank_label = tk.Label(stats_row, text=f"{rank_text} ({lp} LP)", 
-                                 font=("Arial", 8), bg=card_bg, fg="#00bfff")
+            rank_label = self.theme.register(tk.Label(stats_row, text=f"{rank_text} ({lp} LP)", 
+                                 font=("Arial", 8)), bg=card_bg, fg='accent_blue')
             rank_label.pack(side=tk.LEFT)
             
-            wr_label = tk.Label(stats_row, text=f"{wins}W {losses}L ({winrate}%)", 
-                               font=("Arial", 8), bg=card_bg, fg="#888888")
+            wr_label = self.theme.register(tk.Label(stats_row, text=f"{wins}W {losses}L ({winrate}%)", 
+                               font=("Arial", 8)), bg=card_bg, fg='text_muted')
             wr_label.pack(side=tk.LEFT, padx=(8, 0))
         else:
-            rank_label = tk.Label(stats_row, text="Unranked", 
-                                 font=("Arial", 8), bg=card_bg, fg="#888888")
+            rank_label = self.theme.register(tk.Label(stats_row, text="Unranked", 
+                                 font=("Arial", 8)), bg=card_bg, fg='text_muted')
             rank_label.pack(side=tk.LEFT)
         
         # Champion mastery
         mastery_points = player.get('mastery_points', 0)
         if mastery_points > 0:
             mastery_text = format_mastery_points(mastery_points)
-            mastery_label = tk.Label(stats_row, text=f"🏆 {mastery_text}", 
-                                    font=("Arial", 8), bg=card_bg, fg="#ffd700")
+            mastery_label = self.theme.register(tk.Label(stats_row, text=f"🏆 {mastery_text}", 
+                                    font=("Arial", 8)), bg=card_bg, fg='accent_gold')
             mastery_label.pack(side=tk.RIGHT)
 
     def open_opgg(self, riot_id):
@@ -334,29 +313,29 @@ class LiveGameDisplay:
             pick_turn = ban.get('pickTurn', i)
             
             # Create ban card
-            ban_frame = tk.Frame(parent, bg="#2d2d2d", relief=tk.RAISED, borderwidth=1)
+            ban_frame = self.theme.register(tk.Frame(parent, relief=tk.RAISED, borderwidth=1), bg='bg_secondary')
             ban_frame.pack(fill=tk.X, pady=1)
             
             if champion_id > 0:
                 champion_name = get_champion_name(champion_id)
                 
-                ban_label = tk.Label(ban_frame, text=champion_name, 
-                                    font=("Arial", 8), bg="#2d2d2d", fg="#ff6b6b",
-                                    wraplength=80)
+                ban_label = self.theme.register(tk.Label(ban_frame, text=champion_name, 
+                                    font=("Arial", 8),
+                                    wraplength=80), bg='bg_secondary', fg='accent_red')
                 ban_label.pack(padx=5, pady=3)
             else:
                 # No ban
-                ban_label = tk.Label(ban_frame, text="No Ban", 
-                                    font=("Arial", 8), bg="#2d2d2d", fg="#666666")
+                ban_label = self.theme.register(tk.Label(ban_frame, text="No Ban", 
+                                    font=("Arial", 8)), bg='bg_secondary', fg='text_muted')
                 ban_label.pack(padx=5, pady=3)
         
         # Fill remaining slots if less than 5 bans
         for i in range(len(bans), 5):
-            ban_frame = tk.Frame(parent, bg="#2d2d2d", relief=tk.RAISED, borderwidth=1)
+            ban_frame = self.theme.register(tk.Frame(parent, relief=tk.RAISED, borderwidth=1), bg='bg_secondary')
             ban_frame.pack(fill=tk.X, pady=1)
             
-            ban_label = tk.Label(ban_frame, text="—", 
-                                font=("Arial", 8), bg="#2d2d2d", fg="#666666")
+            ban_label = self.theme.register(tk.Label(ban_frame, text="—", 
+                                font=("Arial", 8)), bg='bg_secondary', fg='text_muted')
             ban_label.pack(padx=5, pady=3)
     
     def create_spell_tracker(self):
@@ -374,7 +353,7 @@ class LiveGameDisplay:
         }
         
         # Tracker container on the right
-        tracker_frame = tk.Frame(self.parent, bg="#1e1e1e")
+        tracker_frame = self.theme.register(tk.Frame(self.parent), bg='bg_primary')
         tracker_frame.pack(side=tk.LEFT, anchor="nw", padx=(10, 20), pady=20)
         
         # Header
@@ -397,12 +376,15 @@ class LiveGameDisplay:
         
         enemy_team = self.sort_by_lane(enemy_team)
         
-        # Store spell tracking data
+        # Store spell tracking data; one scheduler ticks every timer against the game clock
         self.spell_timers = {}
+        self.timer_scheduler = TimerScheduler(tracker_frame, GameClock(self.game_data))
         
         # Create tracker for each enemy
         for player in enemy_team:
             self.create_player_spell_tracker(tracker_frame, player)
+        
+        self.restore_spell_timers()
     
     def create_player_spell_tracker(self, parent, player):
         """Create spell tracker for a single player"""
@@ -415,28 +397,19 @@ class LiveGameDisplay:
         has_cosmic = self.has_cosmic_insight(player)
         
         # Player frame
-        player_frame = tk.Frame(parent, bg="#2d2d2d", relief=tk.RAISED, borderwidth=1)
+        player_frame = self.theme.register(tk.Frame(parent, relief=tk.RAISED, borderwidth=1), bg='bg_secondary')
         player_frame.pack(fill=tk.X, pady=4)
         
-        content_frame = tk.Frame(player_frame, bg="#2d2d2d")
+        content_frame = self.theme.register(tk.Frame(player_frame), bg='bg_secondary')
         content_frame.pack(fill=tk.X, padx=10, pady=8)
         
         # Champion icon
-        icon_path = self.champion_icon_fetcher.get_champion_icon_path(champion_id)
-        if icon_path:
-            try:
-                img = Image.open(icon_path)
-                img = img.resize((40, 40), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                self.icon_references.append(photo)
-                
-                icon_label = tk.Label(content_frame, image=photo, bg="#2d2d2d")
-                icon_label.pack(side=tk.LEFT, padx=(0, 10))
-            except Exception as e:
-                print(f"Error loading champion icon: {e}")
+        if champion_id:
+            icon_label = self.create_champion_icon_label(content_frame, champion_id, (40, 40), bg='bg_secondary')
+            icon_label.pack(side=tk.LEFT, padx=(0, 10))
         
         # Spells container (horizontal)
-        spells_frame = tk.Frame(content_frame, bg="#2d2d2d")
+        spells_frame = self.theme.register(tk.Frame(content_frame), bg='bg_secondary')
         spells_frame.pack(side=tk.LEFT)
         
         # Track both spells
@@ -459,45 +432,51 @@ class LiveGameDisplay:
         cooldown = spell_info['cd_cosmic'] if has_cosmic else spell_info['cd']
         
         # Container for spell icon and timer
-        spell_container = tk.Frame(parent, bg="#2d2d2d")
+        spell_container = self.theme.register(tk.Frame(parent), bg='bg_secondary')
         spell_container.pack(side=tk.LEFT, padx=4)
         
         # Spell icon button
-        spell_path = self.spell_fetcher.get_spell_icon_path(spell_id)
-        if spell_path:
-            try:
-                img = Image.open(spell_path)
-                img = img.resize((36, 36), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                self.icon_references.append(photo)
-                
-                # Create button
-                spell_btn = tk.Label(spell_container, image=photo, bg="#2d2d2d", 
-                                    cursor="hand2", relief=tk.RAISED, borderwidth=2)
-                spell_btn.pack()
-                
-                # Timer label (on top of icon) - make it transparent to clicks
-                timer_label = tk.Label(spell_container, text="", 
-                                      font=("Arial", 12, "bold"), bg="#2d2d2d", fg="#ff4444")
-                timer_label.place(in_=spell_btn, relx=0.5, rely=0.5, anchor="center")
-                
-                # Store references
-                key = f"{player_id}_{spell_id}"
-                self.spell_timers[key] = {
-                    'button': spell_btn,
-                    'timer_label': timer_label,
-                    'original_photo': photo,
-                    'cooldown': cooldown,
-                    'remaining': 0,
-                    'active': False
-                }
-                
-                # Click handler on both button and timer label (so clicks pass through)
-                spell_btn.bind("<Button-1>", lambda e, k=key: self.toggle_spell_timer(k))
-                timer_label.bind("<Button-1>", lambda e, k=key: self.toggle_spell_timer(k))
-                
-            except Exception as e:
-                print(f"Error loading spell icon: {e}")
+        spell_btn = self.create_spell_icon_label(spell_container, spell_id, (36, 36), bg='bg_secondary',
+                                                 cursor="hand2", relief=tk.RAISED, borderwidth=2)
+        spell_btn.pack()
+        
+        # Timer label (on top of icon) - make it transparent to clicks
+        timer_label = self.theme.register(tk.Label(spell_container, text="", 
+                              font=("Arial", 12, "bold")), bg='bg_secondary', fg='accent_red')
+        timer_label.place(in_=spell_btn, relx=0.5, rely=0.5, anchor="center")
+        
+        # Store references
+        key = f"{player_id}_{spell_id}"
+        self.spell_timers[key] = {
+            'button': spell_btn,
+            'timer_label': timer_label,
+            'cooldown': cooldown,
+            'active': False
+        }
+        
+        # Click handler on both button and timer label (so clicks pass through)
+        spell_btn.bind("<Button-1>", lambda e, k=key: self.toggle_spell_timer(k))
+        timer_label.bind("<Button-1>", lambda e, k=key: self.toggle_spell_timer(k))
+    
+    def create_icon_label(self, parent, icon_path, fetch, size, bg='bg_secondary', **options):
+        """Create a label showing a placeholder until the icon has loaded (bg is a theme role)"""
+        label = self.theme.register(tk.Label(parent, image=self.image_loader.placeholder(size), **options), bg=bg)
+        self.image_requests.append((icon_path, fetch, size, lambda photo: label.config(image=photo), label))
+        return label
+    
+    def create_champion_icon_label(self, parent, champion_id, size, **options):
+        """Create a placeholder label for a champion icon"""
+        icon_path = self.champion_icon_fetcher.get_cache_path(champion_id)
+        return self.create_icon_label(parent, icon_path,
+                                      lambda: self.champion_icon_fetcher.get_champion_icon_path(champion_id),
+                                      size, **options)
+    
+    def create_spell_icon_label(self, parent, spell_id, size, **options):
+        """Create a placeholder label for a summoner spell icon"""
+        icon_path = self.spell_fetcher.get_cache_path(spell_id)
+        return self.create_icon_label(parent, icon_path,
+                                      lambda: self.spell_fetcher.get_spell_icon_path(spell_id),
+                                      size, **options)
     
     def toggle_spell_timer(self, key):
         """Toggle spell timer on/off"""
@@ -508,34 +487,45 @@ class LiveGameDisplay:
         if timer_data['active']:
             # Reset timer
             timer_data['active'] = False
-            timer_data['remaining'] = 0
+            self.timer_scheduler.cancel(key)
             timer_data['timer_label'].config(text="")
             timer_data['button'].config(relief=tk.RAISED)
         else:
-            # Start timer
-            timer_data['active'] = True
-            timer_data['remaining'] = timer_data['cooldown']
-            timer_data['button'].config(relief=tk.SUNKEN)
-            self.update_spell_timer(key)
+            self.start_spell_timer(key, duration=timer_data['cooldown'])
+        self.save_spell_timers()
     
-    def update_spell_timer(self, key):
-        """Update spell timer countdown"""
-        timer_data = self.spell_timers.get(key)
-        if not timer_data or not timer_data['active']:
+    def start_spell_timer(self, key, duration=None, end=None):
+        """Start a spell's countdown (duration in seconds, or the game time it ends at)"""
+        timer_data = self.spell_timers[key]
+        timer_data['active'] = True
+        self.theme.register(timer_data['timer_label'], fg='accent_red')
+        timer_data['button'].config(relief=tk.SUNKEN)
+        self.timer_scheduler.start(key, duration, end=end,
+                                   on_change=lambda remaining: timer_data['timer_label'].config(text=str(remaining)),
+                                   on_finish=lambda: self.finish_spell_timer(key))
+    
+    def finish_spell_timer(self, key):
+        """Mark a spell as back up"""
+        timer_data = self.spell_timers[key]
+        timer_data['active'] = False
+        self.theme.register(timer_data['timer_label'], fg='accent_green').config(text="✓")
+        timer_data['button'].config(relief=tk.RAISED)
+        self.save_spell_timers()
+        
+        # Clear checkmark after 2 seconds (unless the timer was restarted)
+        label = timer_data['timer_label']
+        label.after(2000, lambda: not timer_data['active'] and label.winfo_exists() and label.config(text=""))
+    
+    def save_spell_timers(self):
+        """Remember the running timers for a refresh of the same game"""
+        global _saved_spell_timers
+        _saved_spell_timers = (self.game_data.get('gameId'), self.timer_scheduler.get_end_times())
+    
+    def restore_spell_timers(self):
+        """Resume timers saved from an earlier display of this game"""
+        game_id, end_times = _saved_spell_timers
+        if game_id is None or game_id != self.game_data.get('gameId'):
             return
-        
-        if timer_data['remaining'] > 0:
-            # Show remaining time
-            timer_data['timer_label'].config(text=str(timer_data['remaining']))
-            timer_data['remaining'] -= 1
-            
-            # Schedule next update
-            self.parent.after(1000, lambda: self.update_spell_timer(key))
-        else:
-            # Timer finished
-            timer_data['active'] = False
-            timer_data['timer_label'].config(text="✓", fg="#00ff00")
-            timer_data['button'].config(relief=tk.RAISED)
-            
-            # Clear checkmark after 2 seconds
-            self.parent.after(2000, lambda: timer_data['timer_label'].config(text=""))
+        for key, end in end_times.items():
+            if key in self.spell_timers:
+                self.start_spell_timer(key, end=end)
@@ -1,158 +1,148 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from gui.account_card import AccountCard
-from gui.add_account_dialog import AddAccountDialog
-from gui.edit_account_dialog import EditAccountDialog
-from gui.settings_dialog import SettingsDialog
-from gui.ranked_stats_dialog import RankedStatsDialog
-from gui.live_game_display import LiveGameDisplay
-from gui.match_history_display import MatchHistoryDisplay
-from gui.update_dialog import UpdateDialog
+from gui.virtual_account_grid import VirtualAccountGrid
+from gui.theme import get_theme_registry
+from gui.ui_dispatcher import get_ui_dispatcher
+from gui.image_cache import get_image_cache
 from riot_switcher import RiotSwitcher
 from rank_fetcher import RankFetcher
 from rank_icons import RankIcons
 from profile_icon_fetcher import ProfileIconFetcher
-from status_fetcher import StatusFetcher
-from live_game_fetcher import LiveGameFetcher
-from match_history_fetcher import MatchHistoryFetcher
-from update_checker import UpdateChecker
 from version import __version__
-import threading
 import os
-from config import get_api_key, get_region, get_theme_colors
+import time
+from datetime import datetime
+from config import get_api_key, get_region, get_asset_presync
+from ddragon import get_data_dragon
+from profiling import profiled
+from task_service import get_task_service
+from account_index import TIER_ORDER, LEVEL_LABELS
 
 class MainWindow:
+    # Match history archive filters
+    QUEUE_FILTERS = {
+        "All Queues": None,
+        "Ranked (Solo + Flex)": [420, 440],
+        "Ranked Solo/Duo": [420],
+        "Ranked Flex": [440],
+        "Normal": [400, 430, 490],
+        "ARAM": [450],
+    }
+    PERIOD_FILTERS = ["All Time", "Last 7 Days", "Last 30 Days", "Last 90 Days", "This Year"]
+    # Above this many accounts only the cards near the viewport are built
+    VIRTUAL_GRID_THRESHOLD = 48
+    
     def __init__(self, root, account_manager):
         self.root = root
+        self.dispatcher = get_ui_dispatcher(root)  # Background threads post UI updates through this
+        self.tasks = get_task_service(dispatch=self.dispatcher.post)  # Bounded worker pools for fetches
         self.account_manager = account_manager
+        # Start resolving the Data Dragon patch before any icon is needed
+        get_data_dragon()
+        self.asset_sync = None
         self.riot_switcher = RiotSwitcher()
         api_key = get_api_key()
         self.rank_fetcher = RankFetcher(api_key=api_key)
         self.profile_icon_fetcher = ProfileIconFetcher(api_key=api_key)
-        self.status_fetcher = StatusFetcher(api_key=api_key)
-        self.live_game_fetcher = LiveGameFetcher(api_key=api_key)
-        self.match_history_fetcher = MatchHistoryFetcher(api_key=api_key)
-        self.rank_icons = RankIcons()
-        self.account_cards = []
+        # Only needed by the other tabs and background checks; created on first use
+        self._status_fetcher = None
+        self._live_game_fetcher = None
+        self._match_archive = None
+        self._match_history_fetcher = None
+        self.update_checker = None
+        self.rank_icons = RankIcons(get_image_cache())
+        self.account_cards = {}  # account ID -> AccountCard
         self.status_label = None
         self.status_update_job = None
         self.sort_method = "original"  # Track current sort method
         
-        # Theme colors
-        self.colors = get_theme_colors()
-        
-        # Update checker
-        self.update_checker = UpdateChecker("kattitatu/riot-account-manager")
+        # Widgets register their color roles here; switching themes recolors them in place
+        self.theme = get_theme_registry()
+        self.theme.register(self.root, bg='bg_primary')
+        self.theme.add_listener(self.apply_ttk_styles)
         
+        # Only the accounts tab is built up front; network work starts after the first paint
+        # (see start_deferred_tasks)
+        self.built_tabs = set()
+        self.match_history_view = None  # MatchHistoryDisplay / ChampionStatsDisplay currently shown
         self.setup_window_icon()
         self.setup_ui()
         self.refresh_accounts()
+    
+    def start_deferred_tasks(self):
+        """Start the startup work that isn't needed for the first paint"""
+        if get_asset_presync():
+            from asset_sync import AssetSync
+            self.asset_sync = AssetSync()
+            self.asset_sync.sync_async()
         self.update_status()  # Initial status fetch
         self.schedule_status_update()  # Schedule periodic updates
         self.check_for_updates()  # Check for updates on startup
     
+    @property
+    def status_fetcher(self):
+        if self._status_fetcher is None:
+            from status_fetcher import StatusFetcher
+            self._status_fetcher = StatusFetcher(api_key=get_api_key())
+        return self._status_fetcher
+    
+    @property
+    def live_game_fetcher(self):
+        if self._live_game_fetcher is None:
+            from live_game_fetcher import LiveGameFetcher
+            self._live_game_fetcher = LiveGameFetcher(api_key=get_api_key())
+        return self._live_game_fetcher
+    
+    @property
+    def match_archive(self):
+        if self._match_archive is None:
+            from match_archive import MatchArchive
+            self._match_archive = MatchArchive()
+        return self._match_archive
+    
+    @property
+    def match_history_fetcher(self):
+        if self._match_history_fetcher is None:
+            from match_history_fetcher import MatchHistoryFetcher
+            self._match_history_fetcher = MatchHistoryFetcher(api_key=get_api_key(), match_archive=self.match_archive)
+        return self._match_history_fetcher
+    
     def refresh_theme(self):
-        """Refresh the entire UI with new theme colors"""
-        # Update theme colors
-        self.colors = get_theme_colors()
-        
-        # Refresh all UI elements
-        self.refresh_ui_colors()
-        
-        # Refresh account cards
-        self.refresh_accounts()
-        
-        # Refresh match history display if it exists
-        for widget in self.match_history_content.winfo_children():
-            if hasattr(widget, 'refresh_theme'):
-                widget.refresh_theme()
-                break
+        """Switch the UI to the configured theme"""
+        # Registered widgets and ttk styles are recolored in place
+        self.theme.set_theme()
+        
+        # Match history and champion stats draw theme colors into canvases, so they rebuild themselves
+        view = self.match_history_view
+        if view is not None and view.canvas.winfo_exists():
+            view.refresh_theme()
     
-    def refresh_ui_colors(self):
-        """Update all UI element colors with current theme"""
-        # Update root window
-        self.root.configure(bg=self.colors['bg_primary'])
-        
-        # Update tab container
-        for widget in self.root.winfo_children():
-            if isinstance(widget, tk.Frame):
-                widget.configure(bg=self.colors['bg_primary'])
-        
-        # Update notebook styling
+    def apply_ttk_styles(self, colors):
+        """Style the notebook tabs and comboboxes with theme colors"""
         style = ttk.Style()
-        style.configure('TNotebook', background=self.colors['bg_primary'], borderwidth=0)
-        style.configure('TNotebook.Tab', background=self.colors['bg_secondary'], foreground=self.colors['text_primary'])
-        style.map('TNotebook.Tab', background=[('selected', self.colors['accent_blue'])], 
-                 foreground=[('selected', self.colors['text_primary'])])
+        style.configure('TNotebook', background=colors['bg_primary'], borderwidth=0)
+        style.configure('TNotebook.Tab', background=colors['bg_secondary'], foreground=colors['text_primary'], 
+                       padding=[20, 10], font=('Arial', 10), focuscolor='none')
+        style.map('TNotebook.Tab', background=[('selected', colors['accent_blue'])], 
+                 foreground=[('selected', colors['text_primary'])],
+                 focuscolor=[('selected', 'none')])
         
-        # Update combobox styling
+        # Combobox styling
         style.configure('TCombobox', 
-                       fieldbackground=self.colors['bg_primary'], 
-                       background=self.colors['bg_secondary'], 
-                       foreground=self.colors['text_primary'],
-                       arrowcolor=self.colors['text_primary'],
-                       bordercolor=self.colors['border'],
-                       selectbackground=self.colors['accent_blue'])
-        
-        # Update tab backgrounds
-        self.accounts_tab.configure(bg=self.colors['bg_primary'])
-        self.match_history_tab.configure(bg=self.colors['bg_primary'])
-        self.live_game_tab.configure(bg=self.colors['bg_primary'])
-        
-        # Update content areas
-        self.match_history_content.configure(bg=self.colors['bg_primary'])
-        self.live_game_content.configure(bg=self.colors['bg_primary'])
-        
-        # Update status label
-        self.status_label.configure(bg=self.colors['bg_secondary'], fg=self.colors['text_muted'])
-        
-        # Recursively update all child widgets
-        self._update_widget_colors(self.root)
-    
-    def _update_widget_colors(self, widget):
-        """Recursively update widget colors based on their type"""
-        try:
-            widget_class = widget.winfo_class()
-            
-            if widget_class == 'Frame':
-                # Check if it's a button frame or content frame
-                if hasattr(widget, 'master') and widget.master:
-                    parent_class = widget.master.winfo_class()
-                    if 'btn' in str(widget).lower() or 'button' in str(widget).lower():
-                        widget.configure(bg=self.colors['bg_secondary'])
-                    else:
-                        widget.configure(bg=self.colors['bg_primary'])
-                        
-            elif widget_class == 'Label':
-                # Update label colors based on context
-                current_bg = widget.cget('bg')
-                if current_bg in ['#2c2c2c', '#2d2d2d']:
-                    widget.configure(bg=self.colors['bg_secondary'], fg=self.colors['text_primary'])
-                elif current_bg in ['#1e1e1e']:
-                    widget.configure(bg=self.colors['bg_primary'], fg=self.colors['text_primary'])
-                    
-            elif widget_class == 'Button':
-                # Update button colors based on current color
-                current_bg = widget.cget('bg')
-                if current_bg == '#0078d4':
-                    widget.configure(bg=self.colors['accent_blue'], fg=self.colors['text_primary'])
-                elif current_bg == '#28a745':
-                    widget.configure(bg=self.colors['accent_green'], fg=self.colors['text_primary'])
-                elif current_bg in ['#17a2b8', '#6c757d', '#4a4a4a']:
-                    widget.configure(bg=self.colors['bg_tertiary'], fg=self.colors['text_primary'])
-                elif current_bg == '#5b21b6':
-                    widget.configure(bg=self.colors['accent_blue'], fg=self.colors['text_primary'])
-                    
-            elif widget_class == 'Canvas':
-                widget.configure(bg=self.colors['bg_primary'])
-            
-            # Recursively update children
-            for child in widget.winfo_children():
-                self._update_widget_colors(child)
-                
-        except tk.TclError:
-            # Widget might be destroyed, skip it
-            pass
+                       fieldbackground=colors['bg_primary'], 
+                       background=colors['bg_secondary'], 
+                       foreground=colors['text_primary'],
+                       arrowcolor=colors['text_primary'],
+                       bordercolor=colors['border'],
+                       lightcolor=colors['bg_secondary'],
+                       darkcolor=colors['bg_secondary'],
+                       selectbackground=colors['accent_blue'],
+                       selectforeground=colors['text_primary'])
+        style.map('TCombobox', 
+                 fieldbackground=[('readonly', colors['bg_primary'])],
+                 selectbackground=[('readonly', colors['bg_primary'])],
+                 selectforeground=[('readonly', colors['text_primary'])])
     
     def setup_window_icon(self):
         """Setup the window icon"""
@@ -166,91 +156,74 @@ class MainWindow:
     def setup_ui(self):
         """Setup the main UI"""
         # Top bar with buttons - reduced height
-        top_frame = tk.Frame(self.root, bg=self.colors['bg_secondary'], height=45)
+        top_frame = self.theme.register(tk.Frame(self.root, height=45), bg='bg_secondary')
         top_frame.pack(fill=tk.X, side=tk.TOP)
         top_frame.pack_propagate(False)
         
         # Status indicator on the left
-        self.status_label = tk.Label(top_frame, text="● Loading...", 
-                                     font=("Arial", 9, "bold"), bg=self.colors['bg_secondary'], fg=self.colors['text_muted'])
+        self.status_label = self.theme.register(tk.Label(top_frame, text="● Loading...", 
+                                     font=("Arial", 9, "bold")), bg='bg_secondary', fg='text_muted')
         self.status_label.pack(side=tk.LEFT, padx=15, pady=10)
         
         # Version number
-        version_label = tk.Label(top_frame, text=f"v{__version__}", 
-                                font=("Arial", 8), bg=self.colors['bg_secondary'], fg=self.colors['text_muted'])
+        version_label = self.theme.register(tk.Label(top_frame, text=f"v{__version__}", 
+                                font=("Arial", 8)), bg='bg_secondary', fg='text_muted')
         version_label.pack(side=tk.LEFT, padx=(0, 15), pady=10)
         
         # Right side buttons
-        settings_btn = tk.Button(top_frame, text="⚙️ Settings", 
-                           command=self.open_settings,
-                           bg=self.colors['bg_tertiary'], fg=self.colors['text_primary'], font=("Arial", 9),
-                           padx=12, pady=4, relief=tk.FLAT, cursor="hand2")
+        settings_btn = self.theme.register(tk.Button(top_frame, text="⚙️ Settings", 
+                           command=self.open_settings, font=("Arial", 9),
+                           padx=12, pady=4, relief=tk.FLAT, cursor="hand2"), bg='bg_tertiary', fg='text_primary')
         settings_btn.pack(side=tk.RIGHT, padx=(5, 15), pady=10)
         
         # Tab control
-        tab_container = tk.Frame(self.root, bg=self.colors['bg_primary'])
+        tab_container = self.theme.register(tk.Frame(self.root), bg='bg_primary')
         tab_container.pack(fill=tk.BOTH, expand=True)
         
         # Create notebook (tab control)
-        style = ttk.Style()
-        style.theme_use('default')
-        style.configure('TNotebook', background=self.colors['bg_primary'], borderwidth=0)
-        style.configure('TNotebook.Tab', background=self.colors['bg_secondary'], foreground=self.colors['text_primary'], 
-                       padding=[20, 10], font=('Arial', 10), focuscolor='none')
-        style.map('TNotebook.Tab', background=[('selected', self.colors['accent_blue'])], 
-                 foreground=[('selected', self.colors['text_primary'])],
-                 focuscolor=[('selected', 'none')])
-        
-        # Combobox styling
-        style.configure('TCombobox', 
-                       fieldbackground=self.colors['bg_primary'], 
-                       background=self.colors['bg_secondary'], 
-                       foreground=self.colors['text_primary'],
-                       arrowcolor=self.colors['text_primary'],
-                       bordercolor=self.colors['border'],
-                       lightcolor=self.colors['bg_secondary'],
-                       darkcolor=self.colors['bg_secondary'],
-                       selectbackground=self.colors['accent_blue'],
-                       selectforeground=self.colors['text_primary'])
-        style.map('TCombobox', 
-                 fieldbackground=[('readonly', self.colors['bg_primary'])],
-                 selectbackground=[('readonly', self.colors['bg_primary'])],
-                 selectforeground=[('readonly', self.colors['text_primary'])])
+        ttk.Style().theme_use('default')
+        self.apply_ttk_styles(self.theme.colors)
         
         self.notebook = ttk.Notebook(tab_container)
         self.notebook.pack(fill=tk.BOTH, expand=True)
         
         # Accounts Tab
-        self.accounts_tab = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
+        self.accounts_tab = self.theme.register(tk.Frame(self.notebook), bg='bg_primary')
         self.notebook.add(self.accounts_tab, text="Accounts")
         
         # Setup accounts tab content
         self.setup_accounts_tab()
         
-        # Match History Tab
-        self.match_history_tab = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
+        # Match History and Live Game tabs are filled in on first visit
+        self.match_history_tab = self.theme.register(tk.Frame(self.notebook), bg='bg_primary')
         self.notebook.add(self.match_history_tab, text="Match History")
         
-        # Setup match history tab content
-        self.setup_match_history_tab()
-        
-        # Live Game Tab
-        self.live_game_tab = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
+        self.live_game_tab = self.theme.register(tk.Frame(self.notebook), bg='bg_primary')
         self.notebook.add(self.live_game_tab, text="Live Game")
         
-        # Setup live game tab content
-        self.setup_live_game_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+    
+    def on_tab_changed(self, event=None):
+        """Build a tab's contents the first time it is shown"""
+        tab = self.notebook.nametowidget(self.notebook.select())
+        if tab in self.built_tabs:
+            return
+        if tab is self.match_history_tab:
+            self.setup_match_history_tab()
+        elif tab is self.live_game_tab:
+            self.setup_live_game_tab()
+        self.built_tabs.add(tab)
     
     def setup_accounts_tab(self):
         """Setup the accounts tab with buttons and account grid"""
         # Buttons frame at top of accounts tab - reduced height
-        btn_frame = tk.Frame(self.accounts_tab, bg=self.colors['bg_secondary'], height=45)
+        btn_frame = self.theme.register(tk.Frame(self.accounts_tab, height=45), bg='bg_secondary')
         btn_frame.pack(fill=tk.X, side=tk.TOP)
         btn_frame.pack_propagate(False)
         
         # Sort control on the left
-        sort_label = tk.Label(btn_frame, text="Sort by:", 
-                             font=("Arial", 9), bg=self.colors['bg_secondary'], fg=self.colors['text_primary'])
+        sort_label = self.theme.register(tk.Label(btn_frame, text="Sort by:", 
+                             font=("Arial", 9)), bg='bg_secondary', fg='text_primary')
         sort_label.pack(side=tk.LEFT, padx=(15, 8), pady=10)
         
         self.sort_var = tk.StringVar(value="Original Order")
@@ -264,39 +237,78 @@ class MainWindow:
         self.sort_combo.bind("<<ComboboxSelected>>", self.on_sort_changed)
         
         # Buttons on the right
-        add_btn = tk.Button(btn_frame, text="+ Add Account", 
-                           command=self.add_account,
-                           bg=self.colors['accent_blue'], fg=self.colors['text_primary'], font=("Arial", 9),
-                           padx=12, pady=4, relief=tk.FLAT, cursor="hand2")
+        add_btn = self.theme.register(tk.Button(btn_frame, text="+ Add Account", 
+                           command=self.add_account, font=("Arial", 9),
+                           padx=12, pady=4, relief=tk.FLAT, cursor="hand2"), bg='accent_blue', fg='text_primary')
         add_btn.pack(side=tk.RIGHT, padx=(5, 15), pady=10)
         
-        save_session_btn = tk.Button(btn_frame, text="💾 Save Current Session", 
-                           command=self.save_current_session,
-                           bg=self.colors['accent_green'], fg=self.colors['text_primary'], font=("Arial", 9),
-                           padx=12, pady=4, relief=tk.FLAT, cursor="hand2")
+        import_btn = self.theme.register(tk.Button(btn_frame, text="📥 Import", 
+                           command=self.import_accounts, font=("Arial", 9),
+                           padx=12, pady=4, relief=tk.FLAT, cursor="hand2"), bg='bg_tertiary', fg='text_primary')
+        import_btn.pack(side=tk.RIGHT, padx=5, pady=10)
+        
+        save_session_btn = self.theme.register(tk.Button(btn_frame, text="💾 Save Current Session", 
+                           command=self.save_current_session, font=("Arial", 9),
+                           padx=12, pady=4, relief=tk.FLAT, cursor="hand2"), bg='accent_green', fg='text_primary')
         save_session_btn.pack(side=tk.RIGHT, padx=5, pady=10)
         
-        refresh_all_btn = tk.Button(btn_frame, text="🔄 Refresh All", 
-                           command=self.refresh_all_accounts,
-                           bg=self.colors['bg_tertiary'], fg=self.colors['text_primary'], font=("Arial", 9),
-                           padx=12, pady=4, relief=tk.FLAT, cursor="hand2")
+        refresh_all_btn = self.theme.register(tk.Button(btn_frame, text="🔄 Refresh All", 
+                           command=self.refresh_all_accounts, font=("Arial", 9),
+                           padx=12, pady=4, relief=tk.FLAT, cursor="hand2"), bg='bg_tertiary', fg='text_primary')
         refresh_all_btn.pack(side=tk.RIGHT, padx=5, pady=10)
         
+        # Search and filter bar (filters the grid in place on every keystroke)
+        search_frame = self.theme.register(tk.Frame(self.accounts_tab, height=40), bg='bg_secondary')
+        search_frame.pack(fill=tk.X, side=tk.TOP)
+        search_frame.pack_propagate(False)
+        
+        search_label = self.theme.register(tk.Label(search_frame, text="Search:", 
+                                 font=("Arial", 9)), bg='bg_secondary', fg='text_primary')
+        search_label.pack(side=tk.LEFT, padx=(15, 5), pady=8)
+        
+        self.account_search_var = tk.StringVar()
+        search_entry = self.theme.register(tk.Entry(search_frame, textvariable=self.account_search_var,
+                                font=("Arial", 9), width=28, relief=tk.FLAT),
+                                bg='bg_primary', fg='text_primary', insertbackground='text_primary')
+        search_entry.pack(side=tk.LEFT, padx=5, pady=8, ipady=2)
+        self.account_search_var.trace_add("write", lambda *args: self.show_accounts())
+        
+        self.account_filter_vars = {}
+        self.account_filter_combos = {}
+        for facet, label, all_text, width in (("tier", "Tier:", "All Tiers", 12),
+                                              ("region", "Region:", "All Regions", 10),
+                                              ("level", "Level:", "All Levels", 10)):
+            facet_label = self.theme.register(tk.Label(search_frame, text=label, 
+                                    font=("Arial", 9)), bg='bg_secondary', fg='text_primary')
+            facet_label.pack(side=tk.LEFT, padx=(10, 5), pady=8)
+            
+            var = tk.StringVar(value=all_text)
+            combo = ttk.Combobox(search_frame, textvariable=var, state="readonly",
+                                 font=("Arial", 9), width=width, values=[all_text])
+            combo.pack(side=tk.LEFT, padx=5, pady=8)
+            combo.bind("<<ComboboxSelected>>", lambda e: self.show_accounts())
+            self.account_filter_vars[facet] = var
+            self.account_filter_combos[facet] = (combo, all_text)
+        
+        self.account_count_label = self.theme.register(tk.Label(search_frame, text="", 
+                                          font=("Arial", 9)), bg='bg_secondary', fg='text_muted')
+        self.account_count_label.pack(side=tk.RIGHT, padx=15, pady=8)
+        
         # Frame for account grid with canvas for scrolling (no scrollbar)
-        container = tk.Frame(self.accounts_tab, bg=self.colors['bg_primary'])
+        container = self.theme.register(tk.Frame(self.accounts_tab), bg='bg_primary')
         container.pack(fill=tk.BOTH, expand=True)
         
-        self.accounts_canvas = tk.Canvas(container, bg=self.colors['bg_primary'], highlightthickness=0)
-        self.scrollable_frame = tk.Frame(self.accounts_canvas, bg=self.colors['bg_primary'])
+        self.accounts_canvas = self.theme.register(tk.Canvas(container, highlightthickness=0), bg='bg_primary')
+        self.scrollable_frame = self.theme.register(tk.Frame(self.accounts_canvas), bg='bg_primary')
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.accounts_canvas.configure(scrollregion=self.accounts_canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self.on_accounts_frame_configure)
         
-        self.accounts_canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        self.accounts_frame_item = self.accounts_canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.accounts_canvas.pack(fill=tk.BOTH, expand=True)
         
+        # Used instead of scrollable_frame for large account lists
+        self.virtual_grid = VirtualAccountGrid(self.accounts_canvas, self.create_account_card)
+        
         # Mouse wheel scrolling (no scrollbar visible)
         def on_mousewheel(event):
             self.accounts_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
@@ -305,14 +317,16 @@ class MainWindow:
     
     def setup_match_history_tab(self):
         """Setup the match history tab with account selector and refresh"""
+        self.match_history_fetcher  # Open the archive on the main thread before any fetch thread needs it
+        
         # Top control bar
-        control_frame = tk.Frame(self.match_history_tab, bg=self.colors['bg_secondary'], height=45)
+        control_frame = self.theme.register(tk.Frame(self.match_history_tab, height=45), bg='bg_secondary')
         control_frame.pack(fill=tk.X, side=tk.TOP)
         control_frame.pack_propagate(False)
         
         # Account selector label
-        selector_label = tk.Label(control_frame, text="Account:", 
-                                 font=("Arial", 9, "bold"), bg=self.colors['bg_secondary'], fg=self.colors['text_primary'])
+        selector_label = self.theme.register(tk.Label(control_frame, text="Account:", 
+                                 font=("Arial", 9, "bold")), bg='bg_secondary', fg='text_primary')
         selector_label.pack(side=tk.LEFT, padx=(15, 8), pady=10)
         
         # Account dropdown
@@ -328,14 +342,70 @@ class MainWindow:
         self.update_match_history_accounts()
         
         # Refresh button
-        refresh_btn = tk.Button(control_frame, text="🔄 Refresh", 
-                               command=self.refresh_match_history,
-                               bg="#0078d4", fg="white", font=("Arial", 9),
-                               padx=12, pady=4, relief=tk.FLAT, cursor="hand2")
+        refresh_btn = self.theme.register(tk.Button(control_frame, text="🔄 Refresh", 
+                               command=self.refresh_match_history, font=("Arial", 9),
+                               padx=12, pady=4, relief=tk.FLAT, cursor="hand2"), bg='accent_blue', fg='text_primary')
         refresh_btn.pack(side=tk.LEFT, padx=8, pady=10)
         
+        # Filter bar for the local match archive (works offline)
+        filter_frame = self.theme.register(tk.Frame(self.match_history_tab, height=40), bg='bg_secondary')
+        filter_frame.pack(fill=tk.X, side=tk.TOP)
+        filter_frame.pack_propagate(False)
+        
+        champion_label = self.theme.register(tk.Label(filter_frame, text="Champion:", 
+                                 font=("Arial", 9)), bg='bg_secondary', fg='text_primary')
+        champion_label.pack(side=tk.LEFT, padx=(15, 5), pady=8)
+        
+        self.match_filter_champion_var = tk.StringVar(value="All Champions")
+        self.match_filter_champion_combo = ttk.Combobox(filter_frame,
+                                                        textvariable=self.match_filter_champion_var,
+                                                        state="readonly",
+                                                        font=("Arial", 9),
+                                                        width=16,
+                                                        values=["All Champions"])
+        self.match_filter_champion_combo.pack(side=tk.LEFT, padx=5, pady=8)
+        
+        queue_label = self.theme.register(tk.Label(filter_frame, text="Queue:", 
+                              font=("Arial", 9)), bg='bg_secondary', fg='text_primary')
+        queue_label.pack(side=tk.LEFT, padx=(10, 5), pady=8)
+        
+        self.match_filter_queue_var = tk.StringVar(value="All Queues")
+        queue_combo = ttk.Combobox(filter_frame,
+                                   textvariable=self.match_filter_queue_var,
+                                   state="readonly",
+                                   font=("Arial", 9),
+                                   width=18,
+                                   values=list(self.QUEUE_FILTERS.keys()))
+        queue_combo.pack(side=tk.LEFT, padx=5, pady=8)
+        
+        period_label = self.theme.register(tk.Label(filter_frame, text="Period:", 
+                               font=("Arial", 9)), bg='bg_secondary', fg='text_primary')
+        period_label.pack(side=tk.LEFT, padx=(10, 5), pady=8)
+        
+        self.match_filter_period_var = tk.StringVar(value="All Time")
+        period_combo = ttk.Combobox(filter_frame,
+                                    textvariable=self.match_filter_period_var,
+                                    state="readonly",
+                                    font=("Arial", 9),
+                                    width=12,
+                                    values=self.PERIOD_FILTERS)
+        period_combo.pack(side=tk.LEFT, padx=5, pady=8)
+        
+        local_btn = self.theme.register(tk.Button(filter_frame, text="📂 Show Local", 
+                             command=self.show_archived_matches, font=("Arial", 9),
+                             padx=12, pady=2, relief=tk.FLAT, cursor="hand2"), bg='bg_tertiary', fg='text_primary')
+        local_btn.pack(side=tk.LEFT, padx=8, pady=8)
+        
+        champions_btn = self.theme.register(tk.Button(filter_frame, text="🏆 Champions", 
+                                 command=self.show_champion_stats, font=("Arial", 9),
+                                 padx=12, pady=2, relief=tk.FLAT, cursor="hand2"), bg='bg_tertiary', fg='text_primary')
+        champions_btn.pack(side=tk.LEFT, padx=(0, 8), pady=8)
+        
+        self.match_history_account_combo.bind("<<ComboboxSelected>>", lambda e: self.update_match_filter_champions())
+        self.update_match_filter_champions()
+        
         # Content area
-        self.match_history_content = tk.Frame(self.match_history_tab, bg=self.colors['bg_primary'])
+        self.match_history_content = self.theme.register(tk.Frame(self.match_history_tab), bg='bg_primary')
         self.match_history_content.pack(fill=tk.BOTH, expand=True)
         
         # Initial placeholder
@@ -357,6 +427,96 @@ class MainWindow:
         # Select first account by default
         if account_names:
             self.match_history_account_combo.current(0)
+        
+        if hasattr(self, 'match_filter_champion_combo'):
+            self.update_match_filter_champions()
+    
+    def _get_match_history_account(self):
+        """Get the account selected in the match history tab, or None"""
+        selected_name = self.match_history_account_var.get()
+        for acc in self.account_manager.get_all_accounts():
+            if acc.get('display_name', acc.get('username')) == selected_name:
+                return acc
+        return None
+    
+    def update_match_filter_champions(self):
+        """Fill the champion filter with champions archived for the selected account"""
+        account = self._get_match_history_account()
+        puuid = self.match_archive.get_puuid(account.get('riot_id', '')) if account else None
+        
+        self.match_filter_champions = {}
+        if puuid:
+            for champion_id, champion_name, games in self.match_archive.get_champions(puuid):
+                self.match_filter_champions[f"{champion_name} ({games})"] = champion_id
+        
+        self.match_filter_champion_combo['values'] = ["All Champions"] + list(self.match_filter_champions.keys())
+        if self.match_filter_champion_var.get() not in self.match_filter_champions:
+            self.match_filter_champion_var.set("All Champions")
+    
+    def _get_period_start(self, period):
+        """Get the game_creation lower bound (ms) for a period filter, or None"""
+        now = time.time()
+        days = {"Last 7 Days": 7, "Last 30 Days": 30, "Last 90 Days": 90}
+        if period in days:
+            return int((now - days[period] * 86400) * 1000)
+        if period == "This Year":
+            return int(datetime(datetime.now().year, 1, 1).timestamp() * 1000)
+        return None
+    
+    def show_archived_matches(self):
+        """Show matches from the local archive using the selected filters"""
+        from gui.match_history_display import MatchHistoryDisplay
+        account = self._get_match_history_account()
+        if not account:
+            messagebox.showwarning("No Account", "Please select an account first.")
+            return
+        
+        # A network fetch still running would replace this view when it finishes
+        self.tasks.cancel("match_history")
+        
+        selected_name = account.get('display_name', account.get('username'))
+        puuid = self.match_archive.get_puuid(account.get('riot_id', ''))
+        if not puuid:
+            messagebox.showinfo("No Local Matches", 
+                               f"No matches archived for '{selected_name}' yet.\nClick Refresh once to start the local archive.")
+            return
+        
+        filters = {
+            'champion_id': self.match_filter_champions.get(self.match_filter_champion_var.get()),
+            'queue_ids': self.QUEUE_FILTERS.get(self.match_filter_queue_var.get()),
+            'since': self._get_period_start(self.match_filter_period_var.get()),
+        }
+        
+        def load_more(start, callback):
+            # Local queries are fast enough to run inline
+            callback(self.match_archive.query_matches(puuid, limit=MatchHistoryDisplay.PAGE_SIZE,
+                                                      offset=start, **filters), None)
+        
+        matches = self.match_archive.query_matches(puuid, limit=MatchHistoryDisplay.PAGE_SIZE, **filters)
+        self._handle_match_history_result(selected_name, matches, None, load_more)
+    
+    def show_champion_stats(self):
+        """Show per-champion aggregates for the selected account and queue filter"""
+        from gui.champion_stats_display import ChampionStatsDisplay
+        account = self._get_match_history_account()
+        if not account:
+            messagebox.showwarning("No Account", "Please select an account first.")
+            return
+        
+        # A network fetch still running would replace this view when it finishes
+        self.tasks.cancel("match_history")
+        
+        puuid = self.match_archive.get_puuid(account.get('riot_id', ''))
+        if not puuid:
+            messagebox.showinfo("No Local Matches", 
+                               f"No matches archived for '{account.get('display_name')}' yet.\nClick Refresh once to start the local archive.")
+            return
+        
+        # Aggregates are maintained on insert, so this is a direct read
+        queue_ids = self.QUEUE_FILTERS.get(self.match_filter_queue_var.get())
+        stats = self.match_archive.get_champion_stats(puuid, queue_ids)
+        totals = self.match_archive.get_stats(puuid, queue_ids=queue_ids)
+        self.match_history_view = ChampionStatsDisplay(self.match_history_content, stats, totals)
     
     def show_match_history_placeholder(self):
         """Show placeholder message in match history content area"""
@@ -364,13 +524,14 @@ class MainWindow:
         for widget in self.match_history_content.winfo_children():
             widget.destroy()
         
-        placeholder = tk.Label(self.match_history_content, 
+        placeholder = self.theme.register(tk.Label(self.match_history_content, 
                               text="Select an account and click Refresh\nto view match history", 
-                              font=("Arial", 14), bg="#1e1e1e", fg="#888888")
+                              font=("Arial", 14)), bg='bg_primary', fg='text_muted')
         placeholder.pack(expand=True, pady=100)
     
     def refresh_match_history(self):
         """Refresh match history for selected account"""
+        from gui.match_history_display import MatchHistoryDisplay
         selected_name = self.match_history_account_var.get()
         
         if not selected_name or selected_name == "No accounts available":
@@ -401,54 +562,75 @@ class MainWindow:
         for widget in self.match_history_content.winfo_children():
             widget.destroy()
         
-        loading_label = tk.Label(self.match_history_content, 
+        loading_label = self.theme.register(tk.Label(self.match_history_content, 
                                 text=f"Fetching match history for {selected_name}...", 
-                                font=("Arial", 12), bg="#1e1e1e", fg="white")
+                                font=("Arial", 12)), bg='bg_primary', fg='text_primary')
         loading_label.pack(expand=True, pady=100)
         
-        # Fetch match history in background thread
-        def fetch_in_thread():
+        # Fetch match history in the background (supersedes a fetch still running for another account)
+        def fetch(token):
             region = get_region()
-            matches, error = self.match_history_fetcher.fetch_match_history(riot_id, region, count=10)
-            
-            # Update UI in main thread
-            self.root.after(0, lambda: self._handle_match_history_result(selected_name, matches, error))
+            return self.match_history_fetcher.fetch_match_page(
+                riot_id, region, count=MatchHistoryDisplay.PAGE_SIZE, cancel_token=token)
         
-        thread = threading.Thread(target=fetch_in_thread, daemon=True)
-        thread.start()
+        def on_done(result):
+            matches, next_start, error = result
+            self._handle_match_history_result(selected_name, matches, error,
+                                              lambda start, callback: self.load_more_matches(riot_id, start, callback),
+                                              next_start)
+            self.update_match_filter_champions()
+        
+        self.tasks.submit(profiled("match_history", fetch), key="match_history", on_done=on_done)
     
-    def _handle_match_history_result(self, account_name, matches, error):
+    def _handle_match_history_result(self, account_name, matches, error, load_more=None, next_start=None):
         """Handle the match history fetch result"""
+        from gui.match_history_display import MatchHistoryDisplay
         # Clear loading message
         for widget in self.match_history_content.winfo_children():
             widget.destroy()
         
         if error:
             # Show error message
-            error_label = tk.Label(self.match_history_content, 
+            error_label = self.theme.register(tk.Label(self.match_history_content, 
                                   text=f"Error: {error}", 
-                                  font=("Arial", 12), bg="#1e1e1e", fg="#dc3545")
+                                  font=("Arial", 12), fg="#dc3545"), bg='bg_primary')
             error_label.pack(expand=True, pady=100)
         elif not matches:
             # No matches found
-            no_matches_label = tk.Label(self.match_history_content, 
+            no_matches_label = self.theme.register(tk.Label(self.match_history_content, 
                                        text=f"No matches found for {account_name}", 
-                                       font=("Arial", 14), bg="#1e1e1e", fg="#888888")
+                                       font=("Arial", 14)), bg='bg_primary', fg='text_muted')
             no_matches_label.pack(expand=True, pady=100)
         else:
-            # Display match history
-            MatchHistoryDisplay(self.match_history_content, matches)
+            # Display match history; further pages load as the user scrolls
+            self.match_history_view = MatchHistoryDisplay(self.match_history_content, matches,
+                                                          load_more=load_more, next_start=next_start)
+    
+    def load_more_matches(self, riot_id, start, callback):
+        """Fetch the page of matches starting at start in the background"""
+        from gui.match_history_display import MatchHistoryDisplay
+        def fetch(token):
+            region = get_region()
+            return self.match_history_fetcher.fetch_match_page(
+                riot_id, region, count=MatchHistoryDisplay.PAGE_SIZE, start=start, cancel_token=token)
+        
+        def on_done(result):
+            matches, next_start, error = result
+            callback(matches, error, next_start)
+            self.update_match_filter_champions()
+        
+        self.tasks.submit(profiled("match_history_more", fetch), key="match_history", on_done=on_done)
     
     def setup_live_game_tab(self):
         """Setup the live game tab with account selector and refresh"""
         # Top control bar - reduced height
-        control_frame = tk.Frame(self.live_game_tab, bg=self.colors['bg_secondary'], height=45)
+        control_frame = self.theme.register(tk.Frame(self.live_game_tab, height=45), bg='bg_secondary')
         control_frame.pack(fill=tk.X, side=tk.TOP)
         control_frame.pack_propagate(False)
         
         # Account selector label
-        selector_label = tk.Label(control_frame, text="Account:", 
-                                 font=("Arial", 9, "bold"), bg=self.colors['bg_secondary'], fg=self.colors['text_primary'])
+        selector_label = self.theme.register(tk.Label(control_frame, text="Account:", 
+                                 font=("Arial", 9, "bold")), bg='bg_secondary', fg='text_primary')
         selector_label.pack(side=tk.LEFT, padx=(15, 8), pady=10)
         
         # Account dropdown
@@ -464,21 +646,19 @@ class MainWindow:
         self.update_live_game_accounts()
         
         # Refresh button
-        refresh_btn = tk.Button(control_frame, text="🔄 Refresh", 
-                               command=self.refresh_live_game,
-                               bg="#0078d4", fg="white", font=("Arial", 9),
-                               padx=12, pady=4, relief=tk.FLAT, cursor="hand2")
+        refresh_btn = self.theme.register(tk.Button(control_frame, text="🔄 Refresh", 
+                               command=self.refresh_live_game, font=("Arial", 9),
+                               padx=12, pady=4, relief=tk.FLAT, cursor="hand2"), bg='accent_blue', fg='text_primary')
         refresh_btn.pack(side=tk.LEFT, padx=8, pady=10)
         
         # Test button (for dummy data)
-        test_btn = tk.Button(control_frame, text="🧪 Test with Dummy Data", 
-                            command=self.show_dummy_live_game,
-                            bg="#6c757d", fg="white", font=("Arial", 9),
-                            padx=12, pady=4, relief=tk.FLAT, cursor="hand2")
+        test_btn = self.theme.register(tk.Button(control_frame, text="🧪 Test with Dummy Data", 
+                            command=self.show_dummy_live_game, font=("Arial", 9),
+                            padx=12, pady=4, relief=tk.FLAT, cursor="hand2"), bg='bg_tertiary', fg='text_primary')
         test_btn.pack(side=tk.LEFT, padx=5, pady=10)
         
         # Content area (no scrollbar)
-        self.live_game_content = tk.Frame(self.live_game_tab, bg=self.colors['bg_primary'])
+        self.live_game_content = self.theme.register(tk.Frame(self.live_game_tab), bg='bg_primary')
         self.live_game_content.pack(fill=tk.BOTH, expand=True)
         
         # Initial placeholder
@@ -507,9 +687,9 @@ class MainWindow:
         for widget in self.live_game_content.winfo_children():
             widget.destroy()
         
-        placeholder = tk.Label(self.live_game_content, 
+        placeholder = self.theme.register(tk.Label(self.live_game_content, 
                               text="Select an account and click Refresh\nto view live game data", 
-                              font=("Arial", 14), bg="#1e1e1e", fg="#888888")
+                              font=("Arial", 14)), bg='bg_primary', fg='text_muted')
         placeholder.pack(expand=True, pady=100)
     
     def refresh_live_game(self):
@@ -544,21 +724,18 @@ class MainWindow:
         for widget in self.live_game_content.winfo_children():
             widget.destroy()
         
-        loading_label = tk.Label(self.live_game_content, 
+        loading_label = self.theme.register(tk.Label(self.live_game_content, 
                                 text=f"Fetching live game data for {selected_name}...", 
-                                font=("Arial", 12), bg="#1e1e1e", fg="white")
+                                font=("Arial", 12)), bg='bg_primary', fg='text_primary')
         loading_label.pack(expand=True, pady=100)
         
-        # Fetch live game data in background thread
-        def fetch_in_thread():
+        # Fetch live game data in the background (supersedes a fetch still running for another account)
+        def fetch(token):
             region = get_region()
-            game_data, error = self.live_game_fetcher.fetch_live_game(riot_id, region)
-            
-            # Update UI in main thread
-            self.root.after(0, lambda: self._handle_live_game_result(selected_name, game_data, error))
+            return self.live_game_fetcher.fetch_live_game(riot_id, region, cancel_token=token)
         
-        thread = threading.Thread(target=fetch_in_thread, daemon=True)
-        thread.start()
+        self.tasks.submit(profiled("live_game", fetch), key="live_game",
+                          on_done=lambda result: self._handle_live_game_result(selected_name, *result))
     
     def on_sort_changed(self, event=None):
         """Handle sort method change"""
@@ -575,138 +752,172 @@ class MainWindow:
     
     def sort_accounts(self, accounts):
         """Sort accounts based on current sort method"""
-        if self.sort_method == "original":
-            # Sort by ID (original order)
-            return sorted(accounts, key=lambda x: x.get('id', 0))
-        
-        elif self.sort_method == "level":
-            # Sort by summoner level (high to low), None values go to end
-            return sorted(accounts, key=lambda x: (x.get('summoner_level') is None, -(x.get('summoner_level') or 0)))
-        
-        elif self.sort_method == "rank":
-            # Sort by rank (high to low)
-            rank_order = {
-                'CHALLENGER': 9,
-                'GRANDMASTER': 8,
-                'MASTER': 7,
-                'DIAMOND': 6,
-                'EMERALD': 5,
-                'PLATINUM': 4,
-                'GOLD': 3,
-                'SILVER': 2,
-                'BRONZE': 1,
-                'IRON': 0,
-                'Unranked': -1
-            }
-            
-            division_order = {'I': 4, 'II': 3, 'III': 2, 'IV': 1}
-            
-            def rank_key(account):
-                rank_str = account.get('rank', 'Unranked')
-                
-                # Handle "Unranked" or None
-                if not rank_str or rank_str == 'Unranked':
-                    return (-1, 0, 0)
-                
-                # Parse rank string (e.g., "GOLD II" or "MASTER")
-                parts = rank_str.split()
-                tier = parts[0] if parts else 'Unranked'
-                division = parts[1] if len(parts) > 1 else 'I'
-                
-                # Get LP from ranked_stats if available
-                lp = 0
-                ranked_stats = account.get('ranked_stats')
-                if ranked_stats and isinstance(ranked_stats, dict):
-                    lp = ranked_stats.get('lp', 0)
-                
-                tier_value = rank_order.get(tier, -1)
-                division_value = division_order.get(division, 0)
-                
-                return (tier_value, division_value, lp)
-            
-            return sorted(accounts, key=rank_key, reverse=True)
-        
-        return accounts
+        # The index keeps every mode's order up to date, so this is just a lookup
+        by_id = {account["id"]: account for account in accounts}
+        return [by_id[account_id] for account_id in self.account_manager.index.sorted_ids(self.sort_method)
+                if account_id in by_id]
+    
+    def on_accounts_frame_configure(self, event=None):
+        """Fit the scroll region to the account grid frame"""
+        if not self.virtual_grid.active:
+            self.accounts_canvas.configure(scrollregion=self.accounts_canvas.bbox("all"))
+    
+    def create_account_card(self, parent, account):
+        """Create an AccountCard wired to this window's actions"""
+        return AccountCard(
+            parent,
+            account,
+            on_switch=self.switch_account,
+            on_edit=self.edit_account,
+            on_delete=self.delete_account,
+            on_save_session=self.save_session_for_account,
+            on_refresh_rank=self.refresh_rank,
+            on_show_stats=self.show_ranked_stats,
+            is_active=False,
+            rank_icons=self.rank_icons,
+            profile_icon_fetcher=self.profile_icon_fetcher
+        )
     
     def refresh_accounts(self):
         """Refresh the account grid"""
-        # Clear existing cards
-        for card in self.account_cards:
-            card.destroy()
-        self.account_cards.clear()
+        self.update_account_filter_values()
+        self.show_accounts()
         
-        # Get all accounts
+        # Update dropdowns in other tabs
+        if hasattr(self, 'live_game_account_combo'):
+            self.update_live_game_accounts()
+        if hasattr(self, 'match_history_account_combo'):
+            self.update_match_history_accounts()
+    
+    def update_account_filter_values(self):
+        """Offer the facet values the current accounts have in the filter dropdowns"""
+        index = self.account_manager.index
+        default_region = get_region()
+        values = {
+            "tier": [tier for tier in TIER_ORDER if tier in index.facets["tier"]],
+            "region": sorted({region or default_region for region in index.facet_values("region")}),
+            "level": [label for label in LEVEL_LABELS if label in index.facets["level"]],
+        }
+        for facet, (combo, all_text) in self.account_filter_combos.items():
+            combo.configure(values=[all_text] + values[facet])
+            if self.account_filter_vars[facet].get() not in combo.cget("values"):
+                self.account_filter_vars[facet].set(all_text)
+    
+    def get_filtered_accounts(self):
+        """Accounts matching the search bar and facet filters"""
         accounts = self.account_manager.get_all_accounts()
-        
-        if not accounts:
-            return
-        
-        # Sort accounts based on current method
-        accounts = self.sort_accounts(accounts)
+        query = self.account_search_var.get().strip()
+        facets = {facet: var.get() for facet, var in self.account_filter_vars.items()
+                  if var.get() != self.account_filter_combos[facet][1]}
+        if not query and not facets:
+            return accounts
+        
+        ids = self.account_manager.search_accounts(query, default_region=get_region(), **facets)
+        return [account for account in accounts if account["id"] in ids]
+    
+    def show_accounts(self):
+        """Lay out the (sorted, filtered) accounts, reusing existing cards"""
+        all_accounts = self.account_manager.get_all_accounts()
+        accounts = self.sort_accounts(self.get_filtered_accounts())
+        if len(accounts) < len(all_accounts):
+            self.account_count_label.configure(text=f"{len(accounts)} of {len(all_accounts)} accounts")
+        else:
+            self.account_count_label.configure(text=f"{len(all_accounts)} accounts")
+        
+        # The mode follows the total count so filtering doesn't switch grids back and forth
+        if len(all_accounts) > self.VIRTUAL_GRID_THRESHOLD:
+            # Switch to the virtualized grid
+            for card in self.account_cards.values():
+                card.destroy()
+            self.account_cards.clear()
+            self.accounts_canvas.itemconfigure(self.accounts_frame_item, state="hidden")
+            self.virtual_grid.show(accounts)
+        else:
+            if self.virtual_grid.active:
+                self.virtual_grid.hide()
+                self.accounts_canvas.itemconfigure(self.accounts_frame_item, state="normal")
+            self.reconcile_account_cards(accounts, all_accounts)
+    
+    def reconcile_account_cards(self, accounts, all_accounts):
+        """
+        Reconcile the account grid with the (sorted) account list
+
+        Cards are keyed by account ID: new accounts get a card, deleted ones
+        lose theirs, cards whose displayed data changed rebuild in place and
+        the rest are only moved if their grid position changed. Cards of
+        accounts filtered out of the list are hidden, not destroyed.
+        
+        Args:
+            accounts: Sorted accounts to show
+            all_accounts: Every account (cards of the others are destroyed)
+        """
+        # Remove cards of deleted accounts, hide those filtered out
+        existing_ids = {account["id"] for account in all_accounts}
+        shown_ids = {account["id"] for account in accounts}
+        for account_id in list(self.account_cards):
+            if account_id not in existing_ids:
+                self.account_cards.pop(account_id).destroy()
+            elif account_id not in shown_ids and self.account_cards[account_id].grid_position is not None:
+                self.account_cards[account_id].grid_remove()
+                self.account_cards[account_id].grid_position = None
         
         # Determine optimal number of columns based on account count
-        num_accounts = len(accounts)
-        if num_accounts == 1:
-            columns = 1
-        elif num_accounts == 2:
-            columns = 2
-        elif num_accounts == 3:
-            columns = 3
-        else:
-            columns = 4
+        columns = min(max(len(accounts), 1), 4)
         
-        # Create grid of account cards
+        # Place (and create or update) the card for each account
         for idx, account in enumerate(accounts):
-            row = idx // columns
-            col = idx % columns
+            position = (idx // columns, idx % columns)
+            card = self.account_cards.get(account["id"])
+            
+            if card is None:
+                card = self.create_account_card(self.scrollable_frame, account)
+                self.account_cards[account["id"]] = card
+            else:
+                card.update_account(account)
             
-            card = AccountCard(
-                self.scrollable_frame,
-                account,
-                on_switch=lambda acc=account: self.switch_account(acc),
-                on_edit=lambda acc=account: self.edit_account(acc),
-                on_delete=lambda acc=account: self.delete_account(acc),
-                on_save_session=lambda acc=account: self.save_session_for_account(acc),
-                on_refresh_rank=lambda acc=account: self.refresh_rank(acc),
-                on_show_stats=lambda acc=account: self.show_ranked_stats(acc),
-                is_active=False,
-                rank_icons=self.rank_icons,
-                profile_icon_fetcher=self.profile_icon_fetcher
-            )
-            card.grid(row=row, column=col, padx=10, pady=10, sticky="ew")
-            self.account_cards.append(card)
+            if card.grid_position != position:
+                card.grid(row=position[0], column=position[1], padx=10, pady=10, sticky="ew")
+                card.grid_position = position
         
         # Configure grid weights for equal distribution
-        for i in range(columns):
-            self.scrollable_frame.grid_columnconfigure(i, weight=1, uniform="col")
-        
-        # Update dropdowns in other tabs
-        if hasattr(self, 'live_game_account_combo'):
-            self.update_live_game_accounts()
-        if hasattr(self, 'match_history_account_combo'):
-            self.update_match_history_accounts()
+        for i in range(4):
+            if i < columns:
+                self.scrollable_frame.grid_columnconfigure(i, weight=1, uniform="col")
+            else:
+                self.scrollable_frame.grid_columnconfigure(i, weight=0, uniform="")
+        self.on_accounts_frame_configure()
     
     def open_settings(self):
         """Open settings dialog"""
+        from gui.settings_dialog import SettingsDialog
         dialog = SettingsDialog(self.root, theme_callback=self.refresh_theme)
         self.root.wait_window(dialog.dialog)
         # Reload API key and fetchers in case settings changed
         api_key = get_api_key()
         self.rank_fetcher = RankFetcher(api_key=api_key)
-        self.status_fetcher = StatusFetcher(api_key=api_key)
-        self.live_game_fetcher = LiveGameFetcher(api_key=api_key)
-        self.match_history_fetcher = MatchHistoryFetcher(api_key=api_key)
+        self._status_fetcher = None
+        self._live_game_fetcher = None
+        self._match_history_fetcher = None
         # Refresh status with new settings
         self.update_status()
     
     def add_account(self):
         """Open add account dialog"""
+        from gui.add_account_dialog import AddAccountDialog
         dialog = AddAccountDialog(self.root, self.account_manager)
         self.root.wait_window(dialog.dialog)
         self.refresh_accounts()
     
+    def import_accounts(self):
+        """Open bulk import dialog"""
+        from gui.bulk_import_dialog import BulkImportDialog
+        dialog = BulkImportDialog(self.root, self.account_manager)
+        self.root.wait_window(dialog.dialog)
+        self.refresh_accounts()
+    
     def edit_account(self, account):
         """Open edit account dialog"""
+        from gui.edit_account_dialog import EditAccountDialog
         dialog = EditAccountDialog(self.root, self.account_manager, account)
         self.root.wait_window(dialog.dialog)
         self.refresh_accounts()
@@ -720,6 +931,7 @@ class MainWindow:
     
     def show_ranked_stats(self, account):
         """Show ranked stats dialog"""
+        from gui.ranked_stats_dialog import RankedStatsDialog
         dialog = RankedStatsDialog(self.root, account)
         self.root.wait_window(dialog.dialog)
     
@@ -748,17 +960,20 @@ class MainWindow:
                                font=("Arial", 9), bg="#2d2d2d", fg="#aaaaaa")
         status_label.pack(pady=10)
         
-        def refresh_all_in_thread():
+        def show_progress(idx, name):
+            progress_label.config(text=f"Refreshing {idx + 1}/{len(accounts)}...")
+            status_label.config(text=f"Fetching data for {name}")
+        
+        def refresh_all(token):
             total = len(accounts)
             for idx, account in enumerate(accounts):
                 riot_id = account.get('riot_id')
                 if not riot_id:
                     continue
+                token.check()
                 
-                # Update progress
-                self.root.after(0, lambda i=idx, name=account['display_name']: 
-                               progress_label.config(text=f"Refreshing {i+1}/{total}...") or
-                               status_label.config(text=f"Fetching data for {name}"))
+                # Update progress (only the latest tick per frame is drawn)
+                self.dispatcher.post(show_progress, idx, account['display_name'], key=(progress_dialog, "progress"))
                 
                 # Fetch data
                 rank, error, ranked_stats = self.rank_fetcher.fetch_rank(riot_id)
@@ -776,20 +991,29 @@ class MainWindow:
                     updates['ranked_stats'] = ranked_stats
                 
                 if updates:
-                    self.account_manager.update_account(account["id"], **updates)
-            
+                    # Applied on the main thread, which also reads the accounts and their search index
+                    self.dispatcher.post(lambda account_id=account["id"], updates=updates:
+                                         self.account_manager.update_account(account_id, **updates))
+            return total
+        
+        def on_done(total):
             # Close dialog and refresh UI
-            self.root.after(0, lambda: progress_dialog.destroy())
-            self.root.after(0, lambda: self.refresh_accounts())
-            self.root.after(0, lambda: messagebox.showinfo("Success", f"Refreshed {total} accounts!"))
+            progress_dialog.destroy()
+            self.refresh_accounts()
+            messagebox.showinfo("Success", f"Refreshed {total} accounts!")
         
-        # Start in background thread
-        thread = threading.Thread(target=refresh_all_in_thread, daemon=True)
-        thread.start()
+        def on_close():
+            # Stop after the account being fetched; what's refreshed so far is kept
+            self.tasks.cancel("refresh_all")
+            progress_dialog.destroy()
+            self.dispatcher.post(self.refresh_accounts)
+        
+        progress_dialog.protocol("WM_DELETE_WINDOW", on_close)
+        self.tasks.submit(profiled("refresh_all", refresh_all), key="refresh_all", on_done=on_done)
     
     def switch_account(self, account):
         """Switch to selected account"""
-        success, message = self.riot_switcher.switch_account(
+        success, message = profiled("switch_account", self.riot_switcher.switch_account)(
             account["username"]
         )
         
@@ -864,19 +1088,18 @@ class MainWindow:
         tk.Label(loading_dialog, text=f"Fetching data for {riot_id}...", 
                 font=("Arial", 10), bg="#2d2d2d", fg="white").pack(pady=30)
         
-        def fetch_in_thread():
+        def fetch(token):
             # Fetch rank and stats
             rank, error, ranked_stats = self.rank_fetcher.fetch_rank(riot_id)
+            token.check()
             
             # Fetch profile icon and summoner level
             profile_icon_id, summoner_level = self.profile_icon_fetcher.fetch_profile_data(riot_id)
-            
-            # Update UI in main thread
-            self.root.after(0, lambda: self._handle_rank_result(account, rank, error, profile_icon_id, summoner_level, ranked_stats, loading_dialog))
+            return rank, error, profile_icon_id, summoner_level, ranked_stats
         
-        # Start fetching in background thread
-        thread = threading.Thread(target=fetch_in_thread, daemon=True)
-        thread.start()
+        # Start fetching in the background
+        self.tasks.submit(profiled("refresh_rank", fetch), key=("refresh_rank", account["id"]),
+                          on_done=lambda result: self._handle_rank_result(account, *result, loading_dialog))
     
     def _handle_rank_result(self, account, rank, error, profile_icon_id, summoner_level, ranked_stats, loading_dialog):
         """Handle the rank, profile icon, summoner level, and ranked stats fetch result"""
@@ -912,17 +1135,14 @@ class MainWindow:
 
     def update_status(self):
         """Update server status display"""
-        def fetch_status():
+        def fetch_status(token):
             region = get_region()
             status, incidents, maintenances = self.status_fetcher.fetch_status(region)
-            region_name = self.status_fetcher.get_region_name(region)
-            
-            # Update UI in main thread
-            self.root.after(0, lambda: self._update_status_display(region_name, status, incidents, maintenances))
+            return self.status_fetcher.get_region_name(region), status, incidents, maintenances
         
-        # Fetch in background thread
-        thread = threading.Thread(target=fetch_status, daemon=True)
-        thread.start()
+        # Fetch in the background
+        self.tasks.submit(fetch_status, key="server_status", pool="background",
+                          on_done=lambda result: self._update_status_display(*result))
     
     def _update_status_display(self, region_name, status, incidents, maintenances):
         """Update the status label with fetched data"""
@@ -1088,22 +1308,23 @@ class MainWindow:
         for widget in self.live_game_content.winfo_children():
             widget.destroy()
         
-        no_game_label = tk.Label(self.live_game_content, 
+        no_game_label = self.theme.register(tk.Label(self.live_game_content, 
                                 text=f"{account_name} is not currently in a game", 
-                                font=("Arial", 14), bg="#1e1e1e", fg="#888888")
+                                font=("Arial", 14)), bg='bg_primary', fg='text_muted')
         no_game_label.pack(expand=True, pady=100)
     
     def _handle_live_game_result(self, account_name, game_data, error):
         """Handle the live game fetch result"""
+        from gui.live_game_display import LiveGameDisplay
         # Clear loading message
         for widget in self.live_game_content.winfo_children():
             widget.destroy()
         
         if error:
             # Show error message
-            error_label = tk.Label(self.live_game_content, 
+            error_label = self.theme.register(tk.Label(self.live_game_content, 
                                   text=f"Error: {error}", 
-                                  font=("Arial", 12), bg="#1e1e1e", fg="#dc3545")
+                                  font=("Arial", 12), fg="#dc3545"), bg='bg_primary')
             error_label.pack(expand=True, pady=100)
         elif not game_data:
             # Not in game
@@ -1114,6 +1335,9 @@ class MainWindow:
 
     def show_dummy_live_game(self):
         """Show dummy live game data for testing"""
+        from gui.live_game_display import LiveGameDisplay
+        self.tasks.cancel("live_game")  # Don't let a running fetch replace the dummy game
+        
         # Create realistic dummy game data
         dummy_data = {
             'gameQueueConfigId': 420,  # Ranked Solo/Duo
@@ -1273,7 +1497,11 @@ class MainWindow:
 
     def check_for_updates(self):
         """Check for updates in background"""
-        def check():
+        from update_checker import UpdateChecker
+        if self.update_checker is None:
+            self.update_checker = UpdateChecker("kattitatu/riot-account-manager")
+        
+        def check(token):
             try:
                 print("Checking for updates...")
                 has_update, latest_version, download_url, release_notes, exe_url = self.update_checker.check_for_updates()
@@ -1282,7 +1510,7 @@ class MainWindow:
                 if has_update:
                     print("Update available! Showing dialog...")
                     # Show update dialog on main thread
-                    self.root.after(0, lambda: self.show_update_dialog(latest_version, download_url, release_notes, exe_url))
+                    self.dispatcher.post(self.show_update_dialog, latest_version, download_url, release_notes, exe_url)
                 else:
                     print("No update available")
             except Exception as e:
@@ -1290,10 +1518,10 @@ class MainWindow:
                 import traceback
                 traceback.print_exc()
         
-        # Run check in background thread
-        thread = threading.Thread(target=check, daemon=True)
-        thread.start()
+        # Run check in the background
+        self.tasks.submit(check, key="update_check", pool="background")
     
     def show_update_dialog(self, latest_version, download_url, release_notes, exe_url):
         """Show update notification dialog"""
+        from gui.update_dialog import UpdateDialog
         UpdateDialog(self.root, __version__, latest_version, download_url, release_notes, self.update_checker, exe_url)
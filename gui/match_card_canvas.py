@@ -0,0 +1,192 @@
+"""
+Canvas match card
+Draws a whole match card (text, icons, item slots, team lists) on one
+tk.Canvas instead of a tree of Frames and Labels, with op.gg links as
+clickable text items
+"""
+import tkinter as tk
+
+# Layout (pixels inside the card)
+PAD_X = 15
+PAD_Y = 12
+WIDTH = 700
+HEIGHT = 144
+INFO_WIDTH = 110  # Mode / time / result / duration column
+CHAMPION_X = PAD_X + INFO_WIDTH + 15
+SPELLS_X = CHAMPION_X + 64 + 5
+STATS_X = SPELLS_X + 32 + 5
+ITEMS_Y = PAD_Y + 64 + 15
+ITEM_SIZE = 28
+TEAMS_X = 440
+TEAM_WIDTH = 110
+TEAM_ROW_HEIGHT = 24
+NAME_LENGTH = 12  # Longer summoner names are truncated
+
+
+class MatchCardCanvas(tk.Canvas):
+    def __init__(self, parent, display, match):
+        """
+        Args:
+            parent: Widget to create the card in
+            display: MatchHistoryDisplay providing colors, icon loading and helpers
+            match: Match summary to draw
+        """
+        self.display = display
+        self.match = match
+        colors = display.colors
+
+        win = match.get('win', False)
+        self.bg_color = colors['win_bg'] if win else colors['loss_bg']
+        border_color = colors['win_border'] if win else colors['loss_border']
+
+        super().__init__(parent, width=WIDTH, height=HEIGHT, bg=self.bg_color,
+                         highlightbackground=border_color, highlightthickness=2)
+
+        self.draw_game_info(border_color)
+        self.draw_champion()
+        self.draw_stats()
+        self.draw_items(match.get('items', []))
+        self.draw_teams()
+
+    def draw_icon(self, x, y, asset, fetch, size, placeholder_color=None):
+        """Draw a placeholder image that is swapped for the icon once it has loaded"""
+        item = self.create_image(x, y, image=self.display.image_loader.placeholder(size, placeholder_color),
+                                 anchor="nw")
+        self.display.image_requests.append((asset, fetch, size,
+                                            lambda photo: self.itemconfig(item, image=photo), self))
+        return item
+
+    def draw_game_info(self, result_color):
+        """Left column: game mode, time ago, result and duration"""
+        match = self.match
+        self.create_text(PAD_X, PAD_Y, text=match.get('game_mode', 'Unknown'), anchor="nw",
+                         font=("Arial", 12, "bold"), fill="#5b9bd5")
+        self.create_text(PAD_X, PAD_Y + 22, text=self.display.get_time_ago(match.get('game_creation', 0)),
+                         anchor="nw", font=("Arial", 10), fill="#888888")
+        self.create_line(PAD_X, PAD_Y + 44, PAD_X + INFO_WIDTH, PAD_Y + 44, fill="#444444")
+
+        result_text = "Victory" if match.get('win', False) else "Defeat"
+        self.create_text(PAD_X, PAD_Y + 52, text=result_text, anchor="nw",
+                         font=("Arial", 14, "bold"), fill=result_color)
+
+        duration = match.get('game_duration', 0)
+        self.create_text(PAD_X, PAD_Y + 78, text=f"{duration // 60}m {duration % 60}s", anchor="nw",
+                         font=("Arial", 10), fill="#888888")
+
+    def draw_champion(self):
+        """Champion icon with level badge, and summoner spells"""
+        display = self.display
+        match = self.match
+        champion_id = match.get('champion_id')
+        champion_name = match.get('champion_name', 'Unknown')
+        champion_level = match.get('champion_level', 0)
+
+        if champion_id:
+            self.draw_icon(CHAMPION_X, PAD_Y, display.get_icon_path('champion', champion_id),
+                           lambda: display.get_champion_icon_path(champion_id, champion_name),
+                           (64, 64), "#333333")
+
+            if champion_level > 0:
+                self.create_oval(CHAMPION_X + 38, PAD_Y + 38, CHAMPION_X + 64, PAD_Y + 64,
+                                 fill="#1a1a1a", outline="#444444", width=1)
+                self.create_text(CHAMPION_X + 51, PAD_Y + 51, text=str(champion_level),
+                                 font=("Arial", 11, "bold"), fill="#f0e6d2")
+
+        y = PAD_Y
+        for spell_id in (match.get('summoner1_id'), match.get('summoner2_id')):
+            if spell_id:
+                self.draw_icon(SPELLS_X, y, display.get_icon_path('spell', spell_id),
+                               lambda spell_id=spell_id: display.get_spell_icon_path(spell_id), (32, 32))
+                y += 32
+
+    def draw_stats(self):
+        """KDA (deaths in red) with ratio, and CS per minute"""
+        match = self.match
+        kills = match.get('kills', 0)
+        deaths = match.get('deaths', 0)
+        assists = match.get('assists', 0)
+        cs = match.get('cs', 0)
+
+        # Each part starts where the previous one ends
+        x = STATS_X
+        y = PAD_Y + 14
+        font = ("Arial", 12, "bold")
+        for text, color in ((str(kills), "white"), (" / ", "white"), (str(deaths), "#ff4444"),
+                            (" / ", "white"), (str(assists), "white")):
+            item = self.create_text(x, y, text=text, anchor="w", font=font, fill=color)
+            x = self.bbox(item)[2]
+
+        kda_ratio = (kills + assists) / deaths if deaths > 0 else kills + assists
+        self.create_text(x + 10, y, text=f"{kda_ratio:.2f}:1 KDA", anchor="w",
+                         font=("Arial", 10), fill=self.display.get_kda_color(kda_ratio))
+
+        game_duration = match.get('game_duration', 0)
+        cs_per_min = (cs * 60) / game_duration if game_duration > 0 else 0
+        cs_text = f"CS {cs} ({cs_per_min:.1f})" if cs_per_min > 0 else f"CS {cs}"
+        self.create_text(STATS_X, PAD_Y + 40, text=cs_text, anchor="w", font=("Arial", 10), fill="#aaaaaa")
+
+    def draw_items(self, items):
+        """Six item slots, a separator and the trinket slot"""
+        display = self.display
+        x = CHAMPION_X
+        for i in range(7):
+            if i == 6:
+                # Separator before the trinket
+                self.create_rectangle(x + 3, ITEMS_Y, x + 5, ITEMS_Y + ITEM_SIZE, fill="#555555", width=0)
+                x += 8
+
+            item_id = items[i] if i < len(items) else 0
+            if item_id:
+                # Looks like an empty slot until the icon has loaded
+                self.draw_icon(x + 1, ITEMS_Y, display.get_icon_path('items', item_id),
+                               lambda item_id=item_id: display.get_item_icon_path(item_id),
+                               (ITEM_SIZE, ITEM_SIZE), "#333333")
+            else:
+                self.create_rectangle(x + 1, ITEMS_Y, x + 1 + ITEM_SIZE, ITEMS_Y + ITEM_SIZE,
+                                      fill="#333333", width=0)
+            x += ITEM_SIZE + 2
+
+    def draw_teams(self):
+        """Player's team and enemy team, sorted by lane, with op.gg links"""
+        display = self.display
+        blue_team = display.sort_by_lane(self.match.get('blue_team', []))
+        red_team = display.sort_by_lane(self.match.get('red_team', []))
+        if self.match.get('player_team_id') == 100:
+            teams = (blue_team, red_team)
+        else:
+            teams = (red_team, blue_team)
+
+        separator_x = TEAMS_X + TEAM_WIDTH + 8
+        self.create_rectangle(separator_x, PAD_Y, separator_x + 2, PAD_Y + 5 * TEAM_ROW_HEIGHT,
+                              fill="#444444", width=0)
+
+        for x, team in zip((TEAMS_X, separator_x + 10), teams):
+            for row, player in enumerate(team):
+                self.draw_team_player(x, PAD_Y + row * TEAM_ROW_HEIGHT, player)
+
+    def draw_team_player(self, x, y, player):
+        """Small champion icon and clickable summoner name"""
+        display = self.display
+        champion_id = player.get('champion_id')
+        champion_name = player.get('champion_name', '')
+        if champion_id:
+            self.draw_icon(x, y, display.get_icon_path('champion', champion_id),
+                           lambda: display.get_champion_icon_path(champion_id, champion_name), (24, 24))
+
+        summoner_name = player.get('summoner_name', 'Unknown')
+        riot_id = player.get('riot_id', summoner_name)
+        is_player = player.get('is_player', False)
+
+        display_name = summoner_name
+        if len(display_name) > NAME_LENGTH:
+            display_name = display_name[:NAME_LENGTH] + "..."
+
+        name_color = "#00bfff" if is_player else "#5b9bd5"  # Blue for clickable links
+        name_font = ("Arial", 8, "bold", "underline") if is_player else ("Arial", 8, "underline")
+        item = self.create_text(x + 29, y + TEAM_ROW_HEIGHT // 2, text=display_name, anchor="w",
+                                font=name_font, fill=name_color)
+
+        # Clickable like a link
+        self.tag_bind(item, "<Button-1>", lambda e: display.open_opgg(riot_id))
+        self.tag_bind(item, "<Enter>", lambda e: self.configure(cursor="hand2"))
+        self.tag_bind(item, "<Leave>", lambda e: self.configure(cursor=""))
@@ -3,21 +3,45 @@ Match history display component
 """
 import tkinter as tk
 from datetime import datetime
-from PIL import Image, ImageTk
 import os
 import requests
 import webbrowser
 from champion_data import get_champion_roles
-from config import get_theme_colors
+from config import get_theme_colors, get_icon_source, get_match_card_style
+from ddragon import get_data_dragon
+from sprite_sheets import get_sprite_sheets, get_icon_cache_path
+from static_data import get_static_data
+from asset_pack import get_asset_store
+from gui.image_loader import get_image_loader
+from gui.match_card_canvas import MatchCardCanvas
 
 class MatchHistoryDisplay:
-    def __init__(self, parent, matches):
+    PAGE_SIZE = 10  # Matches requested per load_more call
+    
+    def __init__(self, parent, matches, load_more=None, next_start=None):
+        """
+        Args:
+            parent: Frame to fill
+            matches: Initial page of match summaries
+            load_more: Optional callable(start, callback) that fetches the page of
+                matches starting at index start in the background and calls
+                callback(matches, error, next_start=None) on the main thread
+            next_start: Index the next page starts at, when the source can skip
+                entries (defaults to len(matches))
+        """
         self.parent = parent
-        self.matches = matches
-        self.champion_icons = {}  # Cache for champion icons
-        self.small_champion_icons = {}  # Cache for small champion icons
-        self.item_icons = {}  # Cache for item icons
-        self.spell_icons = {}  # Cache for summoner spell icons
+        self.matches = list(matches)
+        self.load_more = load_more
+        self.next_start = len(self.matches) if next_start is None else next_start
+        self.has_more = load_more is not None and self.next_start >= self.PAGE_SIZE
+        self.loading_more = False
+        self.image_loader = get_image_loader(parent)  # Loads icons off the main thread
+        self.image_requests = []  # Icons the cards being built need, loaded as one batch
+        self.slots = []  # One frame per match reached so far; holds its card while near the viewport
+        self.status_label = None  # "Loading more..." / error line below the cards
+        self.update_pending = False
+        self.use_sprites = get_icon_source() == 'sprites'
+        self.card_style = get_match_card_style()
         
         # Get theme colors
         self.colors = get_theme_colors()
@@ -65,9 +89,13 @@ class MatchHistoryDisplay:
         def on_canvas_configure(event):
             canvas_width = event.width
             self.canvas.coords(self.canvas.find_all()[0], canvas_width // 2, 0)
+            self.schedule_update()
         
         self.canvas.bind("<Configure>", on_canvas_configure)
         
+        # Build and release cards as the view scrolls
+        self.canvas.configure(yscrollcommand=lambda *args: self.schedule_update())
+        
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Mouse wheel scrolling
@@ -77,7 +105,10 @@ class MatchHistoryDisplay:
         self.canvas.bind_all("<MouseWheel>", on_mousewheel)
     
     def display_matches(self):
-        """Display all matches"""
+        """Display the first screenful of matches; the rest are built on scroll"""
+        self.slots = []
+        self.status_label = None
+        
         if not self.matches:
             no_matches = tk.Label(self.scrollable_frame, 
                                  text="No matches found", 
@@ -85,10 +116,134 @@ class MatchHistoryDisplay:
             no_matches.pack(pady=50)
             return
         
-        for idx, match in enumerate(self.matches):
-            self.create_match_card(match, idx)
+        self.update_view()
+    
+    def schedule_update(self):
+        """Update which cards are built once Tk is idle (coalesces scroll events)"""
+        if self.update_pending:
+            return
+        self.update_pending = True
+        self.canvas.after_idle(self.update_view)
+    
+    def update_view(self):
+        """
+        Build cards near the viewport and release those far from it
+        
+        Cards are only created once the view gets within a screen of them.
+        Cards more than a screen away are emptied to a fixed-size frame (so the
+        scroll position doesn't move) and rebuilt when the view returns. Near
+        the end of the list the next page is requested.
+        """
+        self.update_pending = False
+        if not self.matches or not self.canvas.winfo_exists():
+            return
+        
+        margin = max(self.canvas.winfo_height(), 1)
+        top = self.canvas.canvasy(0) - margin
+        bottom = self.canvas.canvasy(0) + 2 * margin
+        
+        # Reach further down the list
+        self.scrollable_frame.update_idletasks()
+        while len(self.slots) < len(self.matches) and self.get_content_height() < bottom:
+            self.add_slot()
+            self.scrollable_frame.update_idletasks()
+        
+        for index, slot in enumerate(self.slots):
+            slot_top = slot.winfo_y()
+            near = slot_top + slot.winfo_height() >= top and slot_top <= bottom
+            if near and not slot.built:
+                self.build_slot(index)
+            elif not near and slot.built:
+                self.release_slot(slot)
+        
+        # Decode every icon the new cards need in parallel, then swap them in together
+        if self.image_requests:
+            self.image_loader.load_batch(self.image_requests)
+            self.image_requests = []
+        
+        if len(self.slots) == len(self.matches) and self.get_content_height() < bottom:
+            self.request_more()
+    
+    def get_content_height(self):
+        """Height of the cards reached so far (excluding the status line)"""
+        if not self.slots:
+            return 0
+        last = self.slots[-1]
+        return last.winfo_y() + last.winfo_height()
+    
+    def add_slot(self):
+        """Add the frame for the next match and build its card"""
+        slot = tk.Frame(self.scrollable_frame, bg=self.colors['bg_primary'])
+        slot.built = False
+        if self.status_label is not None:
+            slot.pack(fill=tk.X, before=self.status_label)
+        else:
+            slot.pack(fill=tk.X)
+        self.slots.append(slot)
+        self.build_slot(len(self.slots) - 1)
+    
+    def build_slot(self, index):
+        """Create the card for a match inside its slot"""
+        slot = self.slots[index]
+        slot.pack_propagate(True)
+        if self.card_style == 'canvas':
+            MatchCardCanvas(slot, self, self.matches[index]).pack(pady=8, padx=5)
+        else:
+            self.create_match_card(self.matches[index], index, slot)
+        slot.built = True
+    
+    def release_slot(self, slot):
+        """Destroy a card but keep its space"""
+        slot.configure(width=slot.winfo_width(), height=slot.winfo_height())
+        slot.pack_propagate(False)
+        for widget in slot.winfo_children():
+            widget.destroy()
+        slot.built = False
+    
+    def request_more(self):
+        """Fetch the next page of matches in the background"""
+        if not self.has_more or self.loading_more:
+            return
+        
+        self.loading_more = True
+        self.set_status("Loading more matches...")
+        self.load_more(self.next_start, self.on_more_loaded)
+    
+    def on_more_loaded(self, matches, error, next_start=None):
+        """Append a fetched page (main thread)"""
+        self.loading_more = False
+        if not self.canvas.winfo_exists():
+            return
+        
+        if error:
+            self.has_more = False
+            self.set_status(f"Couldn't load more matches: {error}")
+            return
+        
+        matches = matches or []
+        # A full page of source entries means there may be more, even if some were skipped
+        consumed = len(matches) if next_start is None else next_start - self.next_start
+        self.next_start += consumed
+        self.has_more = consumed >= self.PAGE_SIZE
+        self.matches.extend(matches)
+        self.set_status(None)
+        self.schedule_update()
+    
+    def set_status(self, text):
+        """Show (or clear, with None) the line below the cards"""
+        if text is None:
+            if self.status_label is not None:
+                self.status_label.destroy()
+                self.status_label = None
+            return
+        
+        if self.status_label is None:
+            self.status_label = tk.Label(self.scrollable_frame, font=("Arial", 10),
+                                         bg=self.colors['bg_primary'], fg=self.colors['text_muted'])
+            self.status_label.pack(pady=15)
+        self.status_label.config(text=text)
     
-    def create_match_card(self, match, index):
+    def create_match_card(self, match, index, parent):
         """Create a card for a single match"""
         # Determine win/loss colors
         win = match.get('win', False)
@@ -98,7 +253,7 @@ class MatchHistoryDisplay:
         result_color = self.colors['win_border'] if win else self.colors['loss_border']
         
         # Main card frame
-        card = tk.Frame(self.scrollable_frame, bg=bg_color, 
+        card = tk.Frame(parent, bg=bg_color, 
                        highlightbackground=border_color, highlightthickness=2)
         card.pack(fill=tk.X, pady=8, padx=5)
         
@@ -162,25 +317,27 @@ class MatchHistoryDisplay:
         icon_container.pack(side=tk.LEFT)
         
         if champion_id:
-            icon = self.get_champion_icon(champion_id, champion_name)
-            if icon:
-                # Create canvas for icon and level overlay
-                canvas = tk.Canvas(icon_container, width=64, height=64, 
-                                  bg=bg_color, highlightthickness=0)
-                canvas.pack()
-                
-                # Draw champion icon
-                canvas.create_image(0, 0, image=icon, anchor="nw")
-                canvas.image = icon  # Keep reference
+            # Create canvas for icon and level overlay
+            canvas = tk.Canvas(icon_container, width=64, height=64, 
+                              bg=bg_color, highlightthickness=0)
+            canvas.pack()
+            
+            # Draw champion icon (placeholder until it has loaded)
+            icon_item = canvas.create_image(0, 0, image=self.image_loader.placeholder((64, 64), "#333333"),
+                                            anchor="nw")
+            self.image_requests.append((self.get_icon_path('champion', champion_id),
+                                        lambda: self.get_champion_icon_path(champion_id, champion_name),
+                                        (64, 64), lambda photo: canvas.itemconfig(icon_item, image=photo),
+                                        canvas))
+            
+            # Draw level badge (bottom-right corner)
+            if champion_level > 0:
+                # Dark circle background
+                canvas.create_oval(38, 38, 64, 64, fill="#1a1a1a", outline="#444444", width=1)
                 
-                # Draw level badge (bottom-right corner)
-                if champion_level > 0:
-                    # Dark circle background
-                    canvas.create_oval(38, 38, 64, 64, fill="#1a1a1a", outline="#444444", width=1)
-                    
-                    # Level text
-                    canvas.create_text(51, 51, text=str(champion_level), 
-                                     font=("Arial", 11, "bold"), fill="#f0e6d2")
+                # Level text
+                canvas.create_text(51, 51, text=str(champion_level), 
+                                 font=("Arial", 11, "bold"), fill="#f0e6d2")
         
         # Summoner spells (between icon and stats)
         spell1_id = match.get('summoner1_id')
@@ -189,19 +346,12 @@ class MatchHistoryDisplay:
         spells_container = tk.Frame(top_row, bg=bg_color)
         spells_container.pack(side=tk.LEFT, padx=(5, 0))
         
-        if spell1_id:
-            spell1_icon = self.get_spell_icon(spell1_id)
-            if spell1_icon:
-                spell1_label = tk.Label(spells_container, image=spell1_icon, bg=bg_color)
-                spell1_label.image = spell1_icon
-                spell1_label.pack()
-        
-        if spell2_id:
-            spell2_icon = self.get_spell_icon(spell2_id)
-            if spell2_icon:
-                spell2_label = tk.Label(spells_container, image=spell2_icon, bg=bg_color)
-                spell2_label.image = spell2_icon
-                spell2_label.pack()
+        for spell_id in (spell1_id, spell2_id):
+            if spell_id:
+                spell_label = self.create_icon_label(spells_container, self.get_icon_path('spell', spell_id),
+                                                     lambda spell_id=spell_id: self.get_spell_icon_path(spell_id),
+                                                     (32, 32), bg_color)
+                spell_label.pack()
         
         # Middle section: KDA, CS
         middle_section = tk.Frame(top_row, bg=bg_color)
@@ -278,16 +428,11 @@ class MatchHistoryDisplay:
             item_id = items[i] if i < len(items) else 0
             
             if item_id and item_id != 0:
-                item_icon = self.get_item_icon(item_id)
-                if item_icon:
-                    icon_label = tk.Label(parent, image=item_icon, bg=bg_color)
-                    icon_label.image = item_icon
-                    icon_label.pack(side=tk.LEFT, padx=1)
-                else:
-                    # Empty slot placeholder
-                    empty = tk.Frame(parent, bg="#333333", width=28, height=28)
-                    empty.pack(side=tk.LEFT, padx=1)
-                    empty.pack_propagate(False)
+                # Looks like an empty slot until the icon has loaded
+                icon_label = self.create_icon_label(parent, self.get_icon_path('items', item_id),
+                                                    lambda item_id=item_id: self.get_item_icon_path(item_id),
+                                                    (28, 28), bg_color, "#333333")
+                icon_label.pack(side=tk.LEFT, padx=1)
             else:
                 # Empty slot placeholder
                 empty = tk.Frame(parent, bg="#333333", width=28, height=28)
@@ -302,16 +447,10 @@ class MatchHistoryDisplay:
         trinket_id = items[6] if len(items) > 6 else 0
         
         if trinket_id and trinket_id != 0:
-            trinket_icon = self.get_item_icon(trinket_id)
-            if trinket_icon:
-                icon_label = tk.Label(parent, image=trinket_icon, bg=bg_color)
-                icon_label.image = trinket_icon
-                icon_label.pack(side=tk.LEFT)
-            else:
-                # Empty trinket slot
-                empty = tk.Frame(parent, bg="#333333", width=28, height=28)
-                empty.pack(side=tk.LEFT)
-                empty.pack_propagate(False)
+            icon_label = self.create_icon_label(parent, self.get_icon_path('items', trinket_id),
+                                                lambda: self.get_item_icon_path(trinket_id),
+                                                (28, 28), bg_color, "#333333")
+            icon_label.pack(side=tk.LEFT)
         else:
             # Empty trinket slot
             empty = tk.Frame(parent, bg="#333333", width=28, height=28)
@@ -358,11 +497,11 @@ class MatchHistoryDisplay:
             champion_name = player.get('champion_name', '')
             
             if champion_id:
-                small_icon = self.get_small_champion_icon(champion_id, champion_name)
-                if small_icon:
-                    icon_label = tk.Label(player_row, image=small_icon, bg=bg_color)
-                    icon_label.image = small_icon
-                    icon_label.pack(side=tk.LEFT, padx=(0, 5))
+                icon_label = self.create_icon_label(player_row, self.get_icon_path('champion', champion_id),
+                                                    lambda champion_id=champion_id, champion_name=champion_name:
+                                                    self.get_champion_icon_path(champion_id, champion_name),
+                                                    (24, 24), bg_color)
+                icon_label.pack(side=tk.LEFT, padx=(0, 5))
             
             # Player name (clickable)
             summoner_name = player.get('summoner_name', 'Unknown')
@@ -469,172 +608,50 @@ class MatchHistoryDisplay:
         else:
             return "#ff4444"  # Red
     
-    def get_champion_icon(self, champion_id, champion_name):
-        """Get champion icon from Data Dragon CDN"""
-        # Check cache first
-        if champion_id in self.champion_icons:
-            return self.champion_icons[champion_id]
-        
-        try:
-            # Create assets directory if it doesn't exist
-            assets_dir = os.path.join(os.path.dirname(__file__), '..', 'assets', 'champion')
-            os.makedirs(assets_dir, exist_ok=True)
-            
-            # Check if icon already exists locally
-            icon_path = os.path.join(assets_dir, f"{champion_id}.png")
-            
-            if not os.path.exists(icon_path):
-                # Download from Data Dragon CDN
-                # Remove special characters from champion name for URL
-                url_name = champion_name.replace("'", "").replace(" ", "").replace(".", "")
-                url = f"https://ddragon.leagueoflegends.com/cdn/15.1.1/img/champion/{url_name}.png"
-                
-                response = requests.get(url, timeout=5)
-                if response.status_code == 200:
-                    with open(icon_path, 'wb') as f:
-                        f.write(response.content)
-            
-            # Load and resize icon
-            if os.path.exists(icon_path):
-                img = Image.open(icon_path)
-                img = img.resize((64, 64), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                
-                # Cache it
-                self.champion_icons[champion_id] = photo
-                return photo
-        
-        except Exception as e:
-            print(f"Error loading champion icon: {e}")
-        
-        return None
+    def create_icon_label(self, parent, icon_path, fetch, size, bg_color, placeholder_color=None):
+        """Create a label showing a placeholder until the icon has loaded"""
+        label = tk.Label(parent, image=self.image_loader.placeholder(size, placeholder_color),
+                         bg=bg_color, borderwidth=0)
+        self.image_requests.append((icon_path, fetch, size, lambda photo: label.config(image=photo), label))
+        return label
     
-    def get_small_champion_icon(self, champion_id, champion_name):
-        """Get small champion icon (24x24) from Data Dragon CDN"""
-        # Check cache first
-        if champion_id in self.small_champion_icons:
-            return self.small_champion_icons[champion_id]
-        
-        try:
-            # Create assets directory if it doesn't exist
-            assets_dir = os.path.join(os.path.dirname(__file__), '..', 'assets', 'champion')
-            os.makedirs(assets_dir, exist_ok=True)
-            
-            # Check if icon already exists locally
-            icon_path = os.path.join(assets_dir, f"{champion_id}.png")
-            
-            if not os.path.exists(icon_path):
-                # Download from Data Dragon CDN
-                url_name = champion_name.replace("'", "").replace(" ", "").replace(".", "")
-                url = f"https://ddragon.leagueoflegends.com/cdn/15.1.1/img/champion/{url_name}.png"
-                
-                response = requests.get(url, timeout=5)
-                if response.status_code == 200:
-                    with open(icon_path, 'wb') as f:
-                        f.write(response.content)
-            
-            # Load and resize icon to small size
-            if os.path.exists(icon_path):
-                img = Image.open(icon_path)
-                img = img.resize((24, 24), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                
-                # Cache it
-                self.small_champion_icons[champion_id] = photo
-                return photo
-        
-        except Exception as e:
-            print(f"Error loading small champion icon: {e}")
-        
-        return None
+    def get_icon_path(self, assets_subdir, icon_id):
+        """Local path an icon is cached at for the configured icon source"""
+        return get_icon_cache_path(os.path.join(os.path.dirname(__file__), '..', 'assets', assets_subdir,
+                                                f"{icon_id}.png"), self.use_sprites)
     
-    def get_item_icon(self, item_id):
-        """Get item icon from Data Dragon CDN"""
-        # Check cache first
-        if item_id in self.item_icons:
-            return self.item_icons[item_id]
+    def download_icon(self, kind, assets_subdir, icon_id, url_name):
+        """Get local path for an icon, downloading it if needed (runs on a worker thread)"""
+        icon_path = self.get_icon_path(assets_subdir, icon_id)
+        store = get_asset_store()
         
-        try:
-            # Create assets directory if it doesn't exist
-            assets_dir = os.path.join(os.path.dirname(__file__), '..', 'assets', 'items')
-            os.makedirs(assets_dir, exist_ok=True)
-            
-            # Check if icon already exists locally
-            icon_path = os.path.join(assets_dir, f"{item_id}.png")
-            
-            if not os.path.exists(icon_path):
-                # Download from Data Dragon CDN
-                url = f"https://ddragon.leagueoflegends.com/cdn/15.1.1/img/item/{item_id}.png"
-                
-                response = requests.get(url, timeout=5)
-                if response.status_code == 200:
-                    with open(icon_path, 'wb') as f:
-                        f.write(response.content)
-            
-            # Load and resize icon to 28x28
-            if os.path.exists(icon_path):
-                img = Image.open(icon_path)
-                img = img.resize((28, 28), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                
-                # Cache it
-                self.item_icons[item_id] = photo
-                return photo
+        if self.use_sprites and not store.exists(icon_path):
+            get_sprite_sheets().extract_icon(kind, icon_id, icon_path)
         
-        except Exception as e:
-            print(f"Error loading item icon {item_id}: {e}")
-        
-        return None
-    
-    def get_spell_icon(self, spell_id):
-        """Get summoner spell icon from Data Dragon CDN"""
-        # Check cache first
-        if spell_id in self.spell_icons:
-            return self.spell_icons[spell_id]
-        
-        # Spell ID to name mapping
-        spell_names = {
-            1: 'SummonerBoost', 3: 'SummonerExhaust', 4: 'SummonerFlash',
-            6: 'SummonerHaste', 7: 'SummonerHeal', 11: 'SummonerSmite',
-            12: 'SummonerTeleport', 13: 'SummonerMana', 14: 'SummonerDot',
-            21: 'SummonerBarrier', 30: 'SummonerPoroRecall', 31: 'SummonerPoroThrow',
-            32: 'SummonerSnowball', 39: 'SummonerSnowURFSnowball_Mark',
-            54: 'Summoner_UltBookPlaceholder', 55: 'Summoner_UltBookSmitePlaceholder'
-        }
-        
-        spell_name = spell_names.get(spell_id, f'Summoner{spell_id}')
-        
-        try:
-            # Create assets directory if it doesn't exist
-            assets_dir = os.path.join(os.path.dirname(__file__), '..', 'assets', 'spell')
-            os.makedirs(assets_dir, exist_ok=True)
+        if not store.exists(icon_path):
+            # Download from Data Dragon CDN
+            url = get_data_dragon().image_url(kind, f"{url_name}.png", wait=5)
             
-            # Check if icon already exists locally
-            icon_path = os.path.join(assets_dir, f"{spell_id}.png")
-            
-            if not os.path.exists(icon_path):
-                # Download from Data Dragon CDN
-                url = f"https://ddragon.leagueoflegends.com/cdn/15.1.1/img/spell/{spell_name}.png"
-                
-                response = requests.get(url, timeout=5)
-                if response.status_code == 200:
-                    with open(icon_path, 'wb') as f:
-                        f.write(response.content)
-            
-            # Load and resize icon to 32x32 (champion icon is 64, so 2 spells = 64)
-            if os.path.exists(icon_path):
-                img = Image.open(icon_path)
-                img = img.resize((32, 32), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                
-                # Cache it
-                self.spell_icons[spell_id] = photo
-                return photo
+            response = requests.get(url, timeout=5)
+            if response.status_code == 200:
+                store.add(icon_path, response.content)
         
-        except Exception as e:
-            print(f"Error loading spell icon {spell_id}: {e}")
-        
-        return None
+        return icon_path if store.exists(icon_path) else None
+    
+    def get_champion_icon_path(self, champion_id, champion_name):
+        """Get local path for a champion icon"""
+        url_name = get_static_data().champion_icon_key(champion_id) or \
+            champion_name.replace("'", "").replace(" ", "").replace(".", "")
+        return self.download_icon('champion', 'champion', champion_id, url_name)
+    
+    def get_item_icon_path(self, item_id):
+        """Get local path for an item icon"""
+        return self.download_icon('item', 'items', item_id, item_id)
+    
+    def get_spell_icon_path(self, spell_id):
+        """Get local path for a summoner spell icon"""
+        spell_name = get_static_data().spell_icon_key(spell_id) or f'Summoner{spell_id}'
+        return self.download_icon('spell', 'spell', spell_id, spell_name)
     
 
     def get_time_ago(self, game_creation_ms):
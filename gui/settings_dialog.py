@@ -1,15 +1,21 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from config import get_api_key, set_api_key, get_region, set_region, get_theme, set_theme, get_theme_colors
+from config import (get_api_key, set_api_key, get_region, set_region, get_theme, set_theme, get_theme_colors,
+                    get_icon_source, set_icon_source)
 from status_fetcher import StatusFetcher
 
 class SettingsDialog:
+    ICON_SOURCES = [
+        ("Sprite sheets (fewer downloads)", "sprites"),
+        ("Individual icons (sharper)", "individual")
+    ]
+    
     def __init__(self, parent, theme_callback=None):
         self.parent = parent
         self.theme_callback = theme_callback
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Settings")
-        self.dialog.geometry("500x480")
+        self.dialog.geometry("500x580")
         self.dialog.resizable(False, False)
         
         # Get theme colors
@@ -130,6 +136,29 @@ class SettingsDialog:
         if not self.theme_var.get():
             self.theme_combo.current(0)  # Default to first theme
         
+        # Icon download section
+        icon_frame = tk.Frame(main_frame, bg="#2d2d2d")
+        icon_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        icon_label = tk.Label(icon_frame, text="Icon Downloads:", 
+                             font=("Arial", 10, "bold"), bg="#2d2d2d", fg="white")
+        icon_label.pack(anchor="w", pady=(0, 5))
+        
+        self.icon_source_var = tk.StringVar()
+        self.icon_source_combo = ttk.Combobox(icon_frame, textvariable=self.icon_source_var,
+                                             values=[name for name, code in self.ICON_SOURCES],
+                                             state="readonly", font=("Arial", 10))
+        self.icon_source_combo.pack(fill=tk.X, ipady=3)
+        
+        current_icon_source = get_icon_source()
+        for idx, (name, code) in enumerate(self.ICON_SOURCES):
+            if code == current_icon_source:
+                self.icon_source_combo.current(idx)
+                break
+        
+        if not self.icon_source_var.get():
+            self.icon_source_combo.current(0)
+        
         # Buttons
         btn_frame = tk.Frame(main_frame, bg="#2d2d2d")
         btn_frame.pack(pady=(20, 0), fill=tk.X)
@@ -185,6 +214,9 @@ class SettingsDialog:
         
         success = success and set_theme(theme_code)
         
+        icon_source = next((code for name, code in self.ICON_SOURCES if name == self.icon_source_var.get()), "sprites")
+        success = success and set_icon_source(icon_source)
+        
         if success:
             # Apply theme immediately if changed
             if theme_changed and self.theme_callback:
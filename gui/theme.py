@@ -0,0 +1,60 @@
+"""
+Theme registry
+Widgets register which theme role each of their color options plays when
+they are created; switching themes reconfigures just those widgets in one
+pass instead of walking the widget tree and guessing roles from hex values
+"""
+import tkinter as tk
+import weakref
+from config import get_theme_colors
+
+
+class ThemeRegistry:
+    def __init__(self):
+        self.colors = get_theme_colors()
+        self.widgets = weakref.WeakKeyDictionary()  # widget -> {option: role}; destroyed widgets drop out
+        self.listeners = []
+
+    def register(self, widget, **roles):
+        """
+        Color widget options from theme roles and keep them in sync
+
+        Example: register(tk.Label(parent, text="Hi"), bg='bg_secondary', fg='text_muted')
+
+        Returns:
+            The widget
+        """
+        widget.configure(**{option: self.colors[role] for option, role in roles.items()})
+        self.widgets.setdefault(widget, {}).update(roles)
+        return widget
+
+    def add_listener(self, callback):
+        """Call callback(colors) after a theme switch, for colors that aren't widget options (ttk styles, canvas items)"""
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def set_theme(self, theme_name=None):
+        """Switch every registered widget to a theme (defaults to the configured one)"""
+        self.colors = get_theme_colors(theme_name)
+        for widget, roles in list(self.widgets.items()):
+            try:
+                widget.configure(**{option: self.colors[role] for option, role in roles.items()})
+            except tk.TclError:
+                self.widgets.pop(widget, None)  # Destroyed but not yet collected
+
+        for callback in list(self.listeners):
+            callback(self.colors)
+
+
+_theme_registry = None
+
+
+def get_theme_registry():
+    """Get the shared ThemeRegistry (main thread only)"""
+    global _theme_registry
+    if _theme_registry is None:
+        _theme_registry = ThemeRegistry()
+    return _theme_registry
@@ -0,0 +1,116 @@
+"""
+Game-clock timer scheduler
+Runs every countdown (e.g. enemy summoner spell cooldowns) off one Tk tick
+against time.monotonic(), anchored to the spectator game clock, and calls
+back only when a timer's displayed second changes
+"""
+import math
+import time
+
+
+class GameClock:
+    def __init__(self, game_data=None):
+        """
+        Anchor to the spectator data's game time
+
+        gameLength (seconds into the game when the data was fetched, see
+        LiveGameFetcher) is preferred since it doesn't depend on the local
+        clock being in sync; gameStartTime (epoch ms) is the fallback. Without
+        either the clock starts at 0.
+        """
+        game_data = game_data or {}
+        game_length = game_data.get('gameLength')
+        fetched_at = game_data.get('fetched_at')
+        start_time = game_data.get('gameStartTime')
+
+        if game_length is not None and fetched_at:
+            game_time = game_length + (time.time() - fetched_at)
+        elif start_time:
+            game_time = time.time() - start_time / 1000
+        else:
+            game_time = 0
+        # Game time = monotonic time + offset, so it never jumps with the wall clock
+        self.offset = max(game_time, 0) - time.monotonic()
+
+    def now(self):
+        """Current game time in seconds"""
+        return time.monotonic() + self.offset
+
+
+class TimerScheduler:
+    MIN_DELAY_MS = 10
+
+    def __init__(self, widget, clock=None):
+        """
+        Args:
+            widget: Widget whose lifetime bounds the timers (ticks stop once it's destroyed)
+            clock: GameClock timers are measured against
+        """
+        self.widget = widget
+        self.clock = clock or GameClock()
+        self.timers = {}  # key -> {'end', 'shown', 'on_change', 'on_finish'}
+        self.job = None
+
+    def start(self, key, duration=None, on_change=None, on_finish=None, end=None):
+        """
+        Start (or restart) a countdown
+
+        Args:
+            key: Timer identifier
+            duration: Seconds from now, or
+            end: Game time (seconds) the timer runs out at
+            on_change: Called with the remaining whole seconds whenever that changes
+            on_finish: Called once the timer runs out
+        """
+        if end is None:
+            end = self.clock.now() + duration
+        self.timers[key] = {'end': end, 'shown': None, 'on_change': on_change, 'on_finish': on_finish}
+        self._tick()
+
+    def cancel(self, key):
+        """Stop a countdown without finishing it"""
+        self.timers.pop(key, None)
+        if not self.timers:
+            self.stop()
+
+    def get_end_times(self):
+        """key -> game time each running timer ends at"""
+        return {key: timer['end'] for key, timer in self.timers.items()}
+
+    def stop(self):
+        """Cancel the pending tick"""
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+
+    def _tick(self):
+        """Update every timer and schedule the next tick for the next change of any displayed value"""
+        self.stop()
+        if not self.widget.winfo_exists():
+            self.timers = {}
+            return
+
+        now = self.clock.now()
+        next_change = None
+        for key, timer in list(self.timers.items()):
+            remaining = timer['end'] - now
+            if remaining <= 0:
+                del self.timers[key]
+                if timer['on_finish']:
+                    timer['on_finish']()
+                continue
+
+            shown = math.ceil(remaining)
+            if shown != timer['shown']:
+                timer['shown'] = shown
+                if timer['on_change']:
+                    timer['on_change'](shown)
+
+            # The shown value drops when remaining crosses the next whole second
+            until_change = remaining - (shown - 1)
+            if next_change is None or until_change < next_change:
+                next_change = until_change
+
+        if next_change is not None:
+            delay = max(int(next_change * 1000) + 1, self.MIN_DELAY_MS)
+            self.job = self.widget.after(delay, self._tick)
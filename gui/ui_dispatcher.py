@@ -0,0 +1,77 @@
+"""
+UI dispatcher
+Background threads post UI updates onto a thread-safe queue instead of
+calling Tk's after(0, ...) for each one; the Tk main loop drains the queue
+once per frame and drops updates that a newer one with the same key
+supersedes (e.g. download progress ticks)
+"""
+import queue
+import tkinter as tk
+
+
+class UIDispatcher:
+    FRAME_MS = 16  # Drain cadence (~60 per second)
+
+    def __init__(self, root, frame_ms=FRAME_MS):
+        self.root = root
+        self.frame_ms = frame_ms
+        self.queue = queue.SimpleQueue()
+        self.job = None
+
+    def post(self, callback, *args, key=None):
+        """
+        Run callback(*args) on the main thread at the next frame (thread-safe)
+
+        Args:
+            callback: Function to call
+            key: Optional hashable; of several updates with the same key
+                queued in one frame only the last one runs
+        """
+        self.queue.put((key, callback, args))
+
+    def start(self):
+        """Start draining the queue every frame"""
+        if self.job is None:
+            self.job = self.root.after(self.frame_ms, self._drain)
+
+    def stop(self):
+        """Stop draining (pending updates stay queued)"""
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+
+    def _drain(self):
+        """Apply the updates queued since the last frame"""
+        events = []
+        try:
+            while True:
+                events.append(self.queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        # Keyed updates run only at their last occurrence, so ordering with the rest is kept
+        last = {key: i for i, (key, _, _) in enumerate(events) if key is not None}
+        for i, (key, callback, args) in enumerate(events):
+            if key is not None and last[key] != i:
+                continue
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Error in UI update {getattr(callback, '__name__', callback)}: {e}")
+
+        try:
+            self.job = self.root.after(self.frame_ms, self._drain)
+        except tk.TclError:
+            self.job = None  # Main window closed
+
+
+_ui_dispatcher = None
+
+
+def get_ui_dispatcher(widget):
+    """Get the shared, running UIDispatcher for the application (first call on the main thread)"""
+    global _ui_dispatcher
+    if _ui_dispatcher is None:
+        _ui_dispatcher = UIDispatcher(widget._root())
+        _ui_dispatcher.start()
+    return _ui_dispatcher
@@ -5,6 +5,7 @@ import tkinter as tk
 from tkinter import scrolledtext, messagebox
 import threading
 import sys
+from gui.ui_dispatcher import get_ui_dispatcher
 
 class UpdateDialog:
     def __init__(self, parent, current_version, latest_version, download_url, release_notes, update_checker, exe_url):
@@ -106,20 +107,26 @@ class UpdateDialog:
         self.later_btn.config(state=tk.DISABLED)
         
         # Download in background thread
+        dispatcher = get_ui_dispatcher(self.dialog)
+        
+        def progress(downloaded, total):
+            # Called per downloaded chunk; only the latest value per frame is drawn
+            dispatcher.post(self.update_progress, downloaded, total, key=(self, "progress"))
+        
         def download():
             success = self.update_checker.download_and_install_update(
                 self.exe_url, 
-                progress_callback=self.update_progress
+                progress_callback=progress
             )
             
             if success:
-                self.dialog.after(0, self.close_and_update)
+                dispatcher.post(self.close_and_update)
             else:
-                self.dialog.after(0, lambda: messagebox.showerror(
+                dispatcher.post(messagebox.showerror, 
                     "Update Failed", 
                     "Failed to download update. Please try downloading manually."
-                ))
-                self.dialog.after(0, self.reset_buttons)
+                )
+                dispatcher.post(self.reset_buttons)
         
         thread = threading.Thread(target=download, daemon=True)
         thread.start()
@@ -0,0 +1,144 @@
+"""
+Virtualized account grid
+Lays accounts out directly on the accounts canvas but only builds cards for
+the rows near the viewport, recycling a small pool of AccountCards as rows
+scroll in and out, so widget count and layout cost stay flat however many
+accounts there are
+"""
+
+
+class VirtualAccountGrid:
+    OVERSCAN_ROWS = 1  # Rows built beyond each edge of the viewport
+    PADDING = 10
+
+    def __init__(self, canvas, create_card, columns=4):
+        """
+        Args:
+            canvas: Scrolling canvas the cards are placed on
+            create_card: Callable(parent, account) returning a new AccountCard
+            columns: Cards per row
+        """
+        self.canvas = canvas
+        self.create_card = create_card
+        self.columns = columns
+        self.accounts = []
+        self.cards = []  # Card pool
+        self.items = {}  # card -> canvas window item
+        self.assigned = {}  # account ID -> card currently showing it
+        self.row_height = 0  # Tallest card so far plus padding; every row uses it
+        self.scrollregion = None
+        self.active = False
+        self.update_pending = False
+
+        self.canvas.configure(yscrollcommand=lambda *args: self.schedule_update())
+        self.canvas.bind("<Configure>", lambda e: self.schedule_update(), add="+")
+
+    def show(self, accounts):
+        """Show accounts (already sorted), reusing cards that are still in view"""
+        self.accounts = accounts
+        self.active = True
+        self.update_view()
+
+    def hide(self):
+        """Destroy the card pool and stop tracking the canvas"""
+        for card in self.cards:
+            self.canvas.delete(self.items[card])
+            card.destroy()
+        self.cards = []
+        self.items = {}
+        self.assigned = {}
+        self.accounts = []
+        self.row_height = 0
+        self.scrollregion = None
+        self.active = False
+
+    def schedule_update(self):
+        """Update the visible rows once Tk is idle (coalesces scroll events)"""
+        if not self.active or self.update_pending:
+            return
+        self.update_pending = True
+        self.canvas.after_idle(self.update_view)
+
+    def update_view(self):
+        """Assign pooled cards to the accounts in (or near) the viewport"""
+        self.update_pending = False
+        if not self.active:
+            return
+
+        # The first card sets the initial row height
+        if not self.cards and self.accounts:
+            self._new_card(self.accounts[0])
+
+        width = max(self.canvas.winfo_width(), 1)
+        column_width = max((width - self.PADDING * (self.columns + 1)) // self.columns, 1)
+        rows = -(-len(self.accounts) // self.columns)
+        scrollregion = (0, 0, width, rows * self.row_height + self.PADDING)
+        if scrollregion != self.scrollregion:
+            # Only on change: setting it triggers yscrollcommand, which schedules another update
+            self.canvas.configure(scrollregion=scrollregion)
+            self.scrollregion = scrollregion
+
+        visible = []
+        if rows:
+            top = self.canvas.canvasy(0)
+            first_row = max(int(top // self.row_height) - self.OVERSCAN_ROWS, 0)
+            last_row = min(int((top + self.canvas.winfo_height()) // self.row_height) + self.OVERSCAN_ROWS, rows - 1)
+            first = first_row * self.columns
+            visible = list(enumerate(self.accounts[first:(last_row + 1) * self.columns], first))
+        visible_ids = {account["id"] for _, account in visible}
+
+        # Cards already showing a visible account keep it; the rest are free
+        assigned = {account_id: card for account_id, card in self.assigned.items() if account_id in visible_ids}
+        in_use = set(assigned.values())
+        free = [card for card in self.cards if card not in in_use]
+
+        row_height = self.row_height
+        for idx, account in visible:
+            card = assigned.get(account["id"])
+            if card is None:
+                card = free.pop() if free else None
+                if card is None:
+                    card = self._new_card(account)
+                elif card.update_account(account):
+                    self._measure(card)
+                assigned[account["id"]] = card
+            elif card.update_account(account):
+                self._measure(card)
+            self._place(card, idx // self.columns, idx % self.columns, column_width)
+
+        for card in free:
+            self.canvas.itemconfigure(self.items[card], state="hidden")
+            card.grid_position = None
+        self.assigned = assigned
+
+        # A taller card than any before changes every row's position
+        if self.row_height != row_height:
+            for card in self.cards:
+                card.grid_position = None
+            self.schedule_update()
+
+    def _new_card(self, account):
+        """Add a card to the pool"""
+        card = self.create_card(self.canvas, account)
+        self.items[card] = self.canvas.create_window(0, 0, window=card, anchor="nw", state="hidden")
+        self.cards.append(card)
+        self._measure(card)
+        return card
+
+    def _measure(self, card):
+        """Grow the row height to fit a card"""
+        card.update_idletasks()
+        self.row_height = max(self.row_height, card.winfo_reqheight() + self.PADDING)
+
+    def _place(self, card, row, column, column_width):
+        """Move a card to a grid cell (if it isn't already there)"""
+        position = (row, column, column_width)
+        if card.grid_position == position:
+            return
+
+        x = self.PADDING + column * (column_width + self.PADDING)
+        y = self.PADDING + row * self.row_height
+        item = self.items[card]
+        self.canvas.coords(item, x, y)
+        self.canvas.itemconfigure(item, width=column_width, height=self.row_height - self.PADDING, state="normal")
+        card.grid_position = position
@@ -4,6 +4,7 @@ Uses SPECTATOR-V5 API to get current game information
 """
 import requests
 import logging
+import time
 
 class LiveGameFetcher:
     def __init__(self, api_key=None):
@@ -13,9 +14,10 @@ class LiveGameFetcher:
         if not logging.getLogger().handlers:
             logging.basicConfig(level=logging.INFO)
     
-    def fetch_live_game(self, riot_id, region='euw1'):
+    def fetch_live_game(self, riot_id, region='euw1', cancel_token=None):
         """
         Fetch live game data for a summoner
+        cancel_token: Optional CancelToken (task_service), checked between requests
         Returns: (game_data, error)
         - game_data: dict with game information or None
         - error: error message or None
@@ -31,6 +33,8 @@ class LiveGameFetcher:
                 return None, "Could not find summoner"
             
             self.logger.info(f"PUUID: {puuid}")
+            if cancel_token:
+                cancel_token.check()
             
             # Get active game using SPECTATOR-V5 (uses PUUID directly)
             game_data = self._get_active_game(puuid, region)
@@ -38,8 +42,11 @@ class LiveGameFetcher:
             if not game_data:
                 return None, None  # Not in game (not an error)
             
+            # When gameLength was current, so the game clock can be anchored to it later
+            game_data['fetched_at'] = time.time()
+            
             # Enrich game data with additional player info
-            enriched_data = self._enrich_game_data(game_data, region, puuid)
+            enriched_data = self._enrich_game_data(game_data, region, puuid, cancel_token)
             
             return enriched_data, None
             
@@ -143,12 +150,14 @@ class LiveGameFetcher:
             self.logger.error(f"Error getting active game: {e}")
             return None
     
-    def _enrich_game_data(self, game_data, region, target_puuid):
+    def _enrich_game_data(self, game_data, region, target_puuid, cancel_token=None):
         """Enrich game data with ranks and champion mastery for all players"""
         participants = game_data.get('participants', [])
         
         enriched_participants = []
         for participant in participants:
+            if cancel_token:
+                cancel_token.check()
             summoner_id = participant.get('summonerId')
             puuid = participant.get('puuid')
             
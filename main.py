@@ -1,3 +1,10 @@
+import time
+STARTED_AT = time.perf_counter()  # Before the imports, which are part of startup time
+
+import profiling
+if profiling.get_profiler():
+    profiling.get_profiler().start()
+
 import tkinter as tk
 from tkinter import ttk, messagebox
 import json
@@ -7,24 +14,43 @@ import warnings
 from pathlib import Path
 from account_manager import AccountManager
 from gui.main_window import MainWindow
+from gui.image_cache import get_image_cache
 
 # Suppress PyInstaller warnings
 warnings.filterwarnings("ignore")
+profiling.mark("imports")
 
 def main():
     root = tk.Tk()
     root.title("Riot Account Manager")
     root.geometry("1000x630")
     root.minsize(900, 580)
+    profiling.mark("create Tk root")
     
     # Initialize account manager
     account_manager = AccountManager()
+    profiling.mark("load accounts")
     
     # Create main window
     app = MainWindow(root, account_manager)
+    profiling.mark("build main window")
+    
+    def on_first_paint():
+        # Idle callbacks run after Tk's pending redraws, so the accounts grid is on screen now
+        root.update_idletasks()
+        print(f"First paint after {(time.perf_counter() - STARTED_AT) * 1000:.0f} ms")
+        profiling.mark("first paint")
+        if profiling.get_profiler():
+            profiling.get_profiler().report_startup()
+        app.start_deferred_tasks()
+    
+    root.after_idle(on_first_paint)
     
     # Suppress cleanup warnings on exit
     def on_closing():
+        if profiling.get_profiler():
+            print(get_image_cache().report())
+        app.tasks.shutdown()  # Stop background fetches so exit doesn't wait for them
         try:
             root.destroy()
         except:
@@ -0,0 +1,263 @@
+"""
+Match analytics
+Columnar NumPy view of archived matches for vectorized rolling and grouped statistics
+"""
+import json
+import os
+from datetime import datetime
+import numpy as np
+
+# Column name -> dtype. Every column has one entry per match, sorted by game_creation.
+COLUMNS = {
+    'account': np.int16,  # Index into MatchColumns.puuids
+    'game_creation': np.int64,
+    'champion_id': np.int16,
+    'queue_id': np.int16,
+    'kills': np.int16,
+    'deaths': np.int16,
+    'assists': np.int16,
+    'cs': np.int16,
+    'duration': np.int32,
+    'win': np.bool_,
+    'owned_teammates': np.int8,  # Other owned accounts on the player's team
+}
+
+# Default game length buckets for group_stats(by='duration'), in minutes
+DURATION_BINS = [0, 20, 25, 30, 35, 40]
+
+
+def count_owned_teammates(summary, owned_riot_ids):
+    """Count owned accounts on the player's team, excluding the player"""
+    if not owned_riot_ids:
+        return 0
+    team = summary.get('blue_team', []) if summary.get('player_team_id') == 100 else summary.get('red_team', [])
+    return sum(1 for player in team
+               if not player.get('is_player') and (player.get('riot_id') or '').lower() in owned_riot_ids)
+
+
+class MatchColumns:
+    def __init__(self, columns=None, puuids=None, last_rowid=0):
+        self.puuids = list(puuids or [])
+        self.last_rowid = last_rowid  # Last archive rowid folded in, for incremental sync
+        self.columns = {}
+        for name, dtype in COLUMNS.items():
+            if columns is not None and name in columns:
+                self.columns[name] = columns[name] if isinstance(columns[name], np.ndarray) else np.asarray(columns[name], dtype=dtype)
+            else:
+                self.columns[name] = np.empty(0, dtype=dtype)
+
+    def __len__(self):
+        return len(self.columns['game_creation'])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    @classmethod
+    def from_matches(cls, matches, puuid=None, owned_riot_ids=None):
+        """Build columns from match summaries returned by MatchHistoryFetcher"""
+        columns = cls()
+        columns._append_rows([(puuid, match) for match in matches], owned_riot_ids)
+        return columns
+
+    @classmethod
+    def from_archive(cls, archive, owned_riot_ids=None):
+        """Build columns for every match in a MatchArchive"""
+        columns = cls()
+        columns.sync_from_archive(archive, owned_riot_ids)
+        return columns
+
+    def sync_from_archive(self, archive, owned_riot_ids=None):
+        """
+        Append matches archived since the last sync
+
+        Returns:
+            int: Number of matches added
+        """
+        rows = []
+        last_rowid = self.last_rowid
+        for rowid, puuid, summary in archive.iter_summaries(after_rowid=self.last_rowid):
+            rows.append((puuid, summary))
+            last_rowid = rowid
+
+        self._append_rows(rows, owned_riot_ids)
+        self.last_rowid = last_rowid
+        return len(rows)
+
+    def _append_rows(self, rows, owned_riot_ids):
+        """Append (puuid, summary) rows and keep columns sorted by game_creation"""
+        if not rows:
+            return
+
+        owned = {riot_id.lower() for riot_id in (owned_riot_ids or [])}
+        account_index = {puuid: idx for idx, puuid in enumerate(self.puuids)}
+
+        new_values = {name: [] for name in COLUMNS}
+        for puuid, summary in rows:
+            if puuid not in account_index:
+                account_index[puuid] = len(self.puuids)
+                self.puuids.append(puuid)
+
+            new_values['account'].append(account_index[puuid])
+            new_values['game_creation'].append(summary.get('game_creation') or 0)
+            new_values['champion_id'].append(summary.get('champion_id') or 0)
+            new_values['queue_id'].append(summary.get('queue_id') or 0)
+            new_values['kills'].append(summary.get('kills', 0))
+            new_values['deaths'].append(summary.get('deaths', 0))
+            new_values['assists'].append(summary.get('assists', 0))
+            new_values['cs'].append(summary.get('cs', 0))
+            new_values['duration'].append(summary.get('game_duration', 0))
+            new_values['win'].append(bool(summary.get('win')))
+            new_values['owned_teammates'].append(count_owned_teammates(summary, owned))
+
+        for name, dtype in COLUMNS.items():
+            self.columns[name] = np.concatenate([self.columns[name], np.asarray(new_values[name], dtype=dtype)])
+
+        order = np.argsort(self.columns['game_creation'], kind='stable')
+        for name in COLUMNS:
+            self.columns[name] = self.columns[name][order]
+
+    def save(self, directory):
+        """Save columns as .npy files so they can be memory-mapped later"""
+        os.makedirs(directory, exist_ok=True)
+        for name in COLUMNS:
+            path = os.path.join(directory, f"{name}.npy")
+            temp_path = path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(self.columns[name]))
+            os.replace(temp_path, path)
+
+        with open(os.path.join(directory, "meta.json"), 'w') as f:
+            json.dump({'puuids': self.puuids, 'last_rowid': self.last_rowid}, f)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """Load columns saved with save(); memory-mapped read-only by default"""
+        meta_path = os.path.join(directory, "meta.json")
+        if not os.path.exists(meta_path):
+            return cls()
+
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+
+        mmap_mode = 'r' if mmap else None
+        columns = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mmap_mode)
+                   for name in COLUMNS}
+        return cls(columns, meta.get('puuids'), meta.get('last_rowid', 0))
+
+    def filter(self, puuid=None, champion_id=None, queue_ids=None, since=None, until=None):
+        """Return a new MatchColumns with only the matching rows"""
+        mask = np.ones(len(self), dtype=bool)
+
+        if puuid is not None:
+            if puuid not in self.puuids:
+                mask[:] = False
+            else:
+                mask &= self.columns['account'] == self.puuids.index(puuid)
+        if champion_id is not None:
+            mask &= self.columns['champion_id'] == champion_id
+        if queue_ids:
+            mask &= np.isin(self.columns['queue_id'], list(queue_ids))
+        if since is not None:
+            mask &= self.columns['game_creation'] >= since
+        if until is not None:
+            mask &= self.columns['game_creation'] < until
+
+        return MatchColumns({name: column[mask] for name, column in self.columns.items()},
+                            self.puuids, self.last_rowid)
+
+    def rolling_mean(self, values, window):
+        """Trailing mean over `window` matches (empty if there are fewer matches)"""
+        values = np.asarray(values, dtype=np.float64)
+        if window <= 0 or len(values) < window:
+            return np.empty(0, dtype=np.float64)
+        cumulative = np.concatenate([[0.0], np.cumsum(values)])
+        return (cumulative[window:] - cumulative[:-window]) / window
+
+    def rolling_win_rate(self, window=20):
+        """Win rate (0-100) over each trailing window of matches, oldest first"""
+        return self.rolling_mean(self.columns['win'], window) * 100
+
+    def rolling_kda(self, window=20):
+        """KDA over each trailing window of matches, oldest first"""
+        takedowns = self.rolling_mean(self.columns['kills'].astype(np.float64) + self.columns['assists'], window)
+        deaths = self.rolling_mean(self.columns['deaths'], window)
+        return np.divide(takedowns, deaths, out=takedowns.copy(), where=deaths > 0)
+
+    def group_keys(self, by, bins=None, utc_offset=None):
+        """
+        Compute the grouping key for every match
+
+        Args:
+            by: 'hour', 'weekday', 'duration' or any column name
+            bins: Minute bucket edges for 'duration'
+            utc_offset: Seconds east of UTC for 'hour'/'weekday' (defaults to local time)
+        """
+        if by in ('hour', 'weekday'):
+            if utc_offset is None:
+                utc_offset = datetime.now().astimezone().utcoffset().total_seconds()
+            seconds = self.columns['game_creation'] // 1000 + int(utc_offset)
+            if by == 'hour':
+                return (seconds // 3600) % 24
+            # 1970-01-01 was a Thursday; shift so Monday == 0
+            return (seconds // 86400 + 3) % 7
+
+        if by == 'duration':
+            edges = np.asarray(bins or DURATION_BINS, dtype=np.float64) * 60
+            return edges[np.clip(np.searchsorted(edges, self.columns['duration'], side='right') - 1, 0, None)] // 60
+
+        return self.columns[by]
+
+    def group_stats(self, by, bins=None, utc_offset=None):
+        """
+        Aggregate matches by a key
+
+        Returns:
+            dict: key -> {'games', 'wins', 'win_rate', 'kda', 'cs_per_min', 'avg_duration'}
+                  ('duration' keys are the lower bucket edge in minutes)
+        """
+        if len(self) == 0:
+            return {}
+
+        keys, inverse = np.unique(self.group_keys(by, bins, utc_offset), return_inverse=True)
+        games = np.bincount(inverse)
+        wins = np.bincount(inverse, weights=self.columns['win'])
+        kills = np.bincount(inverse, weights=self.columns['kills'])
+        deaths = np.bincount(inverse, weights=self.columns['deaths'])
+        assists = np.bincount(inverse, weights=self.columns['assists'])
+        cs = np.bincount(inverse, weights=self.columns['cs'])
+        duration = np.bincount(inverse, weights=self.columns['duration'])
+
+        takedowns = kills + assists
+        kda = np.divide(takedowns, deaths, out=takedowns.copy(), where=deaths > 0)
+        cs_per_min = np.divide(cs * 60, duration, out=np.zeros_like(cs), where=duration > 0)
+
+        return {
+            int(key): {
+                'games': int(games[i]),
+                'wins': int(wins[i]),
+                'win_rate': float(wins[i] / games[i] * 100),
+                'kda': float(kda[i]),
+                'cs_per_min': float(cs_per_min[i]),
+                'avg_duration': float(duration[i] / games[i])
+            }
+            for i, key in enumerate(keys)
+        }
+
+    def summary(self):
+        """Overall aggregates for every match in these columns, or None if empty"""
+        games = len(self)
+        if games == 0:
+            return None
+
+        deaths = int(self.columns['deaths'].sum())
+        takedowns = int(self.columns['kills'].sum()) + int(self.columns['assists'].sum())
+        duration = int(self.columns['duration'].sum())
+        wins = int(self.columns['win'].sum())
+        return {
+            'games': games,
+            'wins': wins,
+            'win_rate': wins / games * 100,
+            'kda': takedowns / deaths if deaths else takedowns,
+            'cs_per_min': int(self.columns['cs'].sum()) * 60 / duration if duration else 0,
+            'avg_duration': duration / games
+        }
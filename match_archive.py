@@ -0,0 +1,398 @@
+"""
+Local match archive
+Stores match summaries and raw match-v5 payloads in SQLite so match history
+can be filtered offline without re-pulling the Riot API
+"""
+import json
+import sqlite3
+import threading
+import zlib
+
+# Sentinel used in champion_stats for "all champions" / "all queues" rows
+ALL = -1
+
+
+class MatchArchive:
+    def __init__(self, db_file="match_archive.db"):
+        self.db_file = db_file
+        self.lock = threading.Lock()
+        # Fetches run in background threads, so the connection is shared and guarded by the lock
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.create_tables()
+        self.backfill_stats()
+
+    def create_tables(self):
+        """Create tables and indexes if they don't exist"""
+        with self.lock, self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS matches (
+                    match_id TEXT NOT NULL,
+                    puuid TEXT NOT NULL,
+                    queue_id INTEGER NOT NULL DEFAULT 0,
+                    champion_id INTEGER,
+                    champion_name TEXT,
+                    game_creation INTEGER NOT NULL DEFAULT 0,
+                    win INTEGER NOT NULL DEFAULT 0,
+                    summary TEXT NOT NULL,
+                    PRIMARY KEY (match_id, puuid)
+                );
+                CREATE INDEX IF NOT EXISTS idx_matches_puuid_creation
+                    ON matches (puuid, game_creation DESC);
+                CREATE INDEX IF NOT EXISTS idx_matches_puuid_queue
+                    ON matches (puuid, queue_id, game_creation DESC);
+                CREATE INDEX IF NOT EXISTS idx_matches_puuid_champion
+                    ON matches (puuid, champion_id, game_creation DESC);
+
+                CREATE TABLE IF NOT EXISTS match_payloads (
+                    match_id TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS champion_stats (
+                    puuid TEXT NOT NULL,
+                    champion_id INTEGER NOT NULL,
+                    queue_id INTEGER NOT NULL,
+                    champion_name TEXT,
+                    games INTEGER NOT NULL DEFAULT 0,
+                    wins INTEGER NOT NULL DEFAULT 0,
+                    kills INTEGER NOT NULL DEFAULT 0,
+                    deaths INTEGER NOT NULL DEFAULT 0,
+                    assists INTEGER NOT NULL DEFAULT 0,
+                    cs INTEGER NOT NULL DEFAULT 0,
+                    duration INTEGER NOT NULL DEFAULT 0,
+                    streak INTEGER NOT NULL DEFAULT 0,
+                    first_game_creation INTEGER NOT NULL DEFAULT 0,
+                    last_game_creation INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (puuid, champion_id, queue_id)
+                );
+
+                CREATE TABLE IF NOT EXISTS riot_ids (
+                    riot_id TEXT PRIMARY KEY COLLATE NOCASE,
+                    puuid TEXT NOT NULL,
+                    region TEXT
+                );
+            """)
+
+    def remember_puuid(self, riot_id, puuid, region=None):
+        """Store the PUUID for a Riot ID so archived matches can be found offline"""
+        if not riot_id or not puuid:
+            return
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO riot_ids (riot_id, puuid, region) VALUES (?, ?, ?)",
+                (riot_id, puuid, region)
+            )
+
+    def get_puuid(self, riot_id):
+        """Get the archived PUUID for a Riot ID, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT puuid FROM riot_ids WHERE riot_id = ?", (riot_id,)
+            ).fetchone()
+        return row['puuid'] if row else None
+
+    def add_match(self, puuid, summary, raw=None):
+        """
+        Archive a match summary (as built by MatchHistoryFetcher.fetch_match_details)
+
+        Returns:
+            bool: True if the match was new, False if it was already archived
+        """
+        with self.lock, self.conn:
+            return self._insert_match(puuid, summary, raw)
+
+    def _insert_match(self, puuid, summary, raw):
+        """Insert one match; caller holds the lock and transaction"""
+        cursor = self.conn.execute(
+            """INSERT OR IGNORE INTO matches
+               (match_id, puuid, queue_id, champion_id, champion_name, game_creation, win, summary)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                summary['match_id'],
+                puuid,
+                summary.get('queue_id') or 0,
+                summary.get('champion_id'),
+                summary.get('champion_name'),
+                summary.get('game_creation') or 0,
+                1 if summary.get('win') else 0,
+                json.dumps(summary, separators=(',', ':'))
+            )
+        )
+        inserted = cursor.rowcount > 0
+        if inserted:
+            self._update_stats(puuid, summary)
+        
+        if raw is not None:
+            payload = zlib.compress(json.dumps(raw, separators=(',', ':')).encode('utf-8'))
+            self.conn.execute(
+                "INSERT OR IGNORE INTO match_payloads (match_id, payload) VALUES (?, ?)",
+                (summary['match_id'], payload)
+            )
+        return inserted
+
+    def _update_stats(self, puuid, summary):
+        """Fold one new match into the champion/queue aggregates; caller holds the lock"""
+        champion_id = summary.get('champion_id') or 0
+        queue_id = summary.get('queue_id') or 0
+        game_creation = summary.get('game_creation') or 0
+        win = bool(summary.get('win'))
+
+        # One row per (champion, queue) plus the all-queue / all-champion rollups
+        for stats_champion, stats_queue in ((champion_id, queue_id), (champion_id, ALL),
+                                            (ALL, queue_id), (ALL, ALL)):
+            row = self.conn.execute(
+                """SELECT first_game_creation, last_game_creation FROM champion_stats
+                   WHERE puuid = ? AND champion_id = ? AND queue_id = ?""",
+                (puuid, stats_champion, stats_queue)
+            ).fetchone()
+
+            if row is None:
+                first_game, last_game = game_creation, game_creation
+            else:
+                first_game = min(row['first_game_creation'], game_creation)
+                last_game = max(row['last_game_creation'], game_creation)
+            # Matches can arrive out of order (paging, gaps between views), so the
+            # streak is recounted from the archive rather than adjusted
+            streak = self._current_streak(puuid, stats_champion, stats_queue)
+
+            self.conn.execute(
+                """INSERT INTO champion_stats
+                   (puuid, champion_id, queue_id, champion_name, games, wins, kills, deaths, assists,
+                    cs, duration, streak, first_game_creation, last_game_creation)
+                   VALUES (?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (puuid, champion_id, queue_id) DO UPDATE SET
+                       games = games + 1,
+                       wins = wins + excluded.wins,
+                       kills = kills + excluded.kills,
+                       deaths = deaths + excluded.deaths,
+                       assists = assists + excluded.assists,
+                       cs = cs + excluded.cs,
+                       duration = duration + excluded.duration,
+                       streak = excluded.streak,
+                       first_game_creation = excluded.first_game_creation,
+                       last_game_creation = excluded.last_game_creation""",
+                (
+                    puuid, stats_champion, stats_queue,
+                    summary.get('champion_name') if stats_champion != ALL else None,
+                    1 if win else 0,
+                    summary.get('kills', 0),
+                    summary.get('deaths', 0),
+                    summary.get('assists', 0),
+                    summary.get('cs', 0),
+                    summary.get('game_duration', 0),
+                    streak, first_game, last_game
+                )
+            )
+
+    def _current_streak(self, puuid, champion_id=ALL, queue_id=ALL):
+        """
+        Count the run of identical results from the newest archived match back
+        (positive for wins, negative for losses); caller holds the lock
+        """
+        clauses = ["puuid = ?"]
+        params = [puuid]
+        if champion_id == 0:
+            clauses.append("(champion_id IS NULL OR champion_id = 0)")  # Stats file unknown champions under 0
+        elif champion_id != ALL:
+            clauses.append("champion_id = ?")
+            params.append(champion_id)
+        if queue_id != ALL:
+            clauses.append("queue_id = ?")
+            params.append(queue_id)
+
+        cursor = self.conn.execute(
+            f"""SELECT win FROM matches WHERE {' AND '.join(clauses)}
+                ORDER BY game_creation DESC, match_id DESC""",
+            params
+        )
+        streak = 0
+        for (win,) in cursor:
+            if streak and (streak > 0) != bool(win):
+                break
+            streak += 1 if win else -1
+        return streak
+
+    def backfill_stats(self):
+        """Build aggregates for archives created before champion_stats existed"""
+        with self.lock, self.conn:
+            has_stats = self.conn.execute("SELECT 1 FROM champion_stats LIMIT 1").fetchone()
+            has_matches = self.conn.execute("SELECT 1 FROM matches LIMIT 1").fetchone()
+            if has_stats or not has_matches:
+                return
+            rows = self.conn.execute(
+                "SELECT puuid, summary FROM matches ORDER BY game_creation"
+            ).fetchall()
+            for row in rows:
+                self._update_stats(row['puuid'], json.loads(row['summary']))
+
+    def _stats_from_row(self, row):
+        """Turn a champion_stats row into a dict with derived averages"""
+        games = row['games']
+        minutes = row['duration'] / 60
+        return {
+            'champion_id': row['champion_id'],
+            'champion_name': row['champion_name'],
+            'queue_id': row['queue_id'],
+            'games': games,
+            'wins': row['wins'],
+            'losses': games - row['wins'],
+            'win_rate': row['wins'] / games * 100 if games else 0,
+            'kills': row['kills'] / games if games else 0,
+            'deaths': row['deaths'] / games if games else 0,
+            'assists': row['assists'] / games if games else 0,
+            'kda': (row['kills'] + row['assists']) / row['deaths'] if row['deaths'] else row['kills'] + row['assists'],
+            'cs_per_min': row['cs'] / minutes if minutes else 0,
+            'avg_duration': row['duration'] / games if games else 0,
+            'streak': row['streak'],
+            'last_game_creation': row['last_game_creation']
+        }
+
+    def get_stats(self, puuid, champion_id=ALL, queue_ids=None):
+        """Get aggregates for one champion (ALL for every champion), or None"""
+        rows = self._query_stats(puuid, "champion_id = ?", [champion_id], queue_ids)
+        return self._stats_from_row(rows[0]) if rows else None
+
+    def get_champion_stats(self, puuid, queue_ids=None):
+        """Get per-champion aggregates, most played first"""
+        rows = self._query_stats(puuid, "champion_id != ?", [ALL], queue_ids)
+        return [self._stats_from_row(row) for row in rows]
+
+    def _query_stats(self, puuid, champion_clause, champion_params, queue_ids):
+        """
+        Read champion_stats rows for a queue filter
+
+        A single queue (or None for all queues) reads the maintained rows directly.
+        Several queues are summed; the streak is reported as 0 because streaks
+        are tracked per queue and can't be combined.
+        """
+        queue_ids = list(queue_ids) if queue_ids else [ALL]
+
+        with self.lock:
+            if len(queue_ids) == 1:
+                return self.conn.execute(
+                    f"""SELECT * FROM champion_stats
+                        WHERE puuid = ? AND queue_id = ? AND {champion_clause}
+                        ORDER BY games DESC""",
+                    (puuid, queue_ids[0], *champion_params)
+                ).fetchall()
+
+            return self.conn.execute(
+                f"""SELECT champion_id, MAX(champion_name) AS champion_name, -1 AS queue_id,
+                           SUM(games) AS games, SUM(wins) AS wins, SUM(kills) AS kills,
+                           SUM(deaths) AS deaths, SUM(assists) AS assists, SUM(cs) AS cs,
+                           SUM(duration) AS duration, 0 AS streak,
+                           MAX(last_game_creation) AS last_game_creation
+                    FROM champion_stats
+                    WHERE puuid = ? AND queue_id IN ({','.join('?' * len(queue_ids))}) AND {champion_clause}
+                    GROUP BY champion_id ORDER BY games DESC""",
+                (puuid, *queue_ids, *champion_params)
+            ).fetchall()
+
+    def get_archived_ids(self, puuid, match_ids):
+        """Return the subset of match_ids already archived for this PUUID"""
+        if not match_ids:
+            return set()
+        placeholders = ",".join("?" * len(match_ids))
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT match_id FROM matches WHERE puuid = ? AND match_id IN ({placeholders})",
+                (puuid, *match_ids)
+            ).fetchall()
+        return {row['match_id'] for row in rows}
+
+    def get_match(self, match_id, puuid):
+        """Get an archived match summary, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT summary FROM matches WHERE match_id = ? AND puuid = ?",
+                (match_id, puuid)
+            ).fetchone()
+        return json.loads(row['summary']) if row else None
+
+    def get_raw_match(self, match_id):
+        """Get the raw match-v5 payload for a match, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT payload FROM match_payloads WHERE match_id = ?", (match_id,)
+            ).fetchone()
+        if not row:
+            return None
+        return json.loads(zlib.decompress(row['payload']).decode('utf-8'))
+
+    def query_matches(self, puuid, champion_id=None, queue_ids=None, since=None, until=None,
+                      limit=None, offset=0):
+        """
+        Query archived matches for a PUUID, newest first
+
+        Args:
+            champion_id: Only matches played on this champion
+            queue_ids: Iterable of queue IDs to include
+            since / until: game_creation bounds in milliseconds
+            limit / offset: Paging
+
+        Returns:
+            list: Match summaries
+        """
+        sql = "SELECT summary FROM matches WHERE puuid = ?"
+        params = [puuid]
+
+        if champion_id is not None:
+            sql += " AND champion_id = ?"
+            params.append(champion_id)
+
+        if queue_ids:
+            queue_ids = list(queue_ids)
+            sql += f" AND queue_id IN ({','.join('?' * len(queue_ids))})"
+            params.extend(queue_ids)
+
+        if since is not None:
+            sql += " AND game_creation >= ?"
+            params.append(since)
+
+        if until is not None:
+            sql += " AND game_creation < ?"
+            params.append(until)
+
+        sql += " ORDER BY game_creation DESC"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [json.loads(row['summary']) for row in rows]
+
+    def iter_summaries(self, after_rowid=0):
+        """Yield (rowid, puuid, summary) for archived matches in insertion order"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT rowid, puuid, summary FROM matches WHERE rowid > ? ORDER BY rowid",
+                (after_rowid,)
+            ).fetchall()
+        for row in rows:
+            yield row['rowid'], row['puuid'], json.loads(row['summary'])
+
+    def get_champions(self, puuid):
+        """Get (champion_id, champion_name, games) for every champion archived for a PUUID"""
+        with self.lock:
+            rows = self.conn.execute(
+                """SELECT champion_id, MAX(champion_name) AS champion_name, COUNT(*) AS games
+                   FROM matches WHERE puuid = ?
+                   GROUP BY champion_id ORDER BY champion_name""",
+                (puuid,)
+            ).fetchall()
+        return [(row['champion_id'], row['champion_name'], row['games']) for row in rows]
+
+    def count_matches(self, puuid):
+        """Number of archived matches for a PUUID"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT COUNT(*) AS total FROM matches WHERE puuid = ?", (puuid,)
+            ).fetchone()
+        return row['total']
+
+    def close(self):
+        """Close the database connection"""
+        with self.lock:
+            self.conn.close()
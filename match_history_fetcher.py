@@ -5,9 +5,10 @@ import requests
 from config import get_region
 
 class MatchHistoryFetcher:
-    def __init__(self, api_key):
+    def __init__(self, api_key, match_archive=None):
         self.api_key = api_key
         self.headers = {"X-Riot-Token": api_key}
+        self.match_archive = match_archive  # Optional MatchArchive for local storage
         
         # Region routing values
         self.region_routing = {
@@ -61,14 +62,17 @@ class MatchHistoryFetcher:
             
             if response.status_code == 200:
                 data = response.json()
-                return data.get('puuid'), None
+                puuid = data.get('puuid')
+                if self.match_archive:
+                    self.match_archive.remember_puuid(riot_id, puuid, region)
+                return puuid, None
             else:
                 return None, f"Failed to get PUUID: {response.status_code}"
         
         except Exception as e:
             return None, f"Error getting PUUID: {str(e)}"
     
-    def fetch_match_history(self, riot_id, region, count=10):
+    def fetch_match_history(self, riot_id, region, count=10, start=0, cancel_token=None):
         """
         Fetch match history for a player
         
@@ -77,39 +81,71 @@ class MatchHistoryFetcher:
             match_list: List of match data dictionaries
             error: Error message if any
         """
+        matches, _, error = self.fetch_match_page(riot_id, region, count, start, cancel_token)
+        return matches, error
+    
+    def fetch_match_page(self, riot_id, region, count=10, start=0, cancel_token=None):
+        """
+        Fetch one page of match history, for paging
+        
+        Matches whose details fail to load are left out of match_list, so the
+        next page has to start from next_start rather than after match_list.
+        
+        Args:
+            start: Index of the first match (most recent is 0)
+            cancel_token: Optional CancelToken (task_service), checked between requests
+        
+        Returns:
+            tuple: (match_list, next_start, error)
+            next_start: start plus the number of match IDs this page consumed
+        """
         try:
-            # Get PUUID first
-            puuid, error = self.get_puuid_from_riot_id(riot_id, region)
-            if error:
-                return None, error
+            # Get PUUID first (later pages reuse the one the first page archived)
+            puuid = self.match_archive.get_puuid(riot_id) if self.match_archive and start else None
+            if not puuid:
+                puuid, error = self.get_puuid_from_riot_id(riot_id, region)
+                if error:
+                    return None, start, error
             
             routing = self.get_routing_value(region)
+            if cancel_token:
+                cancel_token.check()
             
             # Get match IDs
             match_ids_url = f"https://{routing}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
-            params = {'start': 0, 'count': count}
+            params = {'start': start, 'count': count}
             
             response = requests.get(match_ids_url, headers=self.headers, params=params, timeout=10)
             
             if response.status_code != 200:
-                return None, f"Failed to fetch match IDs: {response.status_code}"
+                return None, start, f"Failed to fetch match IDs: {response.status_code}"
             
             match_ids = response.json()
             
             if not match_ids:
-                return [], None  # No matches found
+                return [], start, None  # No matches found
+            
+            # Matches already in the local archive don't need another match-v5 request
+            archived_ids = set()
+            if self.match_archive:
+                archived_ids = self.match_archive.get_archived_ids(puuid, match_ids)
             
             # Fetch details for each match
             matches = []
             for match_id in match_ids:
-                match_data = self.fetch_match_details(match_id, puuid, routing)
+                if cancel_token:
+                    cancel_token.check()
+                if match_id in archived_ids:
+                    match_data = self.match_archive.get_match(match_id, puuid)
+                else:
+                    match_data = self.fetch_match_details(match_id, puuid, routing)
                 if match_data:
                     matches.append(match_data)
             
-            return matches, None
+            return matches, start + len(match_ids), None
         
         except Exception as e:
-            return None, f"Error fetching match history: {str(e)}"
+            return None, start, f"Error fetching match history: {str(e)}"
     
     def fetch_match_details(self, match_id, puuid, routing):
         """Fetch details for a specific match"""
@@ -121,6 +157,20 @@ class MatchHistoryFetcher:
                 return None
             
             match_data = response.json()
+            match_info = self.build_match_summary(match_id, match_data, puuid)
+            
+            if match_info and self.match_archive:
+                self.match_archive.add_match(puuid, match_info, raw=match_data)
+            
+            return match_info
+        
+        except Exception as e:
+            print(f"Error fetching match details: {e}")
+            return None
+    
+    def build_match_summary(self, match_id, match_data, puuid):
+        """Build the match summary for a player from a raw match-v5 payload"""
+        try:
             info = match_data.get('info', {})
             
             # Find the player's participant data
@@ -223,5 +273,5 @@ class MatchHistoryFetcher:
             return match_info
         
         except Exception as e:
-            print(f"Error fetching match details: {e}")
+            print(f"Error building match summary: {e}")
             return None
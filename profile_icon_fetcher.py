@@ -1,23 +1,14 @@
 import requests
-import os
 from pathlib import Path
+from ddragon import get_data_dragon
+from asset_pack import get_asset_store
 
 class ProfileIconFetcher:
     def __init__(self, api_key=None):
         self.api_key = api_key
         self.cache_dir = Path("assets/profile")
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.version = self.get_latest_version()
-        self.base_url = f"https://ddragon.leagueoflegends.com/cdn/{self.version}/img/profileicon"
-    
-    def get_latest_version(self):
-        try:
-            response = requests.get("https://ddragon.leagueoflegends.com/api/versions.json", timeout=5)
-            if response.status_code == 200:
-                return response.json()[0]
-        except:
-            pass
-        return "14.23.1"
+        self.store = get_asset_store()
+        self.data_dragon = get_data_dragon()
     
     def fetch_profile_data(self, riot_id, region='euw1'):
         """Returns (icon_id, summoner_level) or (None, None)"""
@@ -90,16 +81,15 @@ class ProfileIconFetcher:
             return None
         
         icon_path = self.cache_dir / f"{icon_id}.png"
-        if icon_path.exists():
+        if self.store.exists(icon_path):
             return str(icon_path)
         
         try:
-            url = f"{self.base_url}/{icon_id}.png"
+            url = self.data_dragon.image_url("profileicon", f"{icon_id}.png", wait=5)
             response = requests.get(url, timeout=10)
             
             if response.status_code == 200:
-                with open(icon_path, 'wb') as f:
-                    f.write(response.content)
+                self.store.add(icon_path, response.content)
                 print(f"Downloaded profile icon {icon_id}")
                 return str(icon_path)
             else:
@@ -0,0 +1,198 @@
+"""
+Profiling mode
+Enabled with the RAM_PROFILE=1 environment variable or the --profile flag.
+Records import costs (like python -X importtime) and wall time per startup
+phase, and runs user actions under cProfile, dumping one .pstats file per
+action to profiles/ (readable with pstats, snakeviz or flameprof)
+"""
+import cProfile
+import os
+import re
+import sys
+import threading
+import time
+
+PROFILE_ENV = "RAM_PROFILE"
+PROFILE_FLAG = "--profile"
+PROFILE_DIR = "profiles"
+TOP_IMPORTS = 20  # Slowest imports listed in the startup report
+
+
+def is_enabled():
+    """True if profiling was requested (environment variable or CLI flag)"""
+    return os.environ.get(PROFILE_ENV, "") not in ("", "0") or PROFILE_FLAG in sys.argv
+
+
+class ImportTimer:
+    """
+    Meta path hook timing every module executed while installed
+
+    Like -X importtime, each record has the module's own time and its
+    cumulative time including the imports it triggered.
+    """
+    def __init__(self):
+        self.records = []  # (depth, name, self seconds, cumulative seconds) in completion order
+        self.stack = []  # Child time accumulated per module being imported
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path=None, target=None):
+        # Find the module with the remaining finders, then time its loader
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    def run(self, name, exec_module, module):
+        """Execute a module, recording its time"""
+        if threading.current_thread() is not threading.main_thread():
+            return exec_module(module)  # Only the main thread's import tree is recorded
+
+        self.stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return exec_module(module)
+        finally:
+            cumulative = time.perf_counter() - start
+            children = self.stack.pop()
+            if self.stack:
+                self.stack[-1] += cumulative
+            self.records.append((len(self.stack), name, cumulative - children, cumulative))
+
+    def format(self):
+        """The records in -X importtime's layout (microseconds)"""
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for depth, name, own, cumulative in self.records:
+            lines.append(f"import time: {own * 1e6:9.0f} | {cumulative * 1e6:10.0f} | {'  ' * depth}{name}")
+        return "\n".join(lines)
+
+
+class TimedLoader:
+    """Loader wrapper that reports exec_module to an ImportTimer"""
+    def __init__(self, loader, timer):
+        self.loader = loader
+        self.timer = timer
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        return self.timer.run(module.__name__, self.loader.exec_module, module)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class Profiler:
+    def __init__(self, output_dir=PROFILE_DIR):
+        self.output_dir = output_dir
+        self.import_timer = ImportTimer()
+        self.started_at = time.perf_counter()
+        self.last_mark = self.started_at
+        self.phases = []  # (name, seconds)
+        self.action_lock = threading.Lock()  # Held while an action runs under cProfile
+
+    def start(self):
+        """Start timing imports and the first startup phase"""
+        self.started_at = self.last_mark = time.perf_counter()
+        self.import_timer.install()
+
+    def mark(self, phase):
+        """End a startup phase (it started at the previous mark)"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last_mark))
+        self.last_mark = now
+
+    def report_startup(self):
+        """Print phase times and the slowest imports; write the full import log"""
+        self.import_timer.uninstall()
+        total = self.last_mark - self.started_at
+        print(f"Startup profile ({total * 1000:.0f} ms total)")
+        for phase, seconds in self.phases:
+            print(f"  {phase:<24} {seconds * 1000:8.1f} ms")
+
+        slowest = sorted(self.import_timer.records, key=lambda record: record[2], reverse=True)[:TOP_IMPORTS]
+        print(f"Slowest imports (self time, of {len(self.import_timer.records)}):")
+        for _, name, own, cumulative in slowest:
+            print(f"  {name:<40} {own * 1000:8.1f} ms  ({cumulative * 1000:.1f} ms cumulative)")
+
+        path = os.path.join(self.output_dir, "startup-imports.txt")
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            with open(path, "w") as f:
+                f.write(self.import_timer.format() + "\n")
+            print(f"Import log written to {path}")
+        except OSError as e:
+            print(f"Error writing import log: {e}")
+
+    def run_action(self, action, func, *args, **kwargs):
+        """
+        Run func under cProfile and dump the stats to profiles/<action>-<timestamp>.pstats
+
+        Only one cProfile profiler can be active at a time (enforced since
+        Python 3.12), so an action overlapping a profiled one runs unprofiled.
+        """
+        if not self.action_lock.acquire(blocking=False):
+            print(f"Not profiling {action}: another action is being profiled")
+            return func(*args, **kwargs)
+        try:
+            return self._profile_action(action, func, *args, **kwargs)
+        finally:
+            self.action_lock.release()
+
+    def _profile_action(self, action, func, *args, **kwargs):
+        """Run func under a new cProfile profiler and dump its stats"""
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            name = re.sub(r"[^\w\-]+", "_", action)
+            path = os.path.join(self.output_dir, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{threading.get_ident()}.pstats")
+            try:
+                os.makedirs(self.output_dir, exist_ok=True)
+                profiler.dump_stats(path)
+                print(f"Profiled {action}: {elapsed * 1000:.0f} ms -> {path}")
+            except OSError as e:
+                print(f"Error writing profile for {action}: {e}")
+
+
+_profiler = None
+
+
+def get_profiler():
+    """Get the shared Profiler, or None when profiling is off"""
+    global _profiler
+    if _profiler is None and is_enabled():
+        _profiler = Profiler()
+    return _profiler
+
+
+def mark(phase):
+    """End a startup phase (no-op when profiling is off)"""
+    profiler = get_profiler()
+    if profiler:
+        profiler.mark(phase)
+
+
+def profiled(action, func):
+    """Wrap func so each call is profiled as one action (returns func unchanged when profiling is off)"""
+    profiler = get_profiler()
+    if profiler is None:
+        return func
+
+    def wrapper(*args, **kwargs):
+        return profiler.run_action(action, func, *args, **kwargs)
+    return wrapper
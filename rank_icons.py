@@ -1,11 +1,16 @@
 from pathlib import Path
-from PIL import Image, ImageTk
 import tkinter as tk
+from asset_pack import get_asset_store
 
 class RankIcons:
-    def __init__(self):
+    def __init__(self, image_cache):
+        """
+        Args:
+            image_cache: Shared PhotoImage cache (gui.image_cache) the emblems are loaded through
+        """
+        self.image_cache = image_cache
         self.icons_dir = Path("assets/ranks")
-        self.icons_cache = {}
+        self.icon_paths = {}  # tier -> emblem path (images live in the shared image cache)
         self.default_size = (32, 32)
     
     def get_rank_icon(self, rank, size=None):
@@ -30,37 +35,27 @@ class RankIcons:
         if not tier:
             return None
         
-        # Check cache
-        cache_key = f"{tier}_{size[0]}x{size[1]}"
-        if cache_key in self.icons_cache:
-            return self.icons_cache[cache_key]
-        
-        # Try to load icon - check multiple naming patterns
-        possible_paths = [
-            self.icons_dir / f"{tier}.png",
-            self.icons_dir / f"Rank={tier.capitalize()}.png",
-            self.icons_dir / f"{tier.capitalize()}.png",
-        ]
-        
-        icon_path = None
-        for path in possible_paths:
-            if path.exists():
-                icon_path = path
-                break
-        
-        if not icon_path:
-            return None
-        
-        try:
-            # Load and resize image
-            img = Image.open(icon_path)
-            img = img.resize(size, Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
+        icon_path = self.icon_paths.get(tier)
+        if icon_path is None:
+            # Try to load icon - check multiple naming patterns
+            possible_paths = [
+                self.icons_dir / f"{tier}.png",
+                self.icons_dir / f"Rank={tier.capitalize()}.png",
+                self.icons_dir / f"{tier.capitalize()}.png",
+            ]
             
-            # Cache it
-            self.icons_cache[cache_key] = photo
+            for path in possible_paths:
+                if get_asset_store().exists(path):
+                    icon_path = path
+                    break
             
-            return photo
+            if not icon_path:
+                return None
+            self.icon_paths[tier] = icon_path
+        
+        try:
+            # Load from the shared cache (resized once on a miss)
+            return self.image_cache.load(icon_path, size)
         except Exception as e:
             print(f"Error loading rank icon {icon_path}: {e}")
             return None
@@ -0,0 +1,66 @@
+"""
+Rate limiter for Riot API requests
+Thread-safe sliding-window limiter shared by concurrent workers
+"""
+import threading
+import time
+from collections import deque
+
+# Default development key limits: 20 requests / 1 second, 100 requests / 2 minutes
+DEFAULT_LIMITS = [(20, 1.0), (100, 120.0)]
+
+
+class RateLimiter:
+    def __init__(self, limits=None):
+        """
+        Args:
+            limits: List of (max_requests, window_seconds) that must all hold
+        """
+        self.limits = limits or DEFAULT_LIMITS
+        self.windows = [deque() for _ in self.limits]
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent, then record it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                wait = 0
+                for (max_requests, window), sent in zip(self.limits, self.windows):
+                    while sent and now - sent[0] >= window:
+                        sent.popleft()
+                    if len(sent) >= max_requests:
+                        wait = max(wait, window - (now - sent[0]))
+
+                if wait <= 0:
+                    for sent in self.windows:
+                        sent.append(now)
+                    return
+
+            time.sleep(wait)
+
+    def update_limits(self, header_value):
+        """Adopt the limits Riot reports in X-App-Rate-Limit (e.g. "20:1,100:120")"""
+        try:
+            limits = []
+            for part in header_value.split(','):
+                max_requests, window = part.split(':')
+                limits.append((int(max_requests), float(window)))
+        except (AttributeError, ValueError):
+            return
+
+        with self.lock:
+            if limits and limits != self.limits:
+                # Carry over recent requests so switching limits can't cause a burst
+                history = max(self.windows, key=len)
+                self.limits = limits
+                self.windows = [deque(history) for _ in limits]
+
+    def penalize(self, retry_after):
+        """Hold every caller back for retry_after seconds (after a 429 response)"""
+        with self.lock:
+            until = time.monotonic() + retry_after
+            for (max_requests, window), sent in zip(self.limits, self.windows):
+                # Fill the window so the next slot opens when the server allows it
+                sent.clear()
+                sent.extend([until - window] * max_requests)
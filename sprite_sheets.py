@@ -0,0 +1,140 @@
+"""
+Sprite sheet icon source
+Downloads Data Dragon sprite sheets once per patch and slices icons locally,
+so a cold cache needs a few sheet downloads instead of one request per icon
+"""
+import io
+import os
+import threading
+import requests
+from PIL import Image
+from ddragon import DDRAGON_URL, get_data_dragon
+from asset_pack import get_asset_store
+
+# Icon kind -> data file with image.sprite/x/y/w/h metadata
+DATA_FILES = {
+    'champion': 'champion.json',
+    'item': 'item.json',
+    'spell': 'summoner.json',
+}
+
+# Sprite crops are smaller than the individual icons, so they're cached apart
+# from them (e.g. assets/champion/sprite/1.png) and never stand in for one
+SPRITE_SUBDIR = "sprite"
+
+
+def get_icon_cache_path(icon_path, use_sprites):
+    """
+    Cache path of an icon for the configured icon source
+
+    Args:
+        icon_path: Path of the full-size icon (e.g. assets/champion/1.png)
+        use_sprites: True when icons come from sprite sheets
+    """
+    if not use_sprites:
+        return str(icon_path)
+    directory, filename = os.path.split(str(icon_path))
+    return os.path.join(directory, SPRITE_SUBDIR, filename)
+
+
+class SpriteSheets:
+    def __init__(self, data_dragon=None):
+        self.data_dragon = data_dragon or get_data_dragon()
+        self.indexes = {}  # (version, kind) -> {icon id: image metadata}
+        self.sheets = {}  # (version, sprite file) -> PIL image
+        self.lock = threading.Lock()
+
+    def get_index(self, kind, version):
+        """Map icon ids to image metadata for one kind of icon"""
+        key = (version, kind)
+        if key in self.indexes:
+            return self.indexes[key]
+
+        data = self.data_dragon.get_data_file(DATA_FILES[kind], version)
+        if not data:
+            return {}
+
+        index = {}
+        for entry_key, entry in data.get('data', {}).items():
+            if 'image' not in entry:
+                continue
+            # Items are keyed by id; champions and spells carry a numeric 'key'
+            icon_id = entry_key if kind == 'item' else entry.get('key')
+            if icon_id:
+                index[str(icon_id)] = entry['image']
+
+        self.indexes[key] = index
+        return index
+
+    def get_sheet(self, sprite, version):
+        """Load a sprite sheet, downloading it on first use"""
+        key = (version, sprite)
+        with self.lock:
+            if key in self.sheets:
+                return self.sheets[key]
+
+            path = os.path.join(self.data_dragon.get_patch_dir(version), "sprite", sprite)
+            if not os.path.exists(path):
+                try:
+                    response = requests.get(f"{DDRAGON_URL}/cdn/{version}/img/sprite/{sprite}", timeout=10)
+                    if response.status_code != 200:
+                        print(f"Failed to download sprite sheet {sprite}: {response.status_code}")
+                        return None
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    temp_path = path + ".tmp"
+                    with open(temp_path, 'wb') as f:
+                        f.write(response.content)
+                    os.replace(temp_path, path)
+                except Exception as e:
+                    print(f"Error downloading sprite sheet {sprite}: {e}")
+                    return None
+
+            try:
+                sheet = Image.open(path)
+                sheet.load()
+            except Exception as e:
+                print(f"Error loading sprite sheet {sprite}: {e}")
+                return None
+
+            self.sheets[key] = sheet
+            return sheet
+
+    def extract_icon(self, kind, icon_id, icon_path):
+        """
+        Slice one icon out of its sprite sheet and store it as icon_path
+
+        Returns:
+            bool: True if the icon was stored
+        """
+        version = self.data_dragon.get_version(wait=5)
+        image = self.get_index(kind, version).get(str(icon_id))
+        if not image:
+            return False
+
+        sheet = self.get_sheet(image['sprite'], version)
+        if sheet is None:
+            return False
+
+        try:
+            x, y, w, h = image['x'], image['y'], image['w'], image['h']
+            icon = sheet.crop((x, y, x + w, y + h))
+            buffer = io.BytesIO()
+            icon.save(buffer, format="PNG")
+            get_asset_store().add(icon_path, buffer.getvalue())
+            return True
+        except Exception as e:
+            print(f"Error slicing {kind} icon {icon_id}: {e}")
+            return False
+
+
+_sprite_sheets = None
+_sprite_sheets_lock = threading.Lock()
+
+
+def get_sprite_sheets():
+    """Get the shared SpriteSheets instance"""
+    global _sprite_sheets
+    with _sprite_sheets_lock:
+        if _sprite_sheets is None:
+            _sprite_sheets = SpriteSheets()
+        return _sprite_sheets
@@ -0,0 +1,201 @@
+"""
+Static data index
+ID -> name / icon lookups for champions, summoner spells, items and runes,
+built from the Data Dragon data files and cached per patch as a pickle
+"""
+import os
+import pickle
+import threading
+from ddragon import get_data_dragon
+
+INDEX_FORMAT = 1  # Bump when the index layout changes
+
+# Data files the index is built from
+DATA_FILES = ['champion.json', 'summoner.json', 'item.json', 'runesReforged.json']
+
+
+def build_index(version, champions, spells, items, runes):
+    """
+    Compile Data Dragon data files into flat lookup dicts
+
+    Returns:
+        dict: 'champions', 'spells', 'items', 'runes' each map int id -> (name, icon key)
+    """
+    index = {
+        'format': INDEX_FORMAT,
+        'version': version,
+        'champions': {},
+        'spells': {},
+        'items': {},
+        'runes': {},
+    }
+
+    # Champions and spells are keyed by their string id; the numeric id is 'key'
+    for entry in champions.get('data', {}).values():
+        index['champions'][int(entry['key'])] = (entry['name'], entry['id'])
+
+    for entry in spells.get('data', {}).values():
+        if str(entry.get('key', '')).isdigit():
+            index['spells'][int(entry['key'])] = (entry['name'], entry['id'])
+
+    for item_id, entry in items.get('data', {}).items():
+        index['items'][int(item_id)] = (entry.get('name', ''), entry.get('image', {}).get('full'))
+
+    # Rune trees and the runes in their slots share one id space
+    for style in runes:
+        index['runes'][style['id']] = (style['name'], style.get('icon'))
+        for slot in style.get('slots', []):
+            for rune in slot.get('runes', []):
+                index['runes'][rune['id']] = (rune['name'], rune.get('icon'))
+
+    return index
+
+
+class StaticData:
+    def __init__(self, data_dragon=None):
+        self.data_dragon = data_dragon or get_data_dragon()
+        self.cache_file = os.path.join(self.data_dragon.cache_dir, "static_data.pickle")
+        self.index = None
+        self.lock = threading.Lock()
+        self.building = False
+        self.failed_version = None  # Don't retry downloads for every lookup while offline
+
+    def get_index(self):
+        """
+        Get the index for the current patch, loading it on first use
+
+        The main thread never downloads: if the data files for a new patch
+        aren't on disk yet, the previous index (if any) is used while the new
+        one is built in the background.
+        """
+        version = self.data_dragon.get_version()
+        if self.index and self.index['version'] == version:
+            return self.index
+
+        with self.lock:
+            if self.index is None:
+                self.index = self._load_cached_index()
+            if self.index and self.index['version'] == version:
+                return self.index
+            if self.building or self.failed_version == version:
+                return self.index
+
+        if threading.current_thread() is threading.main_thread():
+            if self.build(version, download=False) is None:
+                self.build_async(version)
+        elif self.build(version) is None:
+            self.failed_version = version
+        return self.index
+
+    def _load_cached_index(self):
+        """Load the pickled index from disk"""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                index = pickle.load(f)
+            if index.get('format') == INDEX_FORMAT:
+                return index
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            pass
+        return None
+
+    def build(self, version, download=True):
+        """Build and cache the index for a patch; returns None if data files are missing"""
+        data = []
+        for filename in DATA_FILES:
+            file_data = self.data_dragon.get_data_file(filename, version, download=download)
+            if file_data is None:
+                return None
+            data.append(file_data)
+
+        try:
+            index = build_index(version, *data)
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"Error building static data index: {e}")
+            return None
+
+        try:
+            temp_file = self.cache_file + ".tmp"
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(temp_file, 'wb') as f:
+                pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            print(f"Error saving static data index: {e}")
+
+        self.index = index
+        return index
+
+    def build_async(self, version):
+        """Build the index for a patch in a background thread"""
+        with self.lock:
+            if self.building:
+                return
+            self.building = True
+
+        def build_in_thread():
+            try:
+                if self.build(version) is None:
+                    self.failed_version = version
+            finally:
+                with self.lock:
+                    self.building = False
+
+        thread = threading.Thread(target=build_in_thread, daemon=True)
+        thread.start()
+
+    def _lookup(self, table, item_id):
+        index = self.get_index()
+        if not index:
+            return None
+        try:
+            return index[table].get(int(item_id))
+        except (TypeError, ValueError):
+            return None
+
+    def champion_name(self, champion_id):
+        """Display name, e.g. 62 -> 'Wukong'"""
+        entry = self._lookup('champions', champion_id)
+        return entry[0] if entry else None
+
+    def champion_icon_key(self, champion_id):
+        """Data Dragon id used in icon file names, e.g. 62 -> 'MonkeyKing'"""
+        entry = self._lookup('champions', champion_id)
+        return entry[1] if entry else None
+
+    def spell_name(self, spell_id):
+        """Summoner spell name, e.g. 4 -> 'Flash'"""
+        entry = self._lookup('spells', spell_id)
+        return entry[0] if entry else None
+
+    def spell_icon_key(self, spell_id):
+        """Data Dragon id used in icon file names, e.g. 4 -> 'SummonerFlash'"""
+        entry = self._lookup('spells', spell_id)
+        return entry[1] if entry else None
+
+    def item_name(self, item_id):
+        """Item name"""
+        entry = self._lookup('items', item_id)
+        return entry[0] if entry else None
+
+    def rune_name(self, rune_id):
+        """Rune or rune tree name"""
+        entry = self._lookup('runes', rune_id)
+        return entry[0] if entry else None
+
+    def rune_icon(self, rune_id):
+        """Rune icon path relative to the Data Dragon img/ directory"""
+        entry = self._lookup('runes', rune_id)
+        return entry[1] if entry else None
+
+
+_static_data = None
+_static_data_lock = threading.Lock()
+
+
+def get_static_data():
+    """Get the shared StaticData instance"""
+    global _static_data
+    with _static_data_lock:
+        if _static_data is None:
+            _static_data = StaticData()
+        return _static_data
@@ -0,0 +1,175 @@
+"""
+Task service
+Runs background work on bounded worker pools instead of a new thread per
+button press. Tasks can carry a key so a newer request supersedes (cancels)
+an older one, workers get a cancellation token to check between requests,
+and completion callbacks are delivered through a dispatcher (the UI
+dispatcher in the app) only if the task is still current.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Worker pool sizes: Riot API fetches, and slower housekeeping (status, update checks)
+POOLS = {
+    "network": 4,
+    "background": 2,
+}
+
+
+class TaskCancelled(BaseException):
+    """
+    Raised by CancelToken.check() in a cancelled task
+
+    A BaseException (like asyncio.CancelledError) so the fetchers' broad
+    except Exception handlers don't turn it into an error result.
+    """
+
+
+class CancelToken:
+    def __init__(self):
+        self.event = threading.Event()
+
+    def cancel(self):
+        self.event.set()
+
+    @property
+    def cancelled(self):
+        return self.event.is_set()
+
+    def check(self):
+        """Raise TaskCancelled if the task was cancelled (call between requests)"""
+        if self.event.is_set():
+            raise TaskCancelled()
+
+
+class Task:
+    def __init__(self, key, token):
+        self.key = key
+        self.token = token
+        self.future = None  # concurrent.futures.Future of the worker call
+
+    def cancel(self):
+        """Cancel the task: it won't start if still queued, and its callbacks won't run"""
+        self.token.cancel()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def cancelled(self):
+        return self.token.cancelled
+
+    def done(self):
+        return self.future is not None and self.future.done()
+
+
+class TaskService:
+    def __init__(self, dispatch=None, pools=None):
+        """
+        Args:
+            dispatch: Callable(callback, *args) that runs callbacks on the UI
+                thread (e.g. UIDispatcher.post); without one they run on the worker
+            pools: Pool name -> worker count (defaults to POOLS)
+        """
+        self.dispatch = dispatch or (lambda callback, *args: callback(*args))
+        self.executors = {name: ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"task-{name}")
+                          for name, workers in (pools or POOLS).items()}
+        self.current = {}  # key -> latest Task with that key
+        self.active = set()  # Tasks queued or running
+        self.lock = threading.Lock()
+
+    def submit(self, func, *args, key=None, pool="network", on_done=None, on_error=None):
+        """
+        Run func(token, *args) on a worker pool
+
+        Args:
+            func: Worker function; gets the task's CancelToken first
+            key: Optional hashable; submitting another task with the same key
+                cancels this one, so only the newest result is delivered
+            pool: Worker pool name (see POOLS)
+            on_done: Called with func's result through the dispatcher, unless cancelled
+            on_error: Called with an unexpected exception through the dispatcher
+
+        Returns:
+            Task: Handle for cancelling the task
+        """
+        task = Task(key, CancelToken())
+        previous = None
+        with self.lock:
+            self.active.add(task)
+            if key is not None:
+                previous = self.current.get(key)
+                self.current[key] = task
+        if previous is not None:
+            previous.cancel()
+
+        task.future = self.executors[pool].submit(self._run, task, func, args, on_done, on_error)
+        task.future.add_done_callback(lambda future: self._forget(task))
+        return task
+
+    def cancel(self, key):
+        """Cancel the current task with a key, if any"""
+        with self.lock:
+            task = self.current.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    def shutdown(self):
+        """
+        Cancel every task and stop accepting work
+
+        Queued tasks never start and running ones stop at their next token
+        check, so the pools' worker threads (joined at interpreter exit) end
+        promptly instead of keeping a closed app alive.
+        """
+        with self.lock:
+            tasks = list(self.active)
+            self.active.clear()
+            self.current.clear()
+        for task in tasks:
+            task.cancel()
+        for executor in self.executors.values():
+            executor.shutdown(wait=False)
+
+    def _forget(self, task):
+        """Drop a finished (or cancelled before starting) task from the active set"""
+        with self.lock:
+            self.active.discard(task)
+
+    def _run(self, task, func, args, on_done, on_error):
+        """Worker side: run the task and hand its outcome to the dispatcher"""
+        if task.cancelled:
+            return None
+        try:
+            result = func(task.token, *args)
+        except TaskCancelled:
+            return None
+        except Exception as e:
+            print(f"Error in background task {getattr(func, '__name__', func)}: {e}")
+            if on_error:
+                self.dispatch(self._deliver, task, on_error, e)
+            return None
+
+        if on_done:
+            self.dispatch(self._deliver, task, on_done, result)
+        return result
+
+    def _deliver(self, task, callback, value):
+        """Dispatcher side: run a callback unless the task was cancelled or superseded meanwhile"""
+        if task.cancelled:
+            return
+        if task.key is not None:
+            with self.lock:
+                if self.current.get(task.key) is task:
+                    del self.current[task.key]
+        callback(value)
+
+
+_task_service = None
+
+
+def get_task_service(dispatch=None):
+    """Get the shared TaskService (the first call creates it with its dispatch)"""
+    global _task_service
+    if _task_service is None:
+        _task_service = TaskService(dispatch)
+    return _task_service
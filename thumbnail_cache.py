@@ -0,0 +1,102 @@
+"""
+Thumbnail cache
+Stores each (source image, size) variant once so icons are decoded at
+display size instead of being resampled on every load. Variants live in
+their own asset pack instead of hundreds of small files.
+"""
+import io
+import threading
+from PIL import Image
+from asset_pack import AssetPack, get_asset_store
+
+# Fast zlib level: thumbnails are small and decode speed matters more than size
+PNG_COMPRESS_LEVEL = 1
+
+
+class ThumbnailCache:
+    def __init__(self, pack_path="assets/thumbnails.pack", store=None):
+        self.store = store or get_asset_store()
+        self.pack = AssetPack(pack_path, writable=True)
+
+        # Regenerated variants leave their old records behind
+        if self.pack.dead_bytes > max(self.pack.end // 2, 1_000_000):
+            self.pack.compact()
+
+    def get_thumbnail_key(self, source, size):
+        """Pack entry name of the cached variant for a source image and size"""
+        return f"{self.store.name_for(source)}@{size[0]}x{size[1]}"
+
+    def get_data(self, source, size):
+        """
+        Get the PNG bytes of a resized variant, creating it if needed
+
+        Each variant records the source's version token, so replacing the
+        source (e.g. a new patch's icon) regenerates it.
+
+        Returns:
+            bytes or None if the source can't be read
+        """
+        version = self.store.get_version(source)
+        if version is None:
+            return None
+        version = version.encode('ascii')
+
+        key = self.get_thumbnail_key(source, size)
+        data = self.pack.read(key)
+        if data is not None:
+            stored_version, _, png = data.partition(b"\0")
+            if stored_version == version:
+                return png
+
+        img = self.store.open_image(source)
+        if img is None:
+            return None
+
+        try:
+            thumbnail = img.convert("RGBA").resize(size, Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            thumbnail.save(buffer, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+            png = buffer.getvalue()
+            self.pack.add(key, version + b"\0" + png)
+            return png
+        except Exception as e:
+            print(f"Error creating thumbnail for {source}: {e}")
+            return None
+
+    def open(self, source, size):
+        """
+        Open a source image at the given size
+
+        Returns:
+            PIL.Image or None
+        """
+        png = self.get_data(source, size)
+        if png is None:
+            return None
+
+        try:
+            img = Image.open(io.BytesIO(png))
+            img.load()
+            return img
+        except Exception as e:
+            print(f"Error loading thumbnail for {source}: {e}")
+            return None
+
+    def clear(self):
+        """Delete every cached variant"""
+        for name in self.pack.names():
+            self.pack.remove(name)
+        self.pack.compact()
+
+
+_thumbnail_cache = None
+_thumbnail_cache_lock = threading.Lock()
+
+
+def get_thumbnail_cache():
+    """Get the shared ThumbnailCache instance"""
+    global _thumbnail_cache
+    with _thumbnail_cache_lock:
+        if _thumbnail_cache is None:
+            _thumbnail_cache = ThumbnailCache()
+        return _thumbnail_cache